@@ -1,16 +1,38 @@
 #!/usr/bin/env python3
-from flask import Flask, jsonify, request, Blueprint, g, session
+from flask import Flask, Response, jsonify, request, Blueprint, g, session
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+
+try:
+    from flask_compress import Compress
+
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
 import os
+import queue
 import sqlite3
+import threading
 import time
+import uuid
 import re
 import random
 import datetime
 import secrets
 import json
+import logging
+import orjson
 import hashlib
 import hmac
+import itertools
+import mmap
+import base64
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import shutil
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
 from auth import (
     require_role,
     require_authentication,
@@ -28,12 +50,59 @@ from email_service import (
     send_password_reset_email,
     send_password_reset_confirmation_email,
 )
+from services.feed_health_monitor import FeedHealthMonitor
 from services.ingestion import FeedIngestionService
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse
 from werkzeug.utils import secure_filename
 
+logger = logging.getLogger(__name__)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes ``jsonify`` responses with orjson.
+
+    Datetimes and any types orjson does not support natively are handed to
+    Flask's default hook, so the wire format matches the stdlib provider.
+    Keys are left in insertion order and output stays compact even in debug
+    mode; these replace the JSON_SORT_KEYS and JSONIFY_PRETTYPRINT_REGULAR
+    settings Flask no longer reads.
+    """
+
+    sort_keys = False
+    compact = True
+
+    def dumpb(self, obj, **kwargs):
+        """Serialize ``obj`` to UTF-8 bytes, skipping the str round trip."""
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get("newline"):
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self.dumpb(obj, **kwargs).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build ``jsonify`` responses directly from orjson's bytes."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self.dumpb(obj, indent=indent, newline=True), mimetype=self.mimetype
+        )
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Configure Flask session
 app.config["SECRET_KEY"] = os.environ.get("FLASK_SECRET_KEY", secrets.token_hex(32))
@@ -55,9 +124,30 @@ CORS(
     },
 )
 
+# Compress JSON responses (IOC lists, stats, fallback data) when the client
+# accepts it; responses under COMPRESS_MIN_SIZE bytes go out as they are
+if COMPRESS_AVAILABLE:
+    app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+    app.config["COMPRESS_MIN_SIZE"] = 512
+    Compress(app)
+
 # Define global IOCS list to store IOC data
 IOCS = []
 
+# Lowercased IOC value -> IOC, kept in step with IOCS by _set_iocs() so the
+# in-memory lookup fallback doesn't scan the list
+_IOC_INDEX = {}
+
+
+def _set_iocs(iocs):
+    """Replace the in-memory IOC list and rebuild its value index."""
+    IOCS[:] = iocs
+    _IOC_INDEX.clear()
+    # Walk backwards so the first IOC with a given value wins, as a scan would
+    for ioc in reversed(IOCS):
+        _IOC_INDEX[str(ioc.get("value", "")).lower()] = ioc
+
+
 # Define global ALERTS list to store Alert data
 ALERTS = []
 
@@ -65,56 +155,120 @@ ALERTS = []
 ioc_bp = Blueprint("ioc", __name__)
 
 
+# IOC type patterns, compiled once; infer_ioc_type only runs each one on
+# values that pass a cheap string check for that type first
+IOC_HASH_PATTERN = re.compile(r"^[a-fA-F0-9]{32,64}$")
+IOC_DOMAIN_PATTERN = re.compile(
+    r"^[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?"
+    r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)+$"
+)
+IOC_IP_PATTERN = re.compile(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
+IOC_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+
 def infer_ioc_type(ioc_value):
     """Infer the IOC type based on pattern."""
     if not isinstance(ioc_value, str):
         return "unknown"
 
-    if re.match(r"^https?://", ioc_value):
+    # IPv4 addresses are checked before domains, whose pattern accepts
+    # all-numeric labels and would otherwise claim them
+    if ioc_value.startswith(("http://", "https://")):
         return "url"
-    elif re.match(r"^[a-fA-F0-9]{32,64}$", ioc_value):
+    elif 32 <= len(ioc_value) <= 64 and IOC_HASH_PATTERN.match(ioc_value):
         return "hash"
-    elif re.match(
-        r"^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?"
-        r"(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)+$",
-        ioc_value,
-    ):
-        return "domain"
-    elif re.match(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$", ioc_value):
+    elif ioc_value.count(".") == 3 and IOC_IP_PATTERN.match(ioc_value):
         return "ip"
-    elif re.match(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", ioc_value):
-        return "email"
+    elif "@" in ioc_value:
+        return "email" if IOC_EMAIL_PATTERN.match(ioc_value) else "unknown"
+    elif "." in ioc_value and IOC_DOMAIN_PATTERN.match(ioc_value):
+        return "domain"
     else:
         return "unknown"
 
 
+# The IOC database defaults to the one beside this file and can be moved with
+# SENTINELFORGE_DB_PATH, the variable the feed scheduler reads. It is checked
+# once at startup rather than on every connection.
+IOC_DB_PATH = os.environ.get(
+    "SENTINELFORGE_DB_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "ioc_store.db"),
+)
+if not os.path.exists(IOC_DB_PATH):
+    print(f"Warning: IOC database not found at {IOC_DB_PATH}")
+
+
+def dict_factory(cursor, row):
+    """Row factory returning dicts, with a "value" alias for ioc_value.
+
+    Handlers index rows by column name and call dict methods on them, which
+    sqlite3.Row doesn't support, so rows stay plain dicts built by one zip.
+    """
+    d = dict(zip([col[0] for col in cursor.description], row))
+    if "ioc_value" in d:
+        d["value"] = d["ioc_value"]
+    return d
+
+
 def get_db_connection():
     """Get a database connection with proper row factory."""
-    db_path = "/Users/Collins/sentinelforge/ioc_store.db"
-    print(f"Database path: {db_path}")
-    print(f"Database exists: {os.path.exists(db_path)}")
-
     try:
-        conn = sqlite3.connect(db_path)
-
-        # Custom row factory to avoid tuple index errors
-        def dict_factory(cursor, row):
-            d = {}
-            for idx, col in enumerate(cursor.description):
-                if col[0]:  # Ensure column name exists
-                    d[col[0]] = row[idx]
-                    # For the 'ioc_value' field, also create a 'value' alias
-                    if col[0] == "ioc_value":
-                        d["value"] = row[idx]
-            return d
+        # Room for every fixed-shape statement the handlers build, so pooled
+        # connections never evict and re-prepare them
+        conn = sqlite3.connect(IOC_DB_PATH, cached_statements=256)
+
+        # journal_mode=WAL persists in the database file once a pooled
+        # connection sets it; synchronous does not, and under WAL the
+        # NORMAL level skips the fsync on every commit these one-shot
+        # connections make
+        conn.execute("PRAGMA synchronous=NORMAL")
 
         conn.row_factory = dict_factory
         return conn
     except Exception as e:
-        print(f"Database connection error: {e}")
+        logger.warning("Database connection error: %s", e)
         return None
 
 
+# Connections kept open per worker thread and reused across requests. The
+# PRAGMAs are applied once, when a thread first opens its connection.
+_thread_db = threading.local()
+REQUEST_DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+
+def get_request_db():
+    """Get the connection bound to the current request.
+
+    The connection is borrowed from the current thread's pool slot so that
+    SQLite's statement cache survives between requests; it is not closed by
+    handlers and any uncommitted work is rolled back on teardown.
+    """
+    if "db" not in g:
+        conn = getattr(_thread_db, "conn", None)
+        if conn is None:
+            conn = get_db_connection()
+            if conn is not None:
+                for pragma in REQUEST_DB_PRAGMAS:
+                    conn.execute(pragma)
+            _thread_db.conn = conn
+        g.db = conn
+    return g.db
+
+
+@app.teardown_request
+def release_request_db(exc=None):
+    """Return the request connection to the thread pool in a clean state."""
+    conn = g.pop("db", None)
+    if conn is not None and conn.in_transaction:
+        conn.rollback()
+
+
 # ===== API KEY UTILITY FUNCTIONS =====
 
 
@@ -213,7 +367,7 @@ def validate_api_key_from_header():
             "role": key_record["role"],
             "api_key_id": key_record["id"],
             "api_key_name": key_record["name"],
-            "access_scope": json.loads(key_record["access_scope"])
+            "access_scope": orjson.loads(key_record["access_scope"])
             if key_record["access_scope"]
             else ["read"],
         }
@@ -246,171 +400,205 @@ def require_api_key_auth(f):
     return decorated_function
 
 
-@ioc_bp.route("/api/stats")
-def get_stats():
-    """Get statistics about IOCs."""
-    try:
-        # Try accessing the database
-        conn = get_db_connection()
-        if conn:
-            cursor = conn.cursor()
+# /api/stats and /api/ioc/summary aggregate the whole iocs table, which only
+# changes at ingest cadence, so their serialized bodies are reused for a short
+# while and dropped by the endpoints that write IOCs. The lock makes concurrent
+# misses wait for one refresh instead of each rescanning the table.
+STATS_CACHE_TTL = 60
+_stats_cache = {}  # route -> (monotonic time, body)
+_stats_lock = threading.Lock()
 
-            # Total IOCs
-            cursor.execute("SELECT COUNT(*) as count FROM iocs")
-            result = cursor.fetchone()
-            total_iocs = result["count"] if result and "count" in result else 0
 
-            # High risk IOCs (score > 7.5)
-            cursor.execute("SELECT COUNT(*) as count FROM iocs WHERE score > 7.5")
-            result = cursor.fetchone()
-            high_risk = result["count"] if result and "count" in result else 0
+def invalidate_stats_cache():
+    """Drop the cached aggregate bodies so the next requests recompute them."""
+    with _stats_lock:
+        _stats_cache.clear()
 
-            # New IOCs (last 7 days)
-            one_week_ago = time.time() - (7 * 24 * 60 * 60)
-            cursor.execute(
-                "SELECT COUNT(*) as count FROM iocs WHERE first_seen_timestamp > ?",
-                (one_week_ago,),
-            )
-            result = cursor.fetchone()
-            new_iocs = result["count"] if result and "count" in result else 0
 
-            # Avg score
-            cursor.execute("SELECT AVG(score) as avg_score FROM iocs")
-            result = cursor.fetchone()
-            avg_score = result["avg_score"] if result and "avg_score" in result else 0
+def cached_stats_response(key, compute):
+    """Serve the cached aggregate body for ``key``, refreshing it when stale.
 
-            # Type distribution
-            cursor.execute(
-                "SELECT ioc_type, COUNT(*) as count FROM iocs GROUP BY ioc_type"
-            )
-            type_dist = {}
-            for row in cursor.fetchall():
-                if "ioc_type" in row and "count" in row:
-                    type_dist[row["ioc_type"]] = row["count"]
+    ``compute`` returns the response data, or None when the database can't be
+    read, in which case nothing is cached and None is returned so the caller
+    can serve its fallback.
+    """
+    with _stats_lock:
+        now = time.monotonic()
+        cached = _stats_cache.get(key)
+        if cached is None or now - cached[0] >= STATS_CACHE_TTL:
+            data = compute()
+            if data is None:
+                return None
+            cached = _stats_cache[key] = (time.monotonic(), app.json.dumpb(data))
+            now = cached[0]
+
+    response = app.response_class(cached[1], mimetype="application/json")
+    response.headers["Age"] = str(int(now - cached[0]))
+    return response
+
+
+# IOCs first seen within this many seconds count as new in /api/stats
+NEW_IOC_WINDOW_SECONDS = 7 * 24 * 60 * 60
+
+# Every /api/stats figure comes out of one scan of iocs: per-type partial
+# aggregates that _query_ioc_stats sums up. Scores that are NULL or <= 5 fall
+# into the low category, matching the dashboard's category buckets.
+SQL_IOC_STATS = """
+    SELECT
+        ioc_type,
+        COUNT(*),
+        COALESCE(SUM(score > 7.5), 0),
+        COALESCE(SUM(score > 5 AND score <= 7.5), 0),
+        COALESCE(SUM(first_seen_timestamp > ?), 0),
+        SUM(score),
+        COUNT(score)
+    FROM iocs
+    GROUP BY ioc_type
+"""
+
+
+def _query_ioc_stats():
+    """Aggregate IOC statistics from the database, or None if it's unavailable."""
+    try:
+        # Try accessing the database
+        conn = get_request_db()
+        if conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
 
-            # Category distribution
-            cursor.execute("""
-                SELECT
-                    CASE
-                        WHEN score > 7.5 THEN 'high'
-                        WHEN score > 5 THEN 'medium'
-                        ELSE 'low'
-                    END as category,
-                    COUNT(*) as count
-                FROM iocs
-                GROUP BY category
-            """)
-            category_dist = {}
-            for row in cursor.fetchall():
-                if "category" in row and "count" in row:
-                    category_dist[row["category"]] = row["count"]
+            cursor.execute(SQL_IOC_STATS, (time.time() - NEW_IOC_WINDOW_SECONDS,))
+            rows = cursor.fetchall()
 
-            conn.close()
+            type_dist = {}
+            total_iocs = high_risk = medium_risk = new_iocs = scored = 0
+            score_sum = 0.0
+            for ioc_type, count, high, medium, new, type_score_sum, type_scored in rows:
+                type_dist[ioc_type] = count
+                total_iocs += count
+                high_risk += high
+                medium_risk += medium
+                new_iocs += new
+                score_sum += type_score_sum or 0
+                scored += type_scored
+            avg_score = score_sum / scored if scored else None
+
+            # Only categories that have IOCs are reported
+            category_dist = {
+                category: count
+                for category, count in (
+                    ("high", high_risk),
+                    ("medium", medium_risk),
+                    ("low", total_iocs - high_risk - medium_risk),
+                )
+                if count
+            }
 
-            return jsonify(
-                {
-                    "total_iocs": total_iocs,
-                    "high_risk_iocs": high_risk,
-                    "new_iocs": new_iocs,
-                    "avg_score": avg_score,
-                    "type_distribution": type_dist,
-                    "category_distribution": category_dist,
-                }
-            )
+            return {
+                "total_iocs": total_iocs,
+                "high_risk_iocs": high_risk,
+                "new_iocs": new_iocs,
+                "avg_score": avg_score,
+                "type_distribution": type_dist,
+                "category_distribution": category_dist,
+            }
     except Exception as e:
         print(f"Error getting stats: {e}")
+    return None
 
-    # Return fallback stats if database access fails
-    print("Returning fallback stats")
-    return jsonify(
-        {
-            "total_iocs": 1968,
-            "high_risk_iocs": 124,
-            "new_iocs": 47,
-            "avg_score": 7.4,
-            "type_distribution": {"ip": 843, "domain": 562, "url": 425, "hash": 138},
-            "category_distribution": {"high": 124, "medium": 764, "low": 1080},
-        }
-    )
 
+# Served by /api/stats when the IOC database can't be read
+_FALLBACK_STATS_JSON = app.json.dumpb(
+    {
+        "total_iocs": 1968,
+        "high_risk_iocs": 124,
+        "new_iocs": 47,
+        "avg_score": 7.4,
+        "type_distribution": {
+            "ip": 843,
+            "domain": 562,
+            "url": 425,
+            "hash": 138,
+        },
+        "category_distribution": {
+            "high": 124,
+            "medium": 764,
+            "low": 1080,
+        },
+    }
+)
 
-@ioc_bp.route("/api/iocs")
-def get_iocs():
-    """Get a list of IOCs."""
-    # Parse query parameters
-    limit = request.args.get("limit", 10, type=int)
-    offset = request.args.get("offset", 0, type=int)
-    min_score = request.args.get("min_score", 0, type=float)
-    max_score = request.args.get("max_score", 10, type=float)
-    ioc_type = request.args.get("ioc_type", None)
-    search = request.args.get("search", None)
 
-    try:
-        # Try accessing the database
-        conn = get_db_connection()
-        if conn:
-            cursor = conn.cursor()
+@ioc_bp.route("/api/stats")
+def get_stats():
+    """Get statistics about IOCs."""
+    response = cached_stats_response("stats", _query_ioc_stats)
+    if response is None:
+        # Return fallback stats if database access fails
+        print("Returning fallback stats")
+        return app.response_class(_FALLBACK_STATS_JSON, mimetype="application/json")
+    return response
 
-            # Build query with parameters
-            query = "SELECT * FROM iocs WHERE score BETWEEN ? AND ?"
-            params = [min_score, max_score]
 
-            if ioc_type:
-                query += " AND ioc_type = ?"
-                params.append(ioc_type)
+# Substring searches go through the trigram index on (ioc_value, tags) that
+# migrate_ioc_enhancements.py creates, when the database has it; trigrams
+# need at least three characters, so shorter terms keep the LIKE scan
+IOC_SEARCH_INDEX_MIN_LENGTH = 3
 
-            if search:
-                query += " AND (ioc_value LIKE ? OR tags LIKE ?)"
-                search_param = f"%{search}%"
-                params.extend([search_param, search_param])
 
-            # Add ordering and pagination
-            query += " ORDER BY score DESC LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
+def has_ioc_search_index(conn):
+    """Whether the database behind ``conn`` has the iocs_fts search index.
 
-            # Execute query and fetch results
-            cursor.execute(query, params)
-            iocs = []
-            for row in cursor.fetchall():
-                ioc = dict(row)
+    The answer is kept next to the thread's pooled connection, so the
+    schema is only looked up once per connection.
+    """
+    cached = getattr(_thread_db, "ioc_search_index", None)
+    if cached is None or cached[0] is not conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'iocs_fts'")
+        cached = (conn, cursor.fetchone() is not None)
+        cursor.close()
+        _thread_db.ioc_search_index = cached
+    return cached[1]
 
-                # Add ML fields
-                ioc["threat_class"] = get_ml_threat_class(
-                    ioc.get("ioc_value", ""), ioc.get("ioc_type", "unknown")
-                )
-                ioc["malicious_probability"] = get_ml_probability(ioc.get("score", 0))
-                ioc["feature_importance"] = get_feature_importance(
-                    ioc.get("ioc_type", "unknown")
-                )
-                ioc["similar_known_threats"] = get_similar_threats(
-                    ioc.get("ioc_type", "unknown")
-                )
-                ioc["attack_techniques"] = get_attack_techniques(
-                    ioc.get("ioc_type", "unknown")
-                )
 
-                iocs.append(ioc)
+def ioc_search_match(search):
+    """Quote a search term as one FTS5 phrase, so it matches as a substring."""
+    return '"' + search.replace('"', '""') + '"'
 
-            # Get total count for pagination
-            cursor.execute(
-                "SELECT COUNT(*) as count FROM iocs WHERE score BETWEEN ? AND ?",
-                [min_score, max_score],
-            )
-            result = cursor.fetchone()
-            total = result.get("count", 0) if result else 0
 
-            conn.close()
+@lru_cache(maxsize=None)
+def _iocs_sql(by_type, by_search, count_only=False, search_index=False):
+    """Build the /api/iocs query for one combination of optional filters.
 
-            # Update the global IOCS list with the fetched data
-            IOCS.clear()
-            IOCS.extend(iocs)
+    Pages carry the filtered total in a window count column, so one scan
+    serves both the rows and the pagination total; the count-only form is
+    for pages past the end, which return no row to read the total from.
+    With ``search_index`` the search term is matched through iocs_fts and
+    takes one parameter instead of two LIKE patterns.
+    """
+    where = "score BETWEEN ? AND ?"
+    if by_type:
+        where += " AND ioc_type = ?"
+    if by_search and search_index:
+        where += " AND rowid IN (SELECT rowid FROM iocs_fts WHERE iocs_fts MATCH ?)"
+    elif by_search:
+        where += " AND (ioc_value LIKE ? OR tags LIKE ?)"
+    if count_only:
+        return f"SELECT COUNT(*) as count FROM iocs WHERE {where}"
+    return (
+        f"SELECT *, COUNT(*) OVER () as total_count FROM iocs WHERE {where}"
+        " ORDER BY score DESC LIMIT ? OFFSET ?"
+    )
 
-            return jsonify({"iocs": iocs, "total": total})
-    except Exception as e:
-        print(f"Database connection error: {e}")
 
-    # Return fallback IOC list if database access fails
-    print("Returning fallback IOCs")
+@lru_cache(maxsize=None)
+def _fallback_iocs():
+    """Build the fallback IOC list and its JSON body once, on first use.
+
+    Served by /api/iocs when the IOC database can't be read; the ML fields
+    come from the helpers below, so this can't run at import time.
+    """
     fallback_iocs = [
         # DOMAINS
         {
@@ -610,11 +798,106 @@ def get_iocs():
         ioc["similar_known_threats"] = get_similar_threats(ioc_type)
         ioc["attack_techniques"] = get_attack_techniques(ioc_type)
 
+    return fallback_iocs, app.json.dumpb(
+        {"iocs": fallback_iocs, "total": len(fallback_iocs)}
+    )
+
+
+@ioc_bp.route("/api/iocs")
+def get_iocs():
+    """Get a list of IOCs."""
+    # Parse query parameters
+    limit = request.args.get("limit", 10, type=int)
+    offset = request.args.get("offset", 0, type=int)
+    min_score = request.args.get("min_score", 0, type=float)
+    max_score = request.args.get("max_score", 10, type=float)
+    ioc_type = request.args.get("ioc_type", None)
+    search = request.args.get("search", None)
+
+    try:
+        # Try accessing the database
+        conn = get_request_db()
+        if conn:
+            cursor = conn.cursor()
+
+            # One cached statement per filter shape; its filter parameters
+            # are built as one tuple in the same order
+            search_index = bool(
+                search
+                and len(search) >= IOC_SEARCH_INDEX_MIN_LENGTH
+                and has_ioc_search_index(conn)
+            )
+            shape = (bool(ioc_type), bool(search))
+            params = (min_score, max_score)
+            if ioc_type:
+                params += (ioc_type,)
+            if search_index:
+                params += (ioc_search_match(search),)
+            elif search:
+                params += (f"%{search}%",) * 2
+
+            # Execute query and fetch results as plain tuples zipped with the
+            # column names once, adding the "value" alias the UI reads;
+            # total_count is the last column and zip drops it
+            cursor.row_factory = None
+            cursor.execute(
+                _iocs_sql(*shape, search_index=search_index), params + (limit, offset)
+            )
+            cols = [d[0] for d in cursor.description][:-1]
+            first = cursor.fetchone()
+
+            # Get total count for pagination when the page came back empty
+            if first is None:
+                total = 0
+                if offset > 0:
+                    cursor.execute(_iocs_sql(*shape, True, search_index), params)
+                    total = cursor.fetchone()[0]
+                cursor.close()
+                return jsonify({"iocs": [], "total": total})
+
+            def generate_iocs():
+                # Rows are enriched and serialized one at a time straight off
+                # the cursor, so large pages never hold every IOC in memory
+                dumpb = app.json.dumpb
+                try:
+                    yield b'{"iocs":['
+                    for count, row in enumerate(itertools.chain([first], cursor)):
+                        ioc = dict(zip(cols, row))
+                        ioc["value"] = ioc["ioc_value"]
+
+                        # Add ML fields
+                        row_type = ioc["ioc_type"]
+                        ioc["threat_class"] = get_ml_threat_class(
+                            ioc["ioc_value"], row_type
+                        )
+                        ioc["malicious_probability"] = get_ml_probability(ioc["score"])
+                        ioc["feature_importance"] = get_feature_importance(row_type)
+                        ioc["similar_known_threats"] = get_similar_threats(row_type)
+                        ioc["attack_techniques"] = get_attack_techniques(row_type)
+
+                        yield dumpb(ioc) if count == 0 else b"," + dumpb(ioc)
+                finally:
+                    # Release the statement; the connection stays in the pool
+                    cursor.close()
+                yield b'],"total":%d}' % first[-1]
+
+            return app.response_class(generate_iocs(), mimetype="application/json")
+    except Exception as e:
+        logger.warning("Database connection error: %s", e)
+
+    # Return fallback IOC list if database access fails
+    logger.debug("Returning fallback IOCs")
+    fallback_iocs, body = _fallback_iocs()
+
     # Update the global IOCS list with the fallback data
-    IOCS.clear()
-    IOCS.extend(fallback_iocs)
+    _set_iocs(fallback_iocs)
 
-    return jsonify({"iocs": fallback_iocs, "total": len(fallback_iocs)})
+    return app.response_class(body, mimetype="application/json")
+
+
+# Case-insensitive exact lookup; served by the idx_iocs_value_lower expression
+# index from migrate_ioc_enhancements.py, which only matches this exact form
+SQL_IOC_BY_VALUE = "SELECT * FROM iocs WHERE LOWER(ioc_value) = ? LIMIT 1"
 
 
 def get_ioc_by_value(ioc_value):
@@ -627,54 +910,34 @@ def get_ioc_by_value(ioc_value):
     Returns:
         dict or None: The IOC object if found, or None if not found
     """
-    print("[API] Searching for IOC case-insensitively in database")
     ioc_value_lower = ioc_value.lower()
-    print(f"[API] Lowercase search value: '{ioc_value_lower}'")
 
     try:
         # Try accessing the database first
-        conn = get_db_connection()
+        conn = get_request_db()
         if conn:
             cursor = conn.cursor()
 
             # Search for IOC using case-insensitive matching
-            cursor.execute(
-                "SELECT * FROM iocs WHERE LOWER(ioc_value) = ? LIMIT 1",
-                (ioc_value_lower,),
-            )
+            cursor.execute(SQL_IOC_BY_VALUE, (ioc_value_lower,))
 
             row = cursor.fetchone()
             if row:
                 ioc = dict(row)
-                print(
-                    f"[API] Found matching IOC in database: {ioc.get('ioc_value', '')}"
+                logger.debug(
+                    "[API] Found matching IOC in database: %s", ioc.get("ioc_value")
                 )
-                conn.close()
                 return ioc
 
-            conn.close()
-            print(f"[API] No matching IOC found in database for {ioc_value}")
+            logger.debug("[API] No matching IOC found in database for %s", ioc_value)
             return None
 
     except Exception as e:
-        print(f"[API] Database error in get_ioc_by_value: {e}")
+        logger.warning("[API] Database error in get_ioc_by_value: %s", e)
 
-    # Fallback to in-memory search if database fails
-    print("[API] Falling back to in-memory search")
-    for i, ioc in enumerate(IOCS):
-        stored_value = str(ioc.get("value", ""))
-        stored_value_lower = stored_value.lower()
-        print(
-            f"[API] Comparing with IOC #{i}: '{stored_value}' "
-            f"(lower: '{stored_value_lower}')"
-        )
-
-        if stored_value_lower == ioc_value_lower:
-            print(f"[API] Found matching IOC: {stored_value}")
-            return ioc
-
-    print(f"[API] No matching IOC found for {ioc_value}")
-    return None
+    # Fallback to the in-memory index if database fails
+    logger.debug("[API] Falling back to in-memory search")
+    return _IOC_INDEX.get(ioc_value_lower)
 
 
 # Commenting out path-based route to avoid conflicts with query parameter approach
@@ -692,33 +955,115 @@ def get_ioc_by_value(ioc_value):
 def get_ioc_by_query():
     """Get a specific IOC by its value (query parameter)."""
     ioc_value = request.args.get("value")
-    print(f"[API] Received IOC value query: {ioc_value}")
-    print(f"[API] Request headers: {dict(request.headers)}")
-    print(f"[API] Current IOCs in memory: {len(IOCS)}")
-    print(f"[API] IOC values in memory: {[ioc.get('value', '') for ioc in IOCS]}")
+    logger.debug("[API] Received IOC value query: %s", ioc_value)
 
     if not ioc_value:
         return jsonify({"error": "IOC value is required"}), 400
-    print(f"[API] Received query request for IOC: {ioc_value}")
     ioc = get_ioc_by_value(ioc_value)
     if ioc is None:
         return jsonify({"error": "IOC not found"}), 404
     return jsonify(ioc)
 
 
-@ioc_bp.route("/api/explain/<path:ioc_value>", methods=["GET", "OPTIONS"])
+# Canned explanations served by /api/explain when the ML modules can't be
+# imported, serialized once per IOC type
+_FALLBACK_EXPLANATIONS = {
+    "domain": app.json.dumpb(
+        {
+            "summary": (
+                "This domain exhibits characteristics associated with malware "
+                "distribution infrastructure. The domain age, entropy, and "
+                "lexical patterns strongly suggest malicious intent."
+            ),
+            "feature_breakdown": [
+                {"feature": "Domain Age", "value": "3 days", "weight": -0.42},
+                {
+                    "feature": "Character Entropy",
+                    "value": "4.2 (high)",
+                    "weight": 0.78,
+                },
+                {"feature": "TLD Type", "value": ".com", "weight": 0.14},
+                {"feature": "DGA-like Pattern", "value": "Yes", "weight": 0.65},
+                {
+                    "feature": "Historical Reputation",
+                    "value": "None",
+                    "weight": -0.25,
+                },
+                {
+                    "feature": "Domain Length",
+                    "value": "18 characters",
+                    "weight": 0.31,
+                },
+            ],
+        }
+    ),
+    "ip": app.json.dumpb(
+        {
+            "summary": "This IP address shows behavioral patterns consistent with command and control (C2) infrastructure. The unusual port activity, geographic location, and association with previously identified threat actors indicate high confidence in this assessment.",
+            "feature_breakdown": [
+                {
+                    "feature": "ASN Reputation",
+                    "value": "AS12345 (Poor)",
+                    "weight": 0.67,
+                },
+                {
+                    "feature": "Geographic Location",
+                    "value": "Eastern Europe",
+                    "weight": 0.35,
+                },
+                {"feature": "Open Ports", "value": "22, 443, 8080", "weight": 0.45},
+                {
+                    "feature": "Passive DNS",
+                    "value": "12 domains in 5 days",
+                    "weight": 0.72,
+                },
+                {
+                    "feature": "TLS Certificate",
+                    "value": "Self-signed",
+                    "weight": 0.58,
+                },
+                {
+                    "feature": "Traffic Pattern",
+                    "value": "Beaconing",
+                    "weight": 0.83,
+                },
+            ],
+        }
+    ),
+}
+# Hashes, URLs and anything else
+_FALLBACK_EXPLANATION_DEFAULT = app.json.dumpb(
+    {
+        "summary": "This file hash is associated with a novel ransomware variant. Static and dynamic analysis reveals capabilities including file encryption, process termination, and anti-analysis techniques. The code shares significant similarities with the Ryuk ransomware family.",
+        "feature_breakdown": [
+            {"feature": "Entropy", "value": "7.8/8.0", "weight": 0.76},
+            {
+                "feature": "PE Sections",
+                "value": "7 (3 suspicious)",
+                "weight": 0.62,
+            },
+            {
+                "feature": "API Calls",
+                "value": "CryptEncrypt, TerminateProcess",
+                "weight": 0.85,
+            },
+            {"feature": "File Size", "value": "284KB", "weight": 0.21},
+            {"feature": "Anti-Debug", "value": "Present", "weight": 0.73},
+            {
+                "feature": "Code Similarity",
+                "value": "68% match to Ryuk",
+                "weight": 0.69,
+            },
+        ],
+    }
+)
+
+
+@ioc_bp.route("/api/explain/<path:ioc_value>", methods=["GET"])
 def explain_ml(ioc_value):
     """Generate ML explanation for a specific IOC."""
-    if request.method == "OPTIONS":
-        # Handle preflight request
-        response = jsonify({})
-        response.headers.add("Access-Control-Allow-Origin", "*")
-        response.headers.add("Access-Control-Allow-Headers", "Content-Type")
-        response.headers.add("Access-Control-Allow-Methods", "GET")
-        return response
-
     # Find the IOC first (with case-insensitive matching)
-    print(f"[API] Received ML explanation request for IOC: {ioc_value}")
+    logger.debug("[API] Received ML explanation request for IOC: %s", ioc_value)
     ioc = get_ioc_by_value(ioc_value)
 
     if ioc is None:
@@ -733,8 +1078,10 @@ def explain_ml(ioc_value):
         enrichment_data = {}
         summary = ioc.get("summary", "")
 
-        print(
-            f"[API] Generating ML explanation for IOC: {ioc_value} (type: {ioc_type})"
+        logger.debug(
+            "[API] Generating ML explanation for IOC: %s (type: %s)",
+            ioc_value,
+            ioc_type,
         )
 
         # Score the IOC with explanation
@@ -786,113 +1133,27 @@ def explain_ml(ioc_value):
             },
         }
 
-        print("[API] ML explanation generated successfully")
+        logger.debug("[API] ML explanation generated successfully")
         return jsonify(response)
 
     except ImportError as e:
-        print(f"[API] Error importing ML modules: {e}")
-        # Fall back to mock data if ML modules are not available
-        ioc_type = infer_ioc_type(ioc_value)
-
-        # Generate explanation based on IOC type (use the existing mock data)
-        if ioc_type == "domain":
-            explanation = {
-                "summary": (
-                    "This domain exhibits characteristics associated with malware "
-                    "distribution infrastructure. The domain age, entropy, and "
-                    "lexical patterns strongly suggest malicious intent."
-                ),
-                "feature_breakdown": [
-                    {"feature": "Domain Age", "value": "3 days", "weight": -0.42},
-                    {
-                        "feature": "Character Entropy",
-                        "value": "4.2 (high)",
-                        "weight": 0.78,
-                    },
-                    {"feature": "TLD Type", "value": ".com", "weight": 0.14},
-                    {"feature": "DGA-like Pattern", "value": "Yes", "weight": 0.65},
-                    {
-                        "feature": "Historical Reputation",
-                        "value": "None",
-                        "weight": -0.25,
-                    },
-                    {
-                        "feature": "Domain Length",
-                        "value": "18 characters",
-                        "weight": 0.31,
-                    },
-                ],
-            }
-        elif ioc_type == "ip":
-            explanation = {
-                "summary": "This IP address shows behavioral patterns consistent with command and control (C2) infrastructure. The unusual port activity, geographic location, and association with previously identified threat actors indicate high confidence in this assessment.",
-                "feature_breakdown": [
-                    {
-                        "feature": "ASN Reputation",
-                        "value": "AS12345 (Poor)",
-                        "weight": 0.67,
-                    },
-                    {
-                        "feature": "Geographic Location",
-                        "value": "Eastern Europe",
-                        "weight": 0.35,
-                    },
-                    {"feature": "Open Ports", "value": "22, 443, 8080", "weight": 0.45},
-                    {
-                        "feature": "Passive DNS",
-                        "value": "12 domains in 5 days",
-                        "weight": 0.72,
-                    },
-                    {
-                        "feature": "TLS Certificate",
-                        "value": "Self-signed",
-                        "weight": 0.58,
-                    },
-                    {
-                        "feature": "Traffic Pattern",
-                        "value": "Beaconing",
-                        "weight": 0.83,
-                    },
-                ],
-            }
-        else:  # hash, url, or other
-            explanation = {
-                "summary": "This file hash is associated with a novel ransomware variant. Static and dynamic analysis reveals capabilities including file encryption, process termination, and anti-analysis techniques. The code shares significant similarities with the Ryuk ransomware family.",
-                "feature_breakdown": [
-                    {"feature": "Entropy", "value": "7.8/8.0", "weight": 0.76},
-                    {
-                        "feature": "PE Sections",
-                        "value": "7 (3 suspicious)",
-                        "weight": 0.62,
-                    },
-                    {
-                        "feature": "API Calls",
-                        "value": "CryptEncrypt, TerminateProcess",
-                        "weight": 0.85,
-                    },
-                    {"feature": "File Size", "value": "284KB", "weight": 0.21},
-                    {"feature": "Anti-Debug", "value": "Present", "weight": 0.73},
-                    {
-                        "feature": "Code Similarity",
-                        "value": "68% match to Ryuk",
-                        "weight": 0.69,
-                    },
-                ],
-            }
+        logger.debug("[API] Error importing ML modules: %s", e)
+        # Fall back to canned explanations if ML modules are not available
+        explanation = _FALLBACK_EXPLANATIONS.get(
+            infer_ioc_type(ioc_value), _FALLBACK_EXPLANATION_DEFAULT
+        )
 
         # Add mock score using get_ml_probability
-        score = ioc.get("score", 5.0)
-        probability = get_ml_probability(score)
-
-        response = {
-            "value": ioc_value,
-            "score": probability,  # Use normalized probability
-            "explanation": explanation,
-        }
+        probability = get_ml_probability(ioc.get("score", 5.0))
+        head = app.json.dumpb({"value": ioc_value, "score": probability})
 
-        return jsonify(response)
+        # Splice the pre-serialized explanation in as the last key
+        return app.response_class(
+            head[:-1] + b',"explanation":' + explanation + b"}",
+            mimetype="application/json",
+        )
     except Exception as e:
-        print(f"[API] Error generating ML explanation: {e}")
+        logger.warning("[API] Error generating ML explanation: %s", e)
         return jsonify(
             {
                 "value": ioc_value,
@@ -906,20 +1167,90 @@ def explain_ml(ioc_value):
         )
 
 
-# Helper functions for ML data (mocked for now)
+# Helper functions for ML data (mocked for now). The per-type tables are
+# built once at import and the helpers hand out the shared entries, so
+# callers must treat the returned lists as read-only.
+ML_THREAT_CLASSES = {
+    "domain": ("malware", "phishing", "c2_server"),
+    "ip": ("c2_server", "ransomware", "ddos"),
+    "hash": ("ransomware", "malware", "infostealer"),
+    "url": ("phishing", "malware", "exploit"),
+}
+
+FEATURE_IMPORTANCE_BY_TYPE = {
+    "domain": [
+        {"feature": "Domain Age", "weight": 0.42},
+        {"feature": "Entropy", "weight": 0.38},
+        {"feature": "TLD Rarity", "weight": 0.2},
+    ],
+    "ip": [
+        {"feature": "ASN Reputation", "weight": 0.45},
+        {"feature": "Geolocation", "weight": 0.35},
+        {"feature": "Port Scan", "weight": 0.2},
+    ],
+    "hash": [
+        {"feature": "File Structure", "weight": 0.55},
+        {"feature": "API Calls", "weight": 0.25},
+        {"feature": "Packer Detection", "weight": 0.2},
+    ],
+}
+DEFAULT_FEATURE_IMPORTANCE = [
+    {"feature": "URL Pattern", "weight": 0.4},
+    {"feature": "Domain Reputation", "weight": 0.3},
+    {"feature": "Content Analysis", "weight": 0.3},
+]
+
+SIMILAR_THREATS_BY_TYPE = {
+    "domain": [
+        {"name": "Emotet", "confidence": 0.85},
+        {"name": "Trickbot", "confidence": 0.72},
+    ],
+    "ip": [
+        {"name": "APT29", "confidence": 0.65},
+        {"name": "Cobalt Strike", "confidence": 0.77},
+    ],
+    "hash": [
+        {"name": "WannaCry", "confidence": 0.82},
+        {"name": "Ryuk", "confidence": 0.68},
+    ],
+    "url": [
+        {"name": "Qakbot", "confidence": 0.75},
+        {"name": "AgentTesla", "confidence": 0.63},
+    ],
+}
+DEFAULT_SIMILAR_THREATS = [{"name": "Unknown", "confidence": 0.5}]
+
+ATTACK_TECHNIQUES_BY_TYPE = {
+    "domain": [
+        {"id": "T1566", "name": "Phishing"},
+        {"id": "T1189", "name": "Drive-by Compromise"},
+    ],
+    "ip": [
+        {"id": "T1071", "name": "Application Layer Protocol"},
+        {"id": "T1572", "name": "Protocol Tunneling"},
+    ],
+    "hash": [
+        {"id": "T1486", "name": "Data Encrypted for Impact"},
+        {"id": "T1489", "name": "Service Stop"},
+    ],
+    "url": [
+        {"id": "T1566.002", "name": "Phishing: Spearphishing Link"},
+        {"id": "T1204", "name": "User Execution"},
+    ],
+}
+DEFAULT_ATTACK_TECHNIQUES = [{"id": "T1027", "name": "Obfuscated Files or Information"}]
+
+
+@lru_cache(maxsize=4096)
 def get_ml_threat_class(ioc_value, ioc_type):
     """Determine the ML threat class based on IOC type."""
-    threat_classes = {
-        "domain": ["malware", "phishing", "c2_server"],
-        "ip": ["c2_server", "ransomware", "ddos"],
-        "hash": ["ransomware", "malware", "infostealer"],
-        "url": ["phishing", "malware", "exploit"],
-    }
-
-    classes = threat_classes.get(ioc_type, ["unknown"])
+    classes = ML_THREAT_CLASSES.get(ioc_type, ("unknown",))
 
-    # Use the IOC value to deterministically select a class (for demo consistency)
-    hash_value = sum(ord(c) for c in ioc_value)
+    # Use the IOC value to deterministically select a class (for demo
+    # consistency). The built-in hash() is salted per process, so it would
+    # reshuffle classes across restarts and workers; results are memoized
+    # instead, making repeat lookups of the same IOC free.
+    hash_value = sum(map(ord, ioc_value))
     return classes[hash_value % len(classes)]
 
 
@@ -933,88 +1264,24 @@ def get_ml_probability(score):
 
 def get_feature_importance(ioc_type):
     """Generate feature importance based on IOC type."""
-    if ioc_type == "domain":
-        return [
-            {"feature": "Domain Age", "weight": 0.42},
-            {"feature": "Entropy", "weight": 0.38},
-            {"feature": "TLD Rarity", "weight": 0.2},
-        ]
-    elif ioc_type == "ip":
-        return [
-            {"feature": "ASN Reputation", "weight": 0.45},
-            {"feature": "Geolocation", "weight": 0.35},
-            {"feature": "Port Scan", "weight": 0.2},
-        ]
-    elif ioc_type == "hash":
-        return [
-            {"feature": "File Structure", "weight": 0.55},
-            {"feature": "API Calls", "weight": 0.25},
-            {"feature": "Packer Detection", "weight": 0.2},
-        ]
-    else:
-        return [
-            {"feature": "URL Pattern", "weight": 0.4},
-            {"feature": "Domain Reputation", "weight": 0.3},
-            {"feature": "Content Analysis", "weight": 0.3},
-        ]
+    return FEATURE_IMPORTANCE_BY_TYPE.get(ioc_type, DEFAULT_FEATURE_IMPORTANCE)
 
 
 def get_similar_threats(ioc_type):
     """Generate similar threats based on IOC type."""
-    threats = {
-        "domain": [
-            {"name": "Emotet", "confidence": 0.85},
-            {"name": "Trickbot", "confidence": 0.72},
-        ],
-        "ip": [
-            {"name": "APT29", "confidence": 0.65},
-            {"name": "Cobalt Strike", "confidence": 0.77},
-        ],
-        "hash": [
-            {"name": "WannaCry", "confidence": 0.82},
-            {"name": "Ryuk", "confidence": 0.68},
-        ],
-        "url": [
-            {"name": "Qakbot", "confidence": 0.75},
-            {"name": "AgentTesla", "confidence": 0.63},
-        ],
-    }
-
-    return threats.get(ioc_type, [{"name": "Unknown", "confidence": 0.5}])
+    return SIMILAR_THREATS_BY_TYPE.get(ioc_type, DEFAULT_SIMILAR_THREATS)
 
 
 def get_attack_techniques(ioc_type):
     """Generate MITRE ATT&CK techniques based on IOC type."""
-    techniques = {
-        "domain": [
-            {"id": "T1566", "name": "Phishing"},
-            {"id": "T1189", "name": "Drive-by Compromise"},
-        ],
-        "ip": [
-            {"id": "T1071", "name": "Application Layer Protocol"},
-            {"id": "T1572", "name": "Protocol Tunneling"},
-        ],
-        "hash": [
-            {"id": "T1486", "name": "Data Encrypted for Impact"},
-            {"id": "T1489", "name": "Service Stop"},
-        ],
-        "url": [
-            {"id": "T1566.002", "name": "Phishing: Spearphishing Link"},
-            {"id": "T1204", "name": "User Execution"},
-        ],
-    }
-
-    return techniques.get(
-        ioc_type, [{"id": "T1027", "name": "Obfuscated Files or Information"}]
-    )
+    return ATTACK_TECHNIQUES_BY_TYPE.get(ioc_type, DEFAULT_ATTACK_TECHNIQUES)
 
 
-@ioc_bp.route("/api/ioc/summary", methods=["GET"])
-def get_ioc_summary():
-    """Get IOC summary statistics by severity level."""
+def _query_ioc_summary():
+    """Count IOCs by severity level, or return None if the database fails."""
     try:
         # Try accessing the database
-        conn = get_db_connection()
+        conn = get_request_db()
         if conn:
             cursor = conn.cursor()
 
@@ -1037,10 +1304,18 @@ def get_ioc_summary():
                 if "severity" in row and "count" in row:
                     summary[row["severity"]] = row["count"]
 
-            conn.close()
-            return jsonify(summary)
+            return summary
     except Exception as e:
         print(f"[API] Database error in get_ioc_summary: {e}")
+    return None
+
+
+@ioc_bp.route("/api/ioc/summary", methods=["GET"])
+def get_ioc_summary():
+    """Get IOC summary statistics by severity level."""
+    response = cached_stats_response("ioc_summary", _query_ioc_summary)
+    if response is not None:
+        return response
 
     # Fallback to counting from in-memory IOCS
     summary = {"critical": 0, "high": 0, "medium": 0, "low": 0}
@@ -1063,7 +1338,7 @@ def get_threats_metrics():
     """Get threat metrics over time for dashboard charts."""
     try:
         # Try accessing the database
-        conn = get_db_connection()
+        conn = get_request_db()
         if conn:
             cursor = conn.cursor()
 
@@ -1095,8 +1370,6 @@ def get_threats_metrics():
                         }
                     )
 
-            conn.close()
-
             if daily_counts:
                 return jsonify({"daily_counts": daily_counts})
     except Exception as e:
@@ -1127,7 +1400,7 @@ def get_threats_metrics():
 def get_shareable_ioc():
     """Get a shareable, public-safe version of an IOC for public viewing."""
     ioc_value = request.args.get("value")
-    print(f"[API] Received shareable IOC request: {ioc_value}")
+    logger.debug("[API] Received shareable IOC request: %s", ioc_value)
 
     if not ioc_value:
         return jsonify({"error": "IOC value is required"}), 400
@@ -1176,7 +1449,9 @@ def get_shareable_ioc():
 @ioc_bp.route("/api/explain/share/<path:ioc_value>", methods=["GET"])
 def share_explain_ml(ioc_value):
     """Get a shareable ML explanation for a specific IOC."""
-    print(f"[API] Received shareable ML explanation request for IOC: {ioc_value}")
+    logger.debug(
+        "[API] Received shareable ML explanation request for IOC: %s", ioc_value
+    )
 
     # Get the IOC
     ioc = get_ioc_by_value(ioc_value)
@@ -2394,6 +2669,43 @@ def generate_mock_timeline(alert_id, alert_info):
     return timeline_events
 
 
+IOC_AUDIT_COLUMNS = (
+    "ioc_type",
+    "ioc_value",
+    "action",
+    "user_id",
+    "changes",
+    "justification",
+    "timestamp",
+    "source_ip",
+    "user_agent",
+)
+
+# Keep each statement under SQLite's default limit of 999 bound parameters
+_AUDIT_ROWS_PER_STATEMENT = 999 // len(IOC_AUDIT_COLUMNS)
+
+
+@lru_cache(maxsize=None)
+def _audit_insert_sql(row_count):
+    """Build a multi-row INSERT for ``row_count`` audit log entries."""
+    placeholders = "(" + ", ".join("?" * len(IOC_AUDIT_COLUMNS)) + ")"
+    return (
+        f"INSERT INTO ioc_audit_logs ({', '.join(IOC_AUDIT_COLUMNS)}) VALUES "
+        + ", ".join([placeholders] * row_count)
+    )
+
+
+def write_ioc_audit_logs(cursor, rows):
+    """Insert audit log rows (tuples ordered as IOC_AUDIT_COLUMNS).
+
+    Rows are flushed with one multi-row INSERT per chunk rather than one
+    statement per row.
+    """
+    for start in range(0, len(rows), _AUDIT_ROWS_PER_STATEMENT):
+        batch = rows[start : start + _AUDIT_ROWS_PER_STATEMENT]
+        cursor.execute(_audit_insert_sql(len(batch)), list(chain.from_iterable(batch)))
+
+
 # IOC CRUD endpoints
 @ioc_bp.route("/api/ioc", methods=["POST"])
 @require_role([UserRole.ANALYST, UserRole.ADMIN])
@@ -2440,7 +2752,7 @@ def create_ioc():
             return jsonify({"error": "IOC value cannot be empty"}), 400
 
         # Check if IOC already exists
-        conn = get_db_connection()
+        conn = get_request_db()
         if not conn:
             return jsonify({"error": "Database connection failed"}), 500
 
@@ -2452,7 +2764,6 @@ def create_ioc():
         existing_ioc = cursor.fetchone()
 
         if existing_ioc:
-            conn.close()
             return jsonify({"error": "IOC already exists"}), 409
 
         # Create new IOC
@@ -2478,7 +2789,7 @@ def create_ioc():
                 data.get("score", 0),
                 data.get("category", "low"),
                 severity,
-                json.dumps(tags),
+                orjson.dumps(tags).decode(),
                 confidence,
                 current_user.user_id,
                 current_user.user_id,
@@ -2489,28 +2800,25 @@ def create_ioc():
         )
 
         # Log the creation
-        cursor.execute(
-            """
-            INSERT INTO ioc_audit_logs (
-                ioc_type, ioc_value, action, user_id, changes, justification,
-                timestamp, source_ip, user_agent
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                data["ioc_type"],
-                ioc_value,
-                "CREATE",
-                current_user.user_id,
-                json.dumps({"created": data}),
-                data.get("justification", "IOC created via API"),
-                now,
-                request.remote_addr,
-                request.headers.get("User-Agent", ""),
-            ),
+        write_ioc_audit_logs(
+            cursor,
+            [
+                (
+                    data["ioc_type"],
+                    ioc_value,
+                    "CREATE",
+                    current_user.user_id,
+                    orjson.dumps({"created": data}).decode(),
+                    data.get("justification", "IOC created via API"),
+                    now,
+                    request.remote_addr,
+                    request.headers.get("User-Agent", ""),
+                )
+            ],
         )
 
         conn.commit()
-        conn.close()
+        invalidate_stats_cache()
 
         return jsonify(
             {
@@ -2533,6 +2841,31 @@ def create_ioc():
         return jsonify({"error": "Internal server error"}), 500
 
 
+# Fields that can be updated through PATCH /api/ioc/<value>, with expected types
+IOC_UPDATABLE_FIELDS = {
+    "source_feed": str,
+    "score": int,
+    "category": str,
+    "severity": str,
+    "confidence": int,
+    "tags": list,
+    "summary": str,
+}
+
+IOC_SEVERITIES = frozenset({"low", "medium", "high", "critical"})
+
+# Value checks applied after type validation: field -> (predicate, error message)
+IOC_FIELD_VALIDATORS = {
+    "severity": (IOC_SEVERITIES.__contains__, "Invalid severity"),
+    "confidence": (lambda v: 0 <= v <= 100, "Confidence must be between 0 and 100"),
+}
+
+
+def _coerce_tags(value):
+    """Split a comma-separated tag string into a list of stripped tags."""
+    return [tag.strip() for tag in value.split(",") if tag.strip()]
+
+
 @ioc_bp.route("/api/ioc/<path:ioc_value>", methods=["PATCH"])
 @require_role([UserRole.ANALYST, UserRole.ADMIN])
 def update_ioc(ioc_value):
@@ -2549,21 +2882,22 @@ def update_ioc(ioc_value):
         if not ioc_type:
             return jsonify({"error": "IOC type must be provided"}), 400
 
-        conn = get_db_connection()
+        conn = get_request_db()
         if not conn:
             return jsonify({"error": "Database connection failed"}), 500
 
         cursor = conn.cursor()
 
-        # Check if IOC exists
+        # Check if IOC exists, fetching only the columns the payload touches
+        requested_fields = [f for f in IOC_UPDATABLE_FIELDS if f in data]
         cursor.execute(
-            "SELECT * FROM iocs WHERE ioc_type = ? AND ioc_value = ? AND is_active = 1",
+            f"SELECT {', '.join(requested_fields) or '1'} FROM iocs "
+            "WHERE ioc_type = ? AND ioc_value = ? AND is_active = 1",
             (ioc_type, ioc_value),
         )
         existing_ioc = cursor.fetchone()
 
         if not existing_ioc:
-            conn.close()
             return jsonify({"error": "IOC not found"}), 404
 
         # Build update query dynamically
@@ -2571,72 +2905,44 @@ def update_ioc(ioc_value):
         update_values = []
         changes = {}
 
-        # Fields that can be updated
-        updatable_fields = {
-            "source_feed": str,
-            "score": int,
-            "category": str,
-            "severity": str,
-            "confidence": int,
-            "tags": list,
-            "summary": str,
-        }
-
-        for field, field_type in updatable_fields.items():
-            if field in data:
-                new_value = data[field]
-
-                # Type validation
-                if field_type is int and not isinstance(new_value, int):
-                    return jsonify({"error": f"{field} must be an integer"}), 400
-                elif field_type is str and not isinstance(new_value, str):
-                    return jsonify({"error": f"{field} must be a string"}), 400
-                elif field_type is list and not isinstance(new_value, list):
-                    if isinstance(new_value, str):
-                        new_value = [
-                            tag.strip() for tag in new_value.split(",") if tag.strip()
-                        ]
-                    else:
-                        return jsonify(
-                            {
-                                "error": f"{field} must be a list or comma-separated string"
-                            }
-                        ), 400
-
-                # Special validations
-                if field == "severity" and new_value not in [
-                    "low",
-                    "medium",
-                    "high",
-                    "critical",
-                ]:
-                    return jsonify({"error": "Invalid severity"}), 400
-                elif field == "confidence" and (new_value < 0 or new_value > 100):
+        for field in requested_fields:
+            field_type = IOC_UPDATABLE_FIELDS[field]
+            new_value = data[field]
+
+            # Type validation
+            if field_type is int and not isinstance(new_value, int):
+                return jsonify({"error": f"{field} must be an integer"}), 400
+            elif field_type is str and not isinstance(new_value, str):
+                return jsonify({"error": f"{field} must be a string"}), 400
+            elif field_type is list and not isinstance(new_value, list):
+                if isinstance(new_value, str):
+                    new_value = _coerce_tags(new_value)
+                else:
                     return jsonify(
-                        {"error": "Confidence must be between 0 and 100"}
+                        {"error": f"{field} must be a list or comma-separated string"}
                     ), 400
 
-                # Store for audit log
+            # Special validations
+            validator = IOC_FIELD_VALIDATORS.get(field)
+            if validator and not validator[0](new_value):
+                return jsonify({"error": validator[1]}), 400
+
+            # Store for audit log
+            old_value = existing_ioc[field] if field in existing_ioc.keys() else None
+            if field == "tags" and old_value:
                 old_value = (
-                    existing_ioc[field] if field in existing_ioc.keys() else None
+                    orjson.loads(old_value) if isinstance(old_value, str) else old_value
                 )
-                if field == "tags" and old_value:
-                    old_value = (
-                        json.loads(old_value)
-                        if isinstance(old_value, str)
-                        else old_value
-                    )
 
-                if old_value != new_value:
-                    changes[field] = {"old": old_value, "new": new_value}
-                    update_fields.append(f"{field} = ?")
-                    if field == "tags":
-                        update_values.append(json.dumps(new_value))
-                    else:
-                        update_values.append(new_value)
+            if old_value != new_value:
+                changes[field] = {"old": old_value, "new": new_value}
+                update_fields.append(f"{field} = ?")
+                if field == "tags":
+                    update_values.append(orjson.dumps(new_value).decode())
+                else:
+                    update_values.append(new_value)
 
         if not update_fields:
-            conn.close()
             return jsonify({"message": "No changes detected"}), 200
 
         # Add updated_by and updated_at
@@ -2655,28 +2961,25 @@ def update_ioc(ioc_value):
         cursor.execute(update_query, update_values)
 
         # Log the update
-        cursor.execute(
-            """
-            INSERT INTO ioc_audit_logs (
-                ioc_type, ioc_value, action, user_id, changes, justification,
-                timestamp, source_ip, user_agent
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                ioc_type,
-                ioc_value,
-                "UPDATE",
-                current_user.user_id,
-                json.dumps(changes),
-                data.get("justification", "IOC updated via API"),
-                now,
-                request.remote_addr,
-                request.headers.get("User-Agent", ""),
-            ),
+        write_ioc_audit_logs(
+            cursor,
+            [
+                (
+                    ioc_type,
+                    ioc_value,
+                    "UPDATE",
+                    current_user.user_id,
+                    orjson.dumps(changes).decode(),
+                    data.get("justification", "IOC updated via API"),
+                    now,
+                    request.remote_addr,
+                    request.headers.get("User-Agent", ""),
+                )
+            ],
         )
 
         conn.commit()
-        conn.close()
+        invalidate_stats_cache()
 
         return jsonify({"message": "IOC updated successfully", "changes": changes}), 200
 
@@ -2697,7 +3000,7 @@ def delete_ioc(ioc_value):
         if not ioc_type:
             return jsonify({"error": "IOC type must be provided"}), 400
 
-        conn = get_db_connection()
+        conn = get_request_db()
         if not conn:
             return jsonify({"error": "Database connection failed"}), 500
 
@@ -2711,7 +3014,6 @@ def delete_ioc(ioc_value):
         existing_ioc = cursor.fetchone()
 
         if not existing_ioc:
-            conn.close()
             return jsonify({"error": "IOC not found"}), 404
 
         # Soft delete the IOC
@@ -2725,30 +3027,27 @@ def delete_ioc(ioc_value):
         )
 
         # Log the deletion
-        cursor.execute(
-            """
-            INSERT INTO ioc_audit_logs (
-                ioc_type, ioc_value, action, user_id, changes, justification,
-                timestamp, source_ip, user_agent
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                ioc_type,
-                ioc_value,
-                "DELETE",
-                current_user.user_id,
-                json.dumps({"deleted": True}),
-                request.get_json().get("justification", "IOC deleted via API")
-                if request.is_json
-                else "IOC deleted via API",
-                now,
-                request.remote_addr,
-                request.headers.get("User-Agent", ""),
-            ),
+        write_ioc_audit_logs(
+            cursor,
+            [
+                (
+                    ioc_type,
+                    ioc_value,
+                    "DELETE",
+                    current_user.user_id,
+                    orjson.dumps({"deleted": True}).decode(),
+                    request.get_json().get("justification", "IOC deleted via API")
+                    if request.is_json
+                    else "IOC deleted via API",
+                    now,
+                    request.remote_addr,
+                    request.headers.get("User-Agent", ""),
+                )
+            ],
         )
 
         conn.commit()
-        conn.close()
+        invalidate_stats_cache()
 
         return jsonify({"message": "IOC deleted successfully"}), 200
 
@@ -2797,7 +3096,7 @@ def list_user_api_keys():
             # Parse access_scope JSON
             try:
                 key_data["access_scope"] = (
-                    json.loads(key_data["access_scope"])
+                    orjson.loads(key_data["access_scope"])
                     if key_data["access_scope"]
                     else ["read"]
                 )
@@ -2901,7 +3200,7 @@ def create_user_api_key():
                 name,
                 key_hash,
                 key_preview,
-                json.dumps(access_scope),
+                orjson.dumps(access_scope).decode(),
                 expires_at,
                 rate_limit_tier,
                 ip_restrictions if ip_restrictions else None,
@@ -3077,6 +3376,28 @@ def not_found(error):
     return jsonify({"error": "Route not found", "details": str(error)}), 404
 
 
+# Mock IOCs served when the database is unavailable; regenerate with
+# scripts/gen_fallback.py
+FALLBACK_IOCS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "fallback_iocs.json"
+)
+
+
+def load_fallback_iocs(path=FALLBACK_IOCS_PATH):
+    """Load the pre-generated fallback IOCs, dating them relative to now."""
+    with open(path, "rb") as f:
+        fallback_iocs = json.load(f)
+
+    # Plain epoch arithmetic plus isoformat avoids a timedelta and strftime per value
+    now = time.time()
+    fromtimestamp = datetime.datetime.fromtimestamp
+    for ioc in fallback_iocs:
+        for field in ("first_seen", "last_seen"):
+            days_ago = ioc.pop(f"{field}_days_ago")
+            ioc[field] = fromtimestamp(int(now - days_ago * 86400)).isoformat(" ")
+    return fallback_iocs
+
+
 # Initialize IOCS and ALERTS lists at startup
 def initialize_iocs():
     """Load initial IOC data into memory at server startup."""
@@ -3099,8 +3420,7 @@ def initialize_iocs():
             conn.close()
 
             if iocs:
-                IOCS.clear()
-                IOCS.extend(iocs)
+                _set_iocs(iocs)
                 print(f"[API] Loaded {len(IOCS)} IOCs from database")
                 return
     except Exception as e:
@@ -3136,305 +3456,146 @@ def initialize_alerts():
         print(f"[API] Database error during alerts initialization: {e}")
 
     # Fallback to enhanced mock IOCs if database fails
-    # Generate random timestamps within the last 14 days
-    def random_timestamp(days_ago_max=14, days_ago_min=0):
-        days_ago = random.uniform(days_ago_min, days_ago_max)
-        timestamp = datetime.datetime.now() - datetime.timedelta(days=days_ago)
-        return timestamp.strftime("%Y-%m-%d %H:%M:%S")
-
-    # Common domains for examples
-    domains = [
-        "example.com",
-        "phishing-attempt.com",
-        "malware-delivery.net",
-        "suspicious-domain.org",
-        "credential-harvester.com",
-        "fake-login.net",
-        "banking-update.com",
-        "secure-verification.net",
-        "account-alert.org",
-        "payment-confirm.com",
-    ]
+    try:
+        fallback_iocs = load_fallback_iocs()
+    except (OSError, ValueError) as e:
+        print(f"[API] Could not load fallback IOCs from {FALLBACK_IOCS_PATH}: {e}")
+        return
 
-    # Common IPs for examples
-    ips = [
-        "1.1.1.1",
-        "192.168.1.10",
-        "10.0.0.1",
-        "172.16.254.1",
-        "192.0.2.1",
-        "198.51.100.1",
-        "203.0.113.1",
-        "224.0.0.1",
-        "169.254.1.1",
-        "127.0.0.1",
-    ]
+    _set_iocs(fallback_iocs)
+    print(f"[API] Loaded {len(IOCS)} enhanced mock IOCs")
 
-    # Create file hashes
-    hashes = [
-        "5241acbddc07ce49cca44076264344717b30a303acb825075471e83468c5585",
-        "840c40763110c1f6564bc2b61dcdf7ce77ce0016211385a5ac49cc5ea8b011d2",
-        "685b4307728abd92415c2d9c001761cfa0481b29689b35106f7a5ee1d1117c8a",
-        "13be0a2444ed05fa173dca62cea89c996e0fe93d82d33bb7795d1870eb1b0e2d",
-        "3247618d002476e731145da86ec977edf01bae14c9beb3bc3bf4b7fa1ee4a250",
-    ]
 
-    # URLs for examples
-    urls = [
-        "https://malicious-site.com/download.exe",
-        "https://fake-login.com/portal/signin.php",
-        "http://compromised-cdn.net/jquery.min.js",
-        "https://phish.example.org/reset-password.html",
-        "http://tracking.malware-delivery.com/beacon.gif",
-    ]
+# ============================================================================
+# THREAT FEED INGESTION ENDPOINTS
+# ============================================================================
 
-    # Create 50 mock IOCs with varied properties
-    fallback_iocs = []
+# Shared HTTP session for feed downloads so connections (and TLS sessions) to
+# feed providers are kept alive and reused across imports. Only connection
+# errors are retried; 401/403/429 responses are reported to the caller.
+FEED_SESSION = requests.Session()
+FEED_SESSION.headers.update(
+    {"User-Agent": "SentinelForge/1.0 (Threat Intelligence Platform)"}
+)
+_feed_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+FEED_SESSION.mount("http://", _feed_adapter)
+FEED_SESSION.mount("https://", _feed_adapter)
+
+# Session for on-demand single feed health checks, pooled for the whole feed
+# fleet. Throttling and server errors get one retry on HEAD/GET.
+HEALTH_SESSION = requests.Session()
+_health_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET"],
+        backoff_factor=0.3,
+    ),
+)
+HEALTH_SESSION.mount("http://", _health_adapter)
+HEALTH_SESSION.mount("https://", _health_adapter)
 
-    # Add the original fallback data
-    fallback_iocs.extend(
-        [
-            {
-                "id": 1,
-                "ioc_type": "domain",
-                "ioc_value": "example.com",
-                "value": "example.com",
-                "score": 9,
-                "category": "low",
-                "first_seen": random_timestamp(30, 25),
-                "last_seen": random_timestamp(5, 1),
-                "source_feed": "dummy",
-                "threat_class": "malware",
-                "malicious_probability": 1.0,
-                "feature_importance": [
-                    {"feature": "Domain Age", "weight": 0.42},
-                    {"feature": "Entropy", "weight": 0.38},
-                    {"feature": "TLD Rarity", "weight": 0.2},
-                ],
-                "similar_known_threats": [
-                    {"name": "Emotet", "confidence": 0.85},
-                    {"name": "Trickbot", "confidence": 0.72},
-                ],
-                "attack_techniques": [
-                    {"id": "T1566", "name": "Phishing"},
-                    {"id": "T1189", "name": "Drive-by Compromise"},
-                ],
-            },
-            {
-                "id": 2,
-                "ioc_type": "ip",
-                "ioc_value": "1.1.1.1",
-                "value": "1.1.1.1",
-                "score": 7.2,
-                "category": "medium",
-                "first_seen": random_timestamp(30, 25),
-                "last_seen": random_timestamp(5, 1),
-                "source_feed": "test_feed",
-                "threat_class": "c2_server",
-                "malicious_probability": 0.78,
-                "feature_importance": [
-                    {"feature": "WHOIS Age", "weight": 0.35},
-                    {"feature": "ASN Reputation", "weight": 0.45},
-                    {"feature": "Port Scan Results", "weight": 0.2},
-                ],
-                "similar_known_threats": [
-                    {"name": "APT29", "confidence": 0.65},
-                    {"name": "Cobalt Strike", "confidence": 0.77},
-                ],
-                "attack_techniques": [
-                    {"id": "T1071", "name": "Application Layer Protocol"},
-                    {"id": "T1572", "name": "Protocol Tunneling"},
-                ],
-            },
-        ]
-    )
 
-    # Add domain IOCs
-    for i, domain in enumerate(domains[2:], start=3):
-        score = random.uniform(3.0, 9.8)
-        fallback_iocs.append(
-            {
-                "id": i,
-                "ioc_type": "domain",
-                "ioc_value": domain,
-                "value": domain,
-                "score": score,
-                "category": "high" if score > 7.5 else "medium" if score > 5 else "low",
-                "first_seen": random_timestamp(30, 15),
-                "last_seen": random_timestamp(10, 0),
-                "source_feed": random.choice(
-                    ["AlienVault", "Mandiant", "Recorded Future", "IBM X-Force"]
-                ),
-                "threat_class": random.choice(["malware", "phishing", "c2_server"]),
-                "malicious_probability": min(1.0, score / 10 * 1.2),
-                "feature_importance": [
-                    {"feature": "Domain Age", "weight": random.uniform(0.3, 0.5)},
-                    {"feature": "Entropy", "weight": random.uniform(0.2, 0.4)},
-                    {"feature": "TLD Rarity", "weight": random.uniform(0.1, 0.3)},
-                ],
-            }
-        )
+# Uploaded feed files larger than MAX_FEED_UPLOAD_BYTES are rejected with 413.
+# Files above FEED_UPLOAD_MMAP_THRESHOLD are spilled to a temporary file and
+# memory-mapped rather than read into a bytes object.
+MAX_FEED_UPLOAD_BYTES = int(
+    os.environ.get("SENTINELFORGE_MAX_FEED_UPLOAD_BYTES", 100 * 1024 * 1024)
+)
+FEED_UPLOAD_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+
+@contextmanager
+def open_upload_buffer(stream, size):
+    """Yield an uploaded file's content as bytes, or as a memoryview over a
+    read-only memory map once it is larger than FEED_UPLOAD_MMAP_THRESHOLD."""
+    if size <= FEED_UPLOAD_MMAP_THRESHOLD:
+        yield stream.read()
+        return
+
+    with tempfile.TemporaryFile() as tmp:
+        shutil.copyfileobj(stream, tmp)
+        tmp.flush()
+        with mmap.mmap(tmp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                yield view
+
+
+def bearer_api_key_header(api_key):
+    """Generic API key header used for feed hosts without a known scheme."""
+    return "Authorization", f"Bearer {api_key}"
+
+
+# Feed providers that expect their API key in a vendor-specific header, keyed
+# by URL hostname. Everything else gets a bearer token.
+API_KEY_STRATEGIES = {
+    "otx.alienvault.com": lambda api_key: ("X-OTX-API-KEY", api_key),
+    "www.virustotal.com": lambda api_key: ("x-apikey", api_key),
+    "virustotal.com": lambda api_key: ("x-apikey", api_key),
+}
+
+# Feed lookup by id for the endpoints that act on a single feed. Columns are
+# named so the format_config blob is not fetched when it is not needed.
+SQL_GET_FEED = """
+    SELECT id, name, url, feed_type, is_active, api_key
+    FROM threat_feeds WHERE id = ?
+"""
+
+# Threat feed columns that PATCH /api/feeds/<id> may change
+FEED_UPDATABLE_FIELDS = (
+    "name",
+    "description",
+    "url",
+    "feed_type",
+    "is_active",
+    "auto_import",
+    "import_frequency",
+    "format_config",
+)
 
-    # Add IP IOCs
-    next_id = len(fallback_iocs) + 1
-    for i, ip in enumerate(ips[2:], start=next_id):
-        score = random.uniform(4.0, 9.5)
-        fallback_iocs.append(
-            {
-                "id": i,
-                "ioc_type": "ip",
-                "ioc_value": ip,
-                "value": ip,
-                "score": score,
-                "category": "high" if score > 7.5 else "medium" if score > 5 else "low",
-                "first_seen": random_timestamp(30, 15),
-                "last_seen": random_timestamp(10, 0),
-                "source_feed": random.choice(
-                    ["FireEye", "Crowdstrike", "ThreatConnect", "Anomali"]
-                ),
-                "threat_class": random.choice(["c2_server", "ransomware", "ddos"]),
-                "malicious_probability": min(1.0, score / 10 * 1.2),
-                "feature_importance": [
-                    {"feature": "ASN Reputation", "weight": random.uniform(0.3, 0.5)},
-                    {"feature": "Geolocation", "weight": random.uniform(0.2, 0.4)},
-                    {"feature": "Port Scan", "weight": random.uniform(0.1, 0.3)},
-                ],
-            }
-        )
 
-    # Add Hash IOCs
-    next_id = len(fallback_iocs) + 1
-    for i, hash_value in enumerate(hashes, start=next_id):
-        score = random.uniform(5.0, 9.9)
-        fallback_iocs.append(
-            {
-                "id": i,
-                "ioc_type": "hash",
-                "ioc_value": hash_value,
-                "value": hash_value,
-                "score": score,
-                "category": "high" if score > 7.5 else "medium" if score > 5 else "low",
-                "first_seen": random_timestamp(30, 15),
-                "last_seen": random_timestamp(10, 0),
-                "source_feed": random.choice(
-                    ["VirusTotal", "Trellix", "Malwarebytes", "Kaspersky"]
-                ),
-                "threat_class": random.choice(["ransomware", "malware", "infostealer"]),
-                "malicious_probability": min(1.0, score / 10 * 1.2),
-                "feature_importance": [
-                    {"feature": "File Structure", "weight": random.uniform(0.4, 0.6)},
-                    {"feature": "API Calls", "weight": random.uniform(0.2, 0.3)},
-                    {"feature": "Packer Detection", "weight": random.uniform(0.1, 0.3)},
-                ],
-            }
-        )
+@lru_cache(maxsize=None)
+def _feed_update_sql(fields):
+    """Build the UPDATE for a tuple of FEED_UPDATABLE_FIELDS (plus updated_at)."""
+    assignments = ", ".join(f"{field} = ?" for field in (*fields, "updated_at"))
+    return f"UPDATE threat_feeds SET {assignments} WHERE id = ?"
 
-    # Add URL IOCs
-    next_id = len(fallback_iocs) + 1
-    for i, url in enumerate(urls, start=next_id):
-        score = random.uniform(4.5, 9.7)
-        fallback_iocs.append(
-            {
-                "id": i,
-                "ioc_type": "url",
-                "ioc_value": url,
-                "value": url,
-                "score": score,
-                "category": "high" if score > 7.5 else "medium" if score > 5 else "low",
-                "first_seen": random_timestamp(30, 15),
-                "last_seen": random_timestamp(10, 0),
-                "source_feed": random.choice(
-                    ["PhishTank", "URLhaus", "Symantec", "Cisco Talos"]
-                ),
-                "threat_class": random.choice(["phishing", "malware", "exploit"]),
-                "malicious_probability": min(1.0, score / 10 * 1.2),
-                "feature_importance": [
-                    {"feature": "URL Pattern", "weight": random.uniform(0.3, 0.5)},
-                    {
-                        "feature": "Domain Reputation",
-                        "weight": random.uniform(0.2, 0.4),
-                    },
-                    {"feature": "Content Analysis", "weight": random.uniform(0.2, 0.3)},
-                ],
-            }
-        )
 
-    # Generate 20 more random IOCs with varied timestamps for the last 14 days
-    next_id = len(fallback_iocs) + 1
-    ioc_types = ["domain", "ip", "url", "hash"]
-    ioc_sources = {"domain": domains, "ip": ips, "url": urls, "hash": hashes}
-
-    for i in range(20):
-        ioc_type = random.choice(ioc_types)
-        ioc_value = random.choice(ioc_sources[ioc_type])
-        score = random.uniform(1.0, 9.9)
-        # Generate timestamps more heavily weighted to recent days
-        days_ago = random.triangular(0, 14, 2)  # More weighted toward recent
-        fallback_iocs.append(
-            {
-                "id": next_id + i,
-                "ioc_type": ioc_type,
-                "ioc_value": ioc_value,
-                "value": ioc_value,
-                "score": score,
-                "category": "high" if score > 7.5 else "medium" if score > 5 else "low",
-                "first_seen": random_timestamp(days_ago + 10, days_ago + 5),
-                "last_seen": random_timestamp(days_ago + 2, days_ago),
-                "source_feed": random.choice(
-                    [
-                        "VirusTotal",
-                        "Trellix",
-                        "Malwarebytes",
-                        "Kaspersky",
-                        "AlienVault",
-                        "Mandiant",
-                        "Recorded Future",
-                        "IBM X-Force",
-                    ]
-                ),
-                "threat_class": get_ml_threat_class(ioc_value, ioc_type),
-                "malicious_probability": min(1.0, score / 10 * 1.2),
-                "feature_importance": get_feature_importance(ioc_type),
-            }
-        )
+@lru_cache(maxsize=256)
+def _parse_format_config(raw):
+    """Parse a stored format_config JSON blob, or {} if it is empty or invalid.
 
-    # Ensure we have a mix of critical/high/medium/low severity IOCs
-    # Add a few critical IOCs for dashboard impact
-    next_id = len(fallback_iocs) + 1
-    for i in range(5):
-        ioc_type = random.choice(ioc_types)
-        ioc_value = (
-            f"critical-{ioc_type}-{i}.malicious.com"
-            if ioc_type == "domain"
-            else random.choice(ioc_sources[ioc_type])
-        )
-        score = random.uniform(8.5, 9.9)  # Critical range
-        days_ago = random.triangular(0, 5, 1)  # Very recent threats
-        fallback_iocs.append(
-            {
-                "id": next_id + i,
-                "ioc_type": ioc_type,
-                "ioc_value": ioc_value,
-                "value": ioc_value,
-                "score": score,
-                "category": "critical",
-                "first_seen": random_timestamp(days_ago + 3, days_ago + 1),
-                "last_seen": random_timestamp(days_ago + 0.5, 0),
-                "source_feed": "Critical Threat Intelligence",
-                "threat_class": "APT",
-                "malicious_probability": 0.99,
-                "feature_importance": get_feature_importance(ioc_type),
-            }
-        )
+    Keyed on the stored text, so an edited config is simply a new entry. The
+    returned dict is shared between callers and must not be mutated.
+    """
+    if not raw:
+        return {}
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return {}
 
-    IOCS.clear()
-    IOCS.extend(fallback_iocs)
-    print(f"[API] Loaded {len(IOCS)} enhanced mock IOCs")
 
+# GET /api/feeds is polled by dashboards, so its serialized body is cached
+# until one of the feed endpoints changes the threat_feeds table. The ETag
+# carries a per-process token so a restart never validates a stale client copy.
+_FEEDS_ETAG_PREFIX = secrets.token_hex(4)
+_FEEDS_VERSION = 0
+_feeds_cache = {"version": None, "body": None}
+_feeds_lock = threading.Lock()
 
-# ============================================================================
-# THREAT FEED INGESTION ENDPOINTS
-# ============================================================================
+
+def bump_feeds_version():
+    """Invalidate the cached GET /api/feeds response after a feed write."""
+    global _FEEDS_VERSION
+    with _feeds_lock:
+        _FEEDS_VERSION += 1
 
 
 @app.route("/api/feeds", methods=["GET"])
@@ -3443,31 +3604,47 @@ def initialize_alerts():
 def get_feeds():
     """Get all registered threat feeds."""
     try:
-        conn = get_db_connection()
-        if not conn:
-            return jsonify({"error": "Database connection failed"}), 500
+        version = _FEEDS_VERSION
+        etag = f"{_FEEDS_ETAG_PREFIX}-{version}"
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+            response.set_etag(etag, weak=True)
+            return response
+
+        body = _feeds_cache["body"] if _feeds_cache["version"] == version else None
+        if body is None:
+            conn = get_db_connection()
+            if not conn:
+                return jsonify({"error": "Database connection failed"}), 500
 
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT f.*, u.username as created_by_username
-            FROM threat_feeds f
-            LEFT JOIN users u ON f.created_by = u.user_id
-            ORDER BY f.created_at DESC
-        """)
+            # Fetch plain tuples and zip them with the column names once,
+            # instead of building each row through the connection's row factory
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute("""
+                SELECT f.*, u.username as created_by_username
+                FROM threat_feeds f
+                LEFT JOIN users u ON f.created_by = u.user_id
+                ORDER BY f.created_at DESC
+            """)
+            cols = [d[0] for d in cursor.description]
+            feeds = [dict(zip(cols, row)) for row in cursor.fetchall()]
 
-        feeds = []
-        for row in cursor.fetchall():
-            feed = dict(row)
-            # Parse format_config JSON
-            if feed.get("format_config"):
-                try:
-                    feed["format_config"] = json.loads(feed["format_config"])
-                except (json.JSONDecodeError, TypeError):
-                    feed["format_config"] = {}
-            feeds.append(feed)
+            # Parse format_config JSON in place
+            for feed in feeds:
+                if feed.get("format_config"):
+                    feed["format_config"] = _parse_format_config(feed["format_config"])
 
-        conn.close()
-        return jsonify({"feeds": feeds})
+            conn.close()
+            body = app.json.dumpb({"feeds": feeds})
+            with _feeds_lock:
+                if _FEEDS_VERSION == version:
+                    _feeds_cache["version"] = version
+                    _feeds_cache["body"] = body
+
+        response = app.response_class(body, mimetype="application/json")
+        response.set_etag(etag, weak=True)
+        return response
 
     except Exception as e:
         return jsonify({"error": f"Failed to get feeds: {str(e)}"}), 500
@@ -3511,7 +3688,7 @@ def create_feed():
             return jsonify({"error": "Feed name already exists"}), 409
 
         # Insert new feed
-        now = datetime.datetime.utcnow()
+        now = datetime.datetime.now(datetime.timezone.utc)
         cursor.execute(
             """
             INSERT INTO threat_feeds (
@@ -3524,7 +3701,7 @@ def create_feed():
                 data.get("description", ""),
                 data.get("url", ""),
                 data["feed_type"],
-                json.dumps(data.get("format_config", {})),
+                orjson.dumps(data.get("format_config", {})).decode(),
                 data.get("is_active", True),
                 data.get("auto_import", False),
                 data.get("import_frequency", 24),
@@ -3537,6 +3714,7 @@ def create_feed():
         feed_id = cursor.lastrowid
         conn.commit()
         conn.close()
+        bump_feeds_version()
 
         return jsonify(
             {"message": "Feed created successfully", "feed_id": feed_id}
@@ -3560,41 +3738,26 @@ def update_feed(feed_id):
 
         # Check if feed exists
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM threat_feeds WHERE id = ?", (feed_id,))
+        cursor.execute(SQL_GET_FEED, (feed_id,))
         feed = cursor.fetchone()
         if not feed:
             conn.close()
             return jsonify({"error": "Feed not found"}), 404
 
-        # Build update query
-        update_fields = []
-        update_values = []
-
-        for field in [
-            "name",
-            "description",
-            "url",
-            "feed_type",
-            "is_active",
-            "auto_import",
-            "import_frequency",
-        ]:
-            if field in data:
-                update_fields.append(f"{field} = ?")
-                update_values.append(data[field])
-
-        if "format_config" in data:
-            update_fields.append("format_config = ?")
-            update_values.append(json.dumps(data["format_config"]))
-
+        # Fields are taken in FEED_UPDATABLE_FIELDS order so each combination
+        # maps to one cached statement string
+        update_fields = tuple(f for f in FEED_UPDATABLE_FIELDS if f in data)
         if update_fields:
-            update_fields.append("updated_at = ?")
-            update_values.append(datetime.datetime.utcnow())
+            update_values = [
+                orjson.dumps(data[f]).decode() if f == "format_config" else data[f]
+                for f in update_fields
+            ]
+            update_values.append(datetime.datetime.now(datetime.timezone.utc))
             update_values.append(feed_id)
 
-            query = f"UPDATE threat_feeds SET {', '.join(update_fields)} WHERE id = ?"
-            cursor.execute(query, update_values)
+            cursor.execute(_feed_update_sql(update_fields), update_values)
             conn.commit()
+            bump_feeds_version()
 
         conn.close()
         return jsonify({"message": "Feed updated successfully"})
@@ -3622,6 +3785,7 @@ def delete_feed(feed_id):
 
         conn.commit()
         conn.close()
+        bump_feeds_version()
         return jsonify({"message": "Feed deleted successfully"})
 
     except Exception as e:
@@ -3636,6 +3800,12 @@ def upload_feed():
     try:
         current_user = g.current_user
 
+        # Reject oversized requests before the form data is parsed
+        if (request.content_length or 0) > MAX_FEED_UPLOAD_BYTES:
+            return jsonify(
+                {"error": f"File exceeds maximum size of {MAX_FEED_UPLOAD_BYTES} bytes"}
+            ), 413
+
         # Check if file was uploaded
         if "file" not in request.files:
             return jsonify({"error": "No file uploaded"}), 400
@@ -3663,25 +3833,38 @@ def upload_feed():
                 }
             ), 400
 
-        # Read file content
-        try:
-            content = file.read().decode("utf-8")
-        except UnicodeDecodeError:
-            return jsonify({"error": "File must be UTF-8 encoded"}), 400
+        # Check the size before reading anything into memory
+        stream = file.stream
+        stream.seek(0, os.SEEK_END)
+        file_size = stream.tell()
+        stream.seek(0)
+        if file_size > MAX_FEED_UPLOAD_BYTES:
+            return jsonify(
+                {"error": f"File exceeds maximum size of {MAX_FEED_UPLOAD_BYTES} bytes"}
+            ), 413
 
         # Initialize ingestion service
-        ingestion_service = FeedIngestionService()
-
-        # Import IOCs
-        result = ingestion_service.import_from_content(
-            content=content,
-            filename=secure_filename(file.filename),
-            source_feed=source_feed,
-            user_id=current_user.user_id,
-            justification=justification,
-        )
+        ingestion_service = FeedIngestionService(db_path=IOC_DB_PATH)
+
+        # JSON and STIX stay as raw buffers for the parser
+        with open_upload_buffer(stream, file_size) as content:
+            if file_ext in (".csv", ".txt"):
+                try:
+                    content = str(content, "utf-8")
+                except UnicodeDecodeError:
+                    return jsonify({"error": "File must be UTF-8 encoded"}), 400
+
+            # Import IOCs
+            result = ingestion_service.import_from_content(
+                content=content,
+                filename=secure_filename(file.filename),
+                source_feed=source_feed,
+                user_id=current_user.user_id,
+                justification=justification,
+            )
 
         if result["success"]:
+            invalidate_stats_cache()
             return jsonify(
                 {
                     "message": "File imported successfully",
@@ -3724,7 +3907,7 @@ def import_from_feed(feed_id):
             return jsonify({"error": "Database connection failed"}), 500
 
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM threat_feeds WHERE id = ?", (feed_id,))
+        cursor.execute(SQL_GET_FEED, (feed_id,))
         feed = cursor.fetchone()
         conn.close()
 
@@ -3744,35 +3927,38 @@ def import_from_feed(feed_id):
 
             # Add API key if configured
             if feed.get("api_key"):
-                if "alienvault" in feed["url"].lower() or "otx" in feed["url"].lower():
-                    headers["X-OTX-API-KEY"] = feed["api_key"]
-                elif "virustotal" in feed["url"].lower():
-                    headers["x-apikey"] = feed["api_key"]
-                else:
-                    # Generic API key header
-                    headers["Authorization"] = f"Bearer {feed['api_key']}"
-
-            print(f"[FEED] Fetching from URL: {feed['url']}")
-            response = requests.get(feed["url"], headers=headers, timeout=30)
-
-            # Handle authentication errors specifically
-            if response.status_code == 401:
-                error_msg = (
-                    "Authentication required - please configure API key for this feed"
+                build_header = API_KEY_STRATEGIES.get(
+                    urlparse(feed["url"]).hostname, bearer_api_key_header
                 )
-                print(f"[FEED] Authentication error for {feed['name']}: {error_msg}")
-                return jsonify({"error": error_msg}), 401
-            elif response.status_code == 403:
-                error_msg = "Access forbidden - check API key permissions"
-                print(f"[FEED] Access forbidden for {feed['name']}: {error_msg}")
-                return jsonify({"error": error_msg}), 403
-            elif response.status_code == 429:
-                error_msg = "Rate limit exceeded - please try again later"
-                print(f"[FEED] Rate limit for {feed['name']}: {error_msg}")
-                return jsonify({"error": error_msg}), 429
+                name, value = build_header(feed["api_key"])
+                headers[name] = value
 
-            response.raise_for_status()
-            content = response.text
+            print(f"[FEED] Fetching from URL: {feed['url']}")
+            with FEED_SESSION.get(
+                feed["url"], headers=headers, timeout=30, stream=True
+            ) as response:
+                # Handle authentication errors specifically
+                if response.status_code == 401:
+                    error_msg = "Authentication required - please configure API key for this feed"
+                    print(
+                        f"[FEED] Authentication error for {feed['name']}: {error_msg}"
+                    )
+                    return jsonify({"error": error_msg}), 401
+                elif response.status_code == 403:
+                    error_msg = "Access forbidden - check API key permissions"
+                    print(f"[FEED] Access forbidden for {feed['name']}: {error_msg}")
+                    return jsonify({"error": error_msg}), 403
+                elif response.status_code == 429:
+                    error_msg = "Rate limit exceeded - please try again later"
+                    print(f"[FEED] Rate limit for {feed['name']}: {error_msg}")
+                    return jsonify({"error": error_msg}), 429
+
+                response.raise_for_status()
+
+                # Accumulate the raw body without decoding it to str
+                content = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    content += chunk
             print(
                 f"[FEED] Successfully fetched {len(content)} bytes from {feed['name']}"
             )
@@ -3792,38 +3978,46 @@ def import_from_feed(feed_id):
             print(f"[FEED] Request error for {feed['name']}: {error_msg}")
             return jsonify({"error": error_msg}), 400
 
-        # Initialize ingestion service
-        ingestion_service = FeedIngestionService()
-
-        # Import IOCs
-        result = ingestion_service.import_from_content(
-            content=content,
-            filename=f"feed_{feed_id}_{feed['feed_type']}",
-            source_feed=feed["name"],
-            user_id=current_user.user_id,
-            justification=justification,
-            feed_id=feed_id,
-        )
-
-        # Update feed last import status
+        # Import IOCs and record the outcome on the feed in one transaction
         conn = get_db_connection()
-        if conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        if not conn:
+            return jsonify({"error": "Database connection failed"}), 500
+
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            ingestion_service = FeedIngestionService(db_path=IOC_DB_PATH)
+            result = ingestion_service.import_from_content(
+                content=content,
+                filename=f"feed_{feed_id}_{feed['feed_type']}",
+                source_feed=feed["name"],
+                user_id=current_user.user_id,
+                justification=justification,
+                feed_id=feed_id,
+                conn=conn,
+            )
+
+            # Update feed last import status
+            conn.execute(
                 """
                 UPDATE threat_feeds
                 SET last_import = ?, last_import_status = ?, last_import_count = ?
                 WHERE id = ?
             """,
                 (
-                    datetime.datetime.utcnow(),
+                    datetime.datetime.now(datetime.timezone.utc),
                     result["import_status"],
                     result["imported_count"],
                     feed_id,
                 ),
             )
             conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
             conn.close()
+        bump_feeds_version()
+        invalidate_stats_cache()
 
         if result["success"]:
             return jsonify(
@@ -3852,6 +4046,32 @@ def import_from_feed(feed_id):
         return jsonify({"error": f"Import failed: {str(e)}"}), 500
 
 
+def sse_event(payload):
+    """Encode ``payload`` as a Server-Sent Events data frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+SSE_HEARTBEAT = b": heartbeat\n\n"
+
+# Headers for the progress streams. X-Accel-Buffering and no-transform stop
+# nginx and CDNs from buffering or compressing frames into larger chunks.
+SSE_HEADERS = {
+    "Cache-Control": "no-cache, no-transform",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Cache-Control",
+}
+SSE_SESSION_NOT_FOUND = sse_event({"type": "error", "error": "Session not found"})
+
+# Simulated health check sessions started by the demo endpoint
+DEMO_HEALTH_SESSIONS = {}
+
+# One monitor per process so progress sessions, the health cache and the
+# cron scheduler are shared by every health endpoint
+FEED_HEALTH_MONITOR = FeedHealthMonitor(db_path=IOC_DB_PATH)
+
+
 @app.route("/api/feeds/health", methods=["GET"])
 @require_authentication()
 @require_role([UserRole.ANALYST, UserRole.AUDITOR, UserRole.ADMIN])
@@ -3860,11 +4080,21 @@ def check_feeds_health():
     from datetime import datetime, timezone
 
     try:
+        # Serve the last scheduled/triggered run while it is fresh; the body
+        # is serialized once per run, so cache hits do no per-request work
+        cached = FEED_HEALTH_MONITOR.get_cached_health_response()
+        if cached:
+            body, age = cached
+            response = app.response_class(body, mimetype="application/json")
+            response.headers["Age"] = str(int(age))
+            return response
+
         # EMERGENCY FIX: Return mock data to prevent hanging
         # TODO: Fix the actual health monitoring system
         current_user = g.current_user
 
-        # Return mock health data
+        # Return mock health data; every entry shares one timestamp
+        now_iso = datetime.now(timezone.utc).isoformat()
         mock_feeds = [
             {
                 "feed_id": 1,
@@ -3873,7 +4103,7 @@ def check_feeds_health():
                 "status": "ok",
                 "http_code": 200,
                 "response_time_ms": 150,
-                "last_checked": datetime.now(timezone.utc).isoformat(),
+                "last_checked": now_iso,
                 "is_active": True,
                 "error_message": None,
             },
@@ -3884,7 +4114,7 @@ def check_feeds_health():
                 "status": "ok",
                 "http_code": 200,
                 "response_time_ms": 200,
-                "last_checked": datetime.now(timezone.utc).isoformat(),
+                "last_checked": now_iso,
                 "is_active": True,
                 "error_message": None,
             },
@@ -3895,7 +4125,7 @@ def check_feeds_health():
                 "status": "ok",
                 "http_code": 200,
                 "response_time_ms": 180,
-                "last_checked": datetime.now(timezone.utc).isoformat(),
+                "last_checked": now_iso,
                 "is_active": True,
                 "error_message": None,
             },
@@ -3919,7 +4149,7 @@ def check_feeds_health():
                     ),
                 },
                 "feeds": mock_feeds,
-                "checked_at": datetime.now(timezone.utc).isoformat(),
+                "checked_at": now_iso,
                 "checked_by": current_user.username,
                 "from_cache": False,
                 "mock_data": True,
@@ -3936,17 +4166,13 @@ def check_feeds_health():
 @require_role([UserRole.ANALYST, UserRole.AUDITOR, UserRole.ADMIN])
 def start_health_check_with_progress():
     """Start a health check with progress tracking."""
-    from services.feed_health_monitor import FeedHealthMonitor
-    import uuid
-    import threading
-
     try:
         # Parse request parameters
         data = request.get_json() if request.is_json else {}
         feed_id = data.get("feed_id") or request.args.get("feed_id", type=int)
 
         current_user = g.current_user
-        monitor = FeedHealthMonitor()
+        monitor = FEED_HEALTH_MONITOR
 
         # Generate unique session ID
         session_id = str(uuid.uuid4())
@@ -3998,76 +4224,47 @@ def start_health_check_with_progress():
 @require_role([UserRole.ANALYST, UserRole.AUDITOR, UserRole.ADMIN])
 def get_health_check_progress(session_id):
     """Get real-time progress for a health check session using Server-Sent Events."""
-    from services.feed_health_monitor import FeedHealthMonitor
-    from flask import Response
-    import json
-    import time
 
     def generate_progress_stream():
-        monitor = FeedHealthMonitor()
+        monitor = FEED_HEALTH_MONITOR
 
         # Send initial connection event
-        yield f"data: {json.dumps({'type': 'connected', 'session_id': session_id})}\n\n"
+        yield sse_event({"type": "connected", "session_id": session_id})
 
-        last_status = None
+        events = monitor.get_progress_events(session_id)
+        if events is None:
+            yield SSE_SESSION_NOT_FOUND
+            return
+
+        # Block until the monitor publishes an event; only send a heartbeat
+        # comment when nothing has happened for a while
         while True:
             try:
-                progress = monitor.get_progress(session_id)
-
-                if "error" in progress:
-                    yield f"data: {json.dumps({'type': 'error', 'error': progress['error']})}\n\n"
-                    break
-
-                # Only send updates when status changes
-                current_status = {
-                    "status": progress["status"],
-                    "completed_feeds": progress["completed_feeds"],
-                    "total_feeds": progress["total_feeds"],
-                    "current_feed": progress.get("current_feed"),
-                    "estimated_completion": progress.get("estimated_completion"),
-                }
-
-                if current_status != last_status:
-                    yield f"data: {json.dumps({'type': 'progress', **current_status})}\n\n"
-                    last_status = current_status
-
-                # Send individual feed results
-                if "results" in progress and progress["results"]:
-                    for result in progress["results"]:
-                        yield f"data: {json.dumps({'type': 'feed_result', 'result': result})}\n\n"
-                    # Clear results to avoid resending
-                    monitor.update_progress(session_id, results=[])
-
-                # Send errors
-                if "errors" in progress and progress["errors"]:
-                    for error in progress["errors"]:
-                        yield f"data: {json.dumps({'type': 'error', 'error': error})}\n\n"
-                    # Clear errors to avoid resending
-                    monitor.update_progress(session_id, errors=[])
-
-                # Check if completed or cancelled
-                if progress["status"] in ["completed", "cancelled", "error"]:
-                    yield f"data: {json.dumps({'type': 'finished', 'status': progress['status']})}\n\n"
-                    # Clean up session after a delay
-                    time.sleep(2)
-                    monitor.cleanup_progress_session(session_id)
-                    break
-
-                time.sleep(0.5)  # Poll every 500ms
+                event = events.get(timeout=15)
+            except queue.Empty:
+                yield SSE_HEARTBEAT
+                continue
 
+            try:
+                yield sse_event(event)
             except Exception as e:
-                yield f"data: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
+                yield sse_event({"type": "error", "error": str(e)})
+                break
+
+            # Check if completed or cancelled
+            if event["type"] == "progress" and event["status"] in (
+                "completed",
+                "cancelled",
+                "error",
+            ):
+                yield sse_event({"type": "finished", "status": event["status"]})
+                monitor.cleanup_progress_session(session_id)
                 break
 
     return Response(
         generate_progress_stream(),
         mimetype="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "Cache-Control",
-        },
+        headers=SSE_HEADERS,
     )
 
 
@@ -4076,10 +4273,8 @@ def get_health_check_progress(session_id):
 @require_role([UserRole.ANALYST, UserRole.AUDITOR, UserRole.ADMIN])
 def cancel_health_check(session_id):
     """Cancel a running health check session."""
-    from services.feed_health_monitor import FeedHealthMonitor
-
     try:
-        monitor = FeedHealthMonitor()
+        monitor = FEED_HEALTH_MONITOR
         success = monitor.cancel_progress_session(session_id)
 
         if success:
@@ -4096,9 +4291,6 @@ def cancel_health_check(session_id):
 @require_role([UserRole.ANALYST, UserRole.AUDITOR, UserRole.ADMIN])
 def demo_health_check_with_progress():
     """Demo health check with simulated progress for testing the UI."""
-    import uuid
-    import threading
-    import time
     from datetime import datetime, timezone
 
     try:
@@ -4141,56 +4333,74 @@ def demo_health_check_with_progress():
             "errors": [],
         }
 
-        # Store in a simple global dict for demo (in production, use proper storage)
-        if not hasattr(app, "demo_sessions"):
-            app.demo_sessions = {}
-        app.demo_sessions[session_id] = progress_data
+        # Writers bump the version and notify under the lock; SSE streams
+        # sleep on the condition until the version moves
+        session = {
+            "condition": threading.Condition(),
+            "version": 0,
+            "data": progress_data,
+        }
+        DEMO_HEALTH_SESSIONS[session_id] = session
+
+        def publish(**changes):
+            with session["condition"]:
+                progress_data.update(changes)
+                session["version"] += 1
+                session["condition"].notify_all()
+
+        def simulate_feed_check(i, feed):
+            # Update current feed
+            publish(
+                current_feed={"name": feed["name"], "url": feed["url"], "index": i + 1}
+            )
+
+            # Simulate checking time (1-3 seconds per feed)
+            time.sleep(1 + i * 0.5)
+
+            # Simulate result
+            status = "ok" if i < 4 else "timeout"  # Last feed fails
+            return {
+                "feed_id": i + 1,
+                "feed_name": feed["name"],
+                "url": feed["url"],
+                "status": status,
+                "http_code": 200 if status == "ok" else None,
+                "response_time_ms": 150 + (i * 50),
+                "error_message": None if status == "ok" else "Request timed out",
+                "last_checked": datetime.now(timezone.utc),
+                "is_active": True,
+            }
 
         def run_demo_health_check():
             try:
-                app.demo_sessions[session_id]["status"] = "running"
-
-                for i, feed in enumerate(demo_feeds):
-                    # Update current feed
-                    app.demo_sessions[session_id]["current_feed"] = {
-                        "name": feed["name"],
-                        "url": feed["url"],
-                        "index": i + 1,
-                    }
-
-                    # Simulate checking time (1-3 seconds per feed)
-                    time.sleep(2)
-
-                    # Simulate result
-                    status = "ok" if i < 4 else "timeout"  # Last feed fails
-                    result = {
-                        "feed_id": i + 1,
-                        "feed_name": feed["name"],
-                        "url": feed["url"],
-                        "status": status,
-                        "http_code": 200 if status == "ok" else None,
-                        "response_time_ms": 150 + (i * 50),
-                        "error_message": None
-                        if status == "ok"
-                        else "Request timed out",
-                        "last_checked": datetime.now(timezone.utc).isoformat(),
-                        "is_active": True,
-                    }
-
-                    app.demo_sessions[session_id]["results"].append(result)
-                    app.demo_sessions[session_id]["completed_feeds"] = i + 1
-                    app.demo_sessions[session_id]["current_feed"] = None
-
-                app.demo_sessions[session_id]["status"] = "completed"
+                publish(status="running")
+
+                # Check feeds concurrently like the real monitor; results are
+                # recorded from this thread as each check finishes
+                with ThreadPoolExecutor(max_workers=len(demo_feeds)) as executor:
+                    futures = [
+                        executor.submit(simulate_feed_check, i, feed)
+                        for i, feed in enumerate(demo_feeds)
+                    ]
+                    for future in as_completed(futures):
+                        result = future.result()
+                        with session["condition"]:
+                            progress_data["results"].append(result)
+                            progress_data["completed_feeds"] += 1
+                        publish()
 
-                # Clean up after 30 seconds
-                time.sleep(30)
-                if session_id in app.demo_sessions:
-                    del app.demo_sessions[session_id]
+                publish(current_feed=None, status="completed")
 
             except Exception as e:
-                app.demo_sessions[session_id]["status"] = "error"
-                app.demo_sessions[session_id]["errors"].append(str(e))
+                with session["condition"]:
+                    progress_data["errors"].append(str(e))
+                publish(status="error")
+
+            # Clean up after 30 seconds and wake any stream still waiting so
+            # it reports the expiry instead of sitting out its heartbeat
+            time.sleep(30)
+            DEMO_HEALTH_SESSIONS.pop(session_id, None)
+            publish()
 
         # Start background thread
         thread = threading.Thread(target=run_demo_health_check, daemon=True)
@@ -4214,73 +4424,80 @@ def demo_health_check_with_progress():
 @require_role([UserRole.ANALYST, UserRole.AUDITOR, UserRole.ADMIN])
 def get_demo_health_check_progress(session_id):
     """Get demo health check progress using Server-Sent Events."""
-    from flask import Response
-    import json
-    import time
 
     def generate_demo_progress_stream():
         # Send initial connection event
-        yield f"data: {json.dumps({'type': 'connected', 'session_id': session_id})}\n\n"
+        yield sse_event({"type": "connected", "session_id": session_id})
 
-        if not hasattr(app, "demo_sessions") or session_id not in app.demo_sessions:
-            yield f"data: {json.dumps({'type': 'error', 'error': 'Session not found'})}\n\n"
+        session = DEMO_HEALTH_SESSIONS.get(session_id)
+        if session is None:
+            yield SSE_SESSION_NOT_FOUND
             return
 
+        condition = session["condition"]
+        progress = session["data"]
+        seen_version = -1
         last_status = None
         last_results_count = 0
+        last_errors_count = 0
 
         while True:
             try:
-                if session_id not in app.demo_sessions:
-                    yield f"data: {json.dumps({'type': 'error', 'error': 'Session expired'})}\n\n"
+                # Sleep until the demo thread publishes a change
+                with condition:
+                    changed = condition.wait_for(
+                        lambda: session["version"] != seen_version, timeout=15
+                    )
+                    seen_version = session["version"]
+                    current_status = {
+                        "status": progress["status"],
+                        "completed_feeds": progress["completed_feeds"],
+                        "total_feeds": progress["total_feeds"],
+                        "current_feed": progress.get("current_feed"),
+                    }
+                    new_results = progress["results"][last_results_count:]
+                    new_errors = progress["errors"][last_errors_count:]
+
+                if DEMO_HEALTH_SESSIONS.get(session_id) is not session:
+                    yield sse_event({"type": "error", "error": "Session expired"})
                     break
 
-                progress = app.demo_sessions[session_id]
+                if not changed:
+                    yield SSE_HEARTBEAT
+                    continue
 
                 # Send progress updates
-                current_status = {
-                    "status": progress["status"],
-                    "completed_feeds": progress["completed_feeds"],
-                    "total_feeds": progress["total_feeds"],
-                    "current_feed": progress.get("current_feed"),
-                }
-
                 if current_status != last_status:
-                    yield f"data: {json.dumps({'type': 'progress', **current_status})}\n\n"
+                    yield sse_event({"type": "progress", **current_status})
                     last_status = current_status
 
-                # Send new results
-                results = progress.get("results", [])
-                if len(results) > last_results_count:
-                    for result in results[last_results_count:]:
-                        yield f"data: {json.dumps({'type': 'feed_result', 'result': result})}\n\n"
-                    last_results_count = len(results)
+                # Send every result recorded since the last wakeup in one frame
+                if new_results:
+                    yield sse_event(
+                        {"type": "feed_result_batch", "results": new_results}
+                    )
+                    last_results_count += len(new_results)
 
                 # Send errors
-                errors = progress.get("errors", [])
-                for error in errors:
-                    yield f"data: {json.dumps({'type': 'error', 'error': error})}\n\n"
+                for error in new_errors:
+                    yield sse_event({"type": "error", "error": error})
+                last_errors_count += len(new_errors)
 
                 # Check if completed
-                if progress["status"] in ["completed", "cancelled", "error"]:
-                    yield f"data: {json.dumps({'type': 'finished', 'status': progress['status']})}\n\n"
+                if current_status["status"] in ["completed", "cancelled", "error"]:
+                    yield sse_event(
+                        {"type": "finished", "status": current_status["status"]}
+                    )
                     break
 
-                time.sleep(0.5)  # Poll every 500ms
-
             except Exception as e:
-                yield f"data: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
+                yield sse_event({"type": "error", "error": str(e)})
                 break
 
     return Response(
         generate_demo_progress_stream(),
         mimetype="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "Cache-Control",
-        },
+        headers=SSE_HEADERS,
     )
 
 
@@ -4289,15 +4506,13 @@ def get_demo_health_check_progress(session_id):
 @require_role([UserRole.ANALYST, UserRole.AUDITOR, UserRole.ADMIN])
 def trigger_health_check():
     """Trigger a one-time health check for all active feeds (legacy endpoint)."""
-    from services.feed_health_monitor import FeedHealthMonitor
-
     try:
         # Parse request parameters
         data = request.get_json() if request.is_json else {}
         feed_id = data.get("feed_id") or request.args.get("feed_id", type=int)
 
         current_user = g.current_user
-        monitor = FeedHealthMonitor()
+        monitor = FEED_HEALTH_MONITOR
 
         # Run health check
         result = monitor.run_health_check(
@@ -4322,10 +4537,8 @@ def trigger_health_check():
 @require_role([UserRole.ADMIN])
 def manage_health_scheduler():
     """Manage the health check scheduler (Admin only)."""
-    from services.feed_health_monitor import FeedHealthMonitor
-
     try:
-        monitor = FeedHealthMonitor()
+        monitor = FEED_HEALTH_MONITOR
 
         if request.method == "GET":
             # Get scheduler status
@@ -4371,6 +4584,12 @@ def manage_health_scheduler():
         return jsonify({"error": f"Failed to manage scheduler: {str(e)}"}), 500
 
 
+# COUNT(*) walks every matching health log, so history totals are only
+# computed when asked for and are then reused per filter for a short while
+HEALTH_HISTORY_COUNT_TTL = 30
+_health_count_cache = {}
+
+
 @app.route("/api/feeds/health/history", methods=["GET"])
 @require_authentication()
 @require_role([UserRole.ANALYST, UserRole.AUDITOR, UserRole.ADMIN])
@@ -4384,17 +4603,23 @@ def get_feed_health_history():
         status = request.args.get("status")
         hours = request.args.get("hours", 24, type=int)  # Default last 24 hours
 
-        conn = get_db_connection()
+        # Keyset cursor from the previous page's next_cursor; when given it
+        # replaces the offset so deep pages don't rescan skipped rows
+        before_ts = request.args.get("before_ts")
+        before_id = request.args.get("before_id", type=int)
+        use_cursor = before_ts is not None and before_id is not None
+        include_total = request.args.get("include_total", "0") == "1"
+
+        conn = get_request_db()
         if not conn:
             return jsonify({"error": "Database connection failed"}), 500
 
         cursor = conn.cursor()
 
-        # Build query with filters
-        where_conditions = [
-            "last_checked >= datetime('now', '-{} hours')".format(hours)
-        ]
-        params = []
+        # Build query with filters; the window is bound so every request
+        # shape reuses the same prepared statement
+        where_conditions = ["last_checked >= datetime('now', ?)"]
+        params = [f"-{hours} hours"]
 
         if feed_id:
             where_conditions.append("feed_id = ?")
@@ -4407,42 +4632,71 @@ def get_feed_health_history():
         where_clause = " AND ".join(where_conditions)
 
         # Get total count
-        count_query = f"""
-            SELECT COUNT(*) FROM feed_health_logs
-            WHERE {where_clause}
-        """
-        cursor.execute(count_query, params)
-        total_count = cursor.fetchone()[0]
+        total_count = None
+        if include_total:
+            count_key = (where_clause, tuple(params))
+            cached = _health_count_cache.get(count_key)
+            if cached and time.monotonic() - cached[0] < HEALTH_HISTORY_COUNT_TTL:
+                total_count = cached[1]
+            else:
+                count_query = f"""
+                    SELECT COUNT(*) AS total FROM feed_health_logs
+                    WHERE {where_clause}
+                """
+                cursor.execute(count_query, params)
+                total_count = cursor.fetchone()["total"]
+                if len(_health_count_cache) >= 256:
+                    _health_count_cache.clear()
+                _health_count_cache[count_key] = (time.monotonic(), total_count)
 
         # Get paginated results
+        if use_cursor:
+            where_clause += " AND (fhl.last_checked, fhl.id) < (?, ?)"
+            params.extend([before_ts, before_id, limit])
+            page_clause = "LIMIT ?"
+            offset = 0
+        else:
+            params.extend([limit, offset])
+            page_clause = "LIMIT ? OFFSET ?"
+
         query = f"""
             SELECT fhl.*, u.username as checked_by_username
             FROM feed_health_logs fhl
             LEFT JOIN users u ON fhl.checked_by = u.user_id
             WHERE {where_clause}
-            ORDER BY fhl.last_checked DESC
-            LIMIT ? OFFSET ?
+            ORDER BY fhl.last_checked DESC, fhl.id DESC
+            {page_clause}
         """
-        params.extend([limit, offset])
+        # Tuple rows zipped with the column names read once from the
+        # description, rather than a dict_factory call plus a copy per row
+        cursor.row_factory = None
         cursor.execute(query, params)
+        cols = [d[0] for d in cursor.description]
+        health_logs = [dict(zip(cols, row)) for row in cursor]
+
+        next_cursor = None
+        if len(health_logs) == limit:
+            next_cursor = {
+                "next_ts": health_logs[-1]["last_checked"],
+                "next_id": health_logs[-1]["id"],
+            }
 
-        health_logs = []
-        for row in cursor.fetchall():
-            log = dict(row)
-            health_logs.append(log)
-
-        conn.close()
+        pagination = {
+            "limit": limit,
+            "offset": offset,
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor,
+        }
+        if include_total:
+            pagination["total"] = total_count
+            if not use_cursor:
+                pagination["has_more"] = offset + limit < total_count
 
         return jsonify(
             {
                 "success": True,
                 "health_logs": health_logs,
-                "pagination": {
-                    "total": total_count,
-                    "limit": limit,
-                    "offset": offset,
-                    "has_more": offset + limit < total_count,
-                },
+                "pagination": pagination,
                 "filters": {"feed_id": feed_id, "status": status, "hours": hours},
             }
         )
@@ -4451,6 +4705,158 @@ def get_feed_health_history():
         return jsonify({"error": f"Failed to get health history: {str(e)}"}), 500
 
 
+# Demo feed configurations for POST /api/admin/setup-demo-feeds, built once at
+# import. format_config is pre-serialized for the threat_feeds insert.
+DEMO_FEEDS = (
+    {
+        "name": "MalwareDomainList - Domains",
+        "feed_type": "txt",
+        "description": "Known malicious domains from MalwareDomainList project",
+        "url": "https://www.malwaredomainlist.com/hostslist/hosts.txt",
+        "ioc_type": "domain",
+        "format_config": {
+            "delimiter": "\n",
+            "comment_prefix": "#",
+            "extract_pattern": r"0\.0\.0\.0\s+([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
+        },
+        "sample_data": [
+            "malicious-domain1.com",
+            "evil-site.net",
+            "phishing-example.org",
+            "malware-host.biz",
+            "suspicious-domain.info",
+        ],
+    },
+    {
+        "name": "Abuse.ch URLhaus - Malware URLs",
+        "feed_type": "csv",
+        "description": "Malware URLs from Abuse.ch URLhaus database",
+        "url": "https://urlhaus.abuse.ch/downloads/csv_recent/",
+        "ioc_type": "url",
+        "format_config": {
+            "has_header": True,
+            "delimiter": ",",
+            "url_column": "url",
+            "threat_column": "threat",
+            "tags_column": "tags",
+        },
+        "sample_data": [
+            {
+                "url": "http://malicious-payload.xyz/download.php?id=1234",
+                "threat": "trojan",
+                "tags": "exe,payload",
+            },
+            {
+                "url": "https://evil-site.com/malware.zip",
+                "threat": "ransomware",
+                "tags": "zip,crypto",
+            },
+            {
+                "url": "http://phishing-bank.net/login.html",
+                "threat": "phishing",
+                "tags": "banking,credential",
+            },
+            {
+                "url": "https://fake-update.org/flash_update.exe",
+                "threat": "trojan",
+                "tags": "exe,fake-update",
+            },
+        ],
+    },
+    {
+        "name": "IPsum Threat Intelligence",
+        "feed_type": "txt",
+        "description": "Malicious IP addresses from IPsum aggregated feeds",
+        "url": "https://raw.githubusercontent.com/stamparm/ipsum/master/ipsum.txt",
+        "ioc_type": "ip",
+        "format_config": {
+            "delimiter": "\n",
+            "comment_prefix": "#",
+            "extract_pattern": r"^(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})",
+        },
+        "sample_data": [
+            "192.168.100.50",
+            "10.0.0.100",
+            "203.0.113.45",
+            "198.51.100.78",
+            "172.16.0.200",
+        ],
+    },
+    {
+        "name": "MITRE ATT&CK STIX Feed",
+        "feed_type": "json",
+        "description": "MITRE ATT&CK techniques and indicators in STIX 2.0 format",
+        "url": "https://raw.githubusercontent.com/mitre/cti/master/enterprise-attack/enterprise-attack.json",
+        "ioc_type": "mixed",
+        "format_config": {
+            "stix_version": "2.0",
+            "bundle_key": "objects",
+            "indicator_types": ["indicator", "malware", "tool"],
+        },
+        "sample_data": {
+            "type": "bundle",
+            "id": "bundle--demo-12345",
+            "objects": [
+                {
+                    "type": "indicator",
+                    "id": "indicator--demo-1",
+                    "created": "2024-01-01T00:00:00.000Z",
+                    "modified": "2024-01-01T00:00:00.000Z",
+                    "pattern": "[file:hashes.MD5 = 'd41d8cd98f00b204e9800998ecf8427e']",
+                    "labels": ["malicious-activity"],
+                },
+                {
+                    "type": "indicator",
+                    "id": "indicator--demo-2",
+                    "created": "2024-01-01T00:00:00.000Z",
+                    "modified": "2024-01-01T00:00:00.000Z",
+                    "pattern": "[domain-name:value = 'evil-command-control.com']",
+                    "labels": ["malicious-activity"],
+                },
+            ],
+        },
+    },
+    {
+        "name": "Emerging Threats - Compromised IPs",
+        "feed_type": "txt",
+        "description": "Compromised IP addresses from Emerging Threats",
+        "url": "https://rules.emergingthreats.net/fwrules/emerging-Block-IPs.txt",
+        "ioc_type": "ip",
+        "format_config": {
+            "delimiter": "\n",
+            "comment_prefix": "#",
+            "extract_pattern": r"^(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})",
+        },
+        "sample_data": [
+            "185.220.100.240",
+            "45.142.214.48",
+            "91.219.236.166",
+            "194.147.78.112",
+            "23.129.64.131",
+        ],
+    },
+)
+for _demo_feed in DEMO_FEEDS:
+    _demo_feed["format_config_json"] = orjson.dumps(
+        _demo_feed["format_config"]
+    ).decode()
+
+# Domain and MD5 comparisons in the demo STIX bundle's indicator patterns
+STIX_DEMO_PATTERN = re.compile(
+    r"\[(domain-name:value|file:hashes\.MD5)\s*=\s*'([^']+)'\]"
+)
+
+# Demo IOC rows go in with one executemany per feed; its summed rowcount is
+# the number of rows actually inserted. RETURNING is not used because
+# executemany discards returned rows (and then reports a rowcount of 0).
+SQL_INSERT_DEMO_IOC = """
+    INSERT OR IGNORE INTO iocs
+    (ioc_type, ioc_value, source_feed, severity, confidence,
+     tags, first_seen, last_seen, is_active, created_by, score, category)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 @app.route("/api/admin/setup-demo-feeds", methods=["POST"])
 @require_authentication()
 @require_role([UserRole.ADMIN])
@@ -4477,148 +4883,18 @@ def setup_demo_feeds():
 
         current_user = g.current_user
 
-        # Demo feed configurations
-        demo_feeds = [
-            {
-                "name": "MalwareDomainList - Domains",
-                "feed_type": "txt",
-                "description": "Known malicious domains from MalwareDomainList project",
-                "url": "https://www.malwaredomainlist.com/hostslist/hosts.txt",
-                "ioc_type": "domain",
-                "format_config": {
-                    "delimiter": "\n",
-                    "comment_prefix": "#",
-                    "extract_pattern": r"0\.0\.0\.0\s+([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-                },
-                "sample_data": [
-                    "malicious-domain1.com",
-                    "evil-site.net",
-                    "phishing-example.org",
-                    "malware-host.biz",
-                    "suspicious-domain.info",
-                ],
-            },
-            {
-                "name": "Abuse.ch URLhaus - Malware URLs",
-                "feed_type": "csv",
-                "description": "Malware URLs from Abuse.ch URLhaus database",
-                "url": "https://urlhaus.abuse.ch/downloads/csv_recent/",
-                "ioc_type": "url",
-                "format_config": {
-                    "has_header": True,
-                    "delimiter": ",",
-                    "url_column": "url",
-                    "threat_column": "threat",
-                    "tags_column": "tags",
-                },
-                "sample_data": [
-                    {
-                        "url": "http://malicious-payload.xyz/download.php?id=1234",
-                        "threat": "trojan",
-                        "tags": "exe,payload",
-                    },
-                    {
-                        "url": "https://evil-site.com/malware.zip",
-                        "threat": "ransomware",
-                        "tags": "zip,crypto",
-                    },
-                    {
-                        "url": "http://phishing-bank.net/login.html",
-                        "threat": "phishing",
-                        "tags": "banking,credential",
-                    },
-                    {
-                        "url": "https://fake-update.org/flash_update.exe",
-                        "threat": "trojan",
-                        "tags": "exe,fake-update",
-                    },
-                ],
-            },
-            {
-                "name": "IPsum Threat Intelligence",
-                "feed_type": "txt",
-                "description": "Malicious IP addresses from IPsum aggregated feeds",
-                "url": "https://raw.githubusercontent.com/stamparm/ipsum/master/ipsum.txt",
-                "ioc_type": "ip",
-                "format_config": {
-                    "delimiter": "\n",
-                    "comment_prefix": "#",
-                    "extract_pattern": r"^(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})",
-                },
-                "sample_data": [
-                    "192.168.100.50",
-                    "10.0.0.100",
-                    "203.0.113.45",
-                    "198.51.100.78",
-                    "172.16.0.200",
-                ],
-            },
-            {
-                "name": "MITRE ATT&CK STIX Feed",
-                "feed_type": "json",
-                "description": "MITRE ATT&CK techniques and indicators in STIX 2.0 format",
-                "url": "https://raw.githubusercontent.com/mitre/cti/master/enterprise-attack/enterprise-attack.json",
-                "ioc_type": "mixed",
-                "format_config": {
-                    "stix_version": "2.0",
-                    "bundle_key": "objects",
-                    "indicator_types": ["indicator", "malware", "tool"],
-                },
-                "sample_data": {
-                    "type": "bundle",
-                    "id": "bundle--demo-12345",
-                    "objects": [
-                        {
-                            "type": "indicator",
-                            "id": "indicator--demo-1",
-                            "created": "2024-01-01T00:00:00.000Z",
-                            "modified": "2024-01-01T00:00:00.000Z",
-                            "pattern": "[file:hashes.MD5 = 'd41d8cd98f00b204e9800998ecf8427e']",
-                            "labels": ["malicious-activity"],
-                        },
-                        {
-                            "type": "indicator",
-                            "id": "indicator--demo-2",
-                            "created": "2024-01-01T00:00:00.000Z",
-                            "modified": "2024-01-01T00:00:00.000Z",
-                            "pattern": "[domain-name:value = 'evil-command-control.com']",
-                            "labels": ["malicious-activity"],
-                        },
-                    ],
-                },
-            },
-            {
-                "name": "Emerging Threats - Compromised IPs",
-                "feed_type": "txt",
-                "description": "Compromised IP addresses from Emerging Threats",
-                "url": "https://rules.emergingthreats.net/fwrules/emerging-Block-IPs.txt",
-                "ioc_type": "ip",
-                "format_config": {
-                    "delimiter": "\n",
-                    "comment_prefix": "#",
-                    "extract_pattern": r"^(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})",
-                },
-                "sample_data": [
-                    "185.220.100.240",
-                    "45.142.214.48",
-                    "91.219.236.166",
-                    "194.147.78.112",
-                    "23.129.64.131",
-                ],
-            },
-        ]
-
-        conn = get_db_connection()
+        conn = get_request_db()
         if not conn:
             return jsonify({"error": "Database connection failed"}), 500
 
         cursor = conn.cursor()
         feeds_created = []
         iocs_imported = 0
+        now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
 
         try:
             # Register demo feeds
-            for feed in demo_feeds:
+            for feed in DEMO_FEEDS:
                 # Check if feed already exists
                 cursor.execute(
                     "SELECT id FROM threat_feeds WHERE name = ?", (feed["name"],)
@@ -4639,10 +4915,10 @@ def setup_demo_feeds():
                         feed["feed_type"],
                         feed["description"],
                         feed["url"],
-                        json.dumps(feed["format_config"]),
+                        feed["format_config_json"],
                         1,  # is_active
                         current_user.user_id,
-                        datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                        now_iso,
                     ),
                 )
 
@@ -4668,128 +4944,88 @@ def setup_demo_feeds():
                             "demo_setup",
                             "processing",
                             current_user.user_id,
-                            datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                            now_iso,
                         ),
                     )
 
                     import_log_id = cursor.lastrowid
 
-                    # Process sample data based on type
-                    feed_iocs_imported = 0
-
+                    # Build every IOC row for this feed, then insert them with
+                    # one executemany call
                     if feed["feed_type"] in ["txt"]:
-                        for ioc_value in feed["sample_data"]:
-                            cursor.execute(
-                                """
-                                INSERT OR IGNORE INTO iocs
-                                (ioc_type, ioc_value, source_feed, severity, confidence,
-                                 first_seen, last_seen, is_active, created_by, score, category)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """,
-                                (
-                                    feed["ioc_type"],
-                                    ioc_value,
-                                    feed["name"],
-                                    "medium",
-                                    85,
-                                    datetime.datetime.now(
-                                        datetime.timezone.utc
-                                    ).isoformat(),
-                                    datetime.datetime.now(
-                                        datetime.timezone.utc
-                                    ).isoformat(),
-                                    1,
-                                    current_user.user_id,
-                                    75,  # score
-                                    "malicious",  # category
-                                ),
+                        rows = [
+                            (
+                                feed["ioc_type"],
+                                ioc_value,
+                                feed["name"],
+                                "medium",
+                                85,
+                                None,
+                                now_iso,
+                                now_iso,
+                                1,
+                                current_user.user_id,
+                                75,  # score
+                                "malicious",  # category
                             )
-                            if cursor.rowcount > 0:
-                                feed_iocs_imported += 1
+                            for ioc_value in feed["sample_data"]
+                        ]
 
                     elif feed["feed_type"] == "csv":
-                        for item in feed["sample_data"]:
-                            cursor.execute(
-                                """
-                                INSERT OR IGNORE INTO iocs
-                                (ioc_type, ioc_value, source_feed, severity, confidence,
-                                 tags, first_seen, last_seen, is_active, created_by, score, category)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """,
-                                (
-                                    feed["ioc_type"],
-                                    item["url"],
-                                    feed["name"],
-                                    "high",
-                                    90,
-                                    item.get("tags", ""),
-                                    datetime.datetime.now(
-                                        datetime.timezone.utc
-                                    ).isoformat(),
-                                    datetime.datetime.now(
-                                        datetime.timezone.utc
-                                    ).isoformat(),
-                                    1,
-                                    current_user.user_id,
-                                    85,  # score
-                                    "malicious",  # category
-                                ),
+                        rows = [
+                            (
+                                feed["ioc_type"],
+                                item["url"],
+                                feed["name"],
+                                "high",
+                                90,
+                                item.get("tags", ""),
+                                now_iso,
+                                now_iso,
+                                1,
+                                current_user.user_id,
+                                85,  # score
+                                "malicious",  # category
                             )
-                            if cursor.rowcount > 0:
-                                feed_iocs_imported += 1
+                            for item in feed["sample_data"]
+                        ]
 
                     elif feed["feed_type"] == "json":
+                        rows = []
                         # Process STIX bundle
-                        if "objects" in feed["sample_data"]:
-                            for obj in feed["sample_data"]["objects"]:
-                                if obj.get("type") == "indicator":
-                                    # Extract IOC from STIX pattern
-                                    pattern = obj.get("pattern", "")
-                                    if "domain-name:value" in pattern:
-                                        ioc_value = (
-                                            pattern.split("'")[1]
-                                            if "'" in pattern
-                                            else ""
-                                        )
-                                        ioc_type = "domain"
-                                    elif "file:hashes.MD5" in pattern:
-                                        ioc_value = (
-                                            pattern.split("'")[1]
-                                            if "'" in pattern
-                                            else ""
-                                        )
-                                        ioc_type = "hash"
-                                    else:
-                                        continue
-
-                                    if ioc_value:
-                                        cursor.execute(
-                                            """
-                                            INSERT OR IGNORE INTO iocs
-                                            (ioc_type, ioc_value, source_feed, severity, confidence,
-                                             first_seen, last_seen, is_active, created_by, score, category)
-                                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                                        """,
-                                            (
-                                                ioc_type,
-                                                ioc_value,
-                                                feed["name"],
-                                                "high",
-                                                95,
-                                                datetime.datetime.now(
-                                                    datetime.timezone.utc
-                                                ).isoformat(),
-                                                datetime.datetime.now(
-                                                    datetime.timezone.utc
-                                                ).isoformat(),
-                                                1,
-                                                current_user.user_id,
-                                                90,  # score
-                                                "malicious",  # category
-                                            ),
-                                        )
-                                        if cursor.rowcount > 0:
-                                            feed_iocs_imported += 1
+                        for obj in feed["sample_data"].get("objects", []):
+                            if obj.get("type") != "indicator":
+                                continue
+
+                            # Extract IOC from STIX pattern
+                            match = STIX_DEMO_PATTERN.search(obj.get("pattern", ""))
+                            if match:
+                                rows.append(
+                                    (
+                                        "domain"
+                                        if match.group(1) == "domain-name:value"
+                                        else "hash",
+                                        match.group(2),
+                                        feed["name"],
+                                        "high",
+                                        95,
+                                        None,
+                                        now_iso,
+                                        now_iso,
+                                        1,
+                                        current_user.user_id,
+                                        90,  # score
+                                        "malicious",  # category
+                                    )
+                                )
+
+                    else:
+                        rows = []
+
+                    feed_iocs_imported = 0
+                    if rows:
+                        cursor.executemany(SQL_INSERT_DEMO_IOC, rows)
+                        feed_iocs_imported = max(cursor.rowcount, 0)
 
                     # Update import log
                     cursor.execute(
@@ -4805,7 +5041,7 @@ def setup_demo_feeds():
                             len(feed["sample_data"])
                             if isinstance(feed["sample_data"], list)
                             else 2,
-                            datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                            now_iso,
                             import_log_id,
                         ),
                     )
@@ -4813,6 +5049,8 @@ def setup_demo_feeds():
                     iocs_imported += feed_iocs_imported
 
             conn.commit()
+            bump_feeds_version()
+            invalidate_stats_cache()
 
             return jsonify(
                 {
@@ -4828,32 +5066,45 @@ def setup_demo_feeds():
         except Exception as e:
             conn.rollback()
             return jsonify({"error": f"Failed to setup demo feeds: {str(e)}"}), 500
-        finally:
-            conn.close()
 
     except Exception as e:
         return jsonify({"error": f"Failed to setup demo feeds: {str(e)}"}), 500
 
 
+# A single-feed check makes a live request to the feed, so its serialized
+# body is reused per feed for a while; the scheduler rechecks every feed each
+# minute anyway. Entries also carry the feeds version so a feed edit drops them.
+SINGLE_FEED_HEALTH_TTL = 30
+_single_feed_health_cache = {}
+
+
 @app.route("/api/feeds/<int:feed_id>/health", methods=["GET"])
 @require_authentication()
 @require_role([UserRole.ANALYST, UserRole.AUDITOR, UserRole.ADMIN])
 def get_single_feed_health(feed_id):
     """Get health status for a specific feed."""
-    import requests
-    from requests.adapters import HTTPAdapter
-    from urllib3.util.retry import Retry
     import time
     from datetime import datetime, timezone
 
     try:
-        conn = get_db_connection()
+        version = _FEEDS_VERSION
+        cached = _single_feed_health_cache.get(feed_id)
+        if cached and cached[1] == version:
+            age = time.monotonic() - cached[0]
+            if age < SINGLE_FEED_HEALTH_TTL:
+                response = app.response_class(cached[2], mimetype="application/json")
+                response.headers["Age"] = str(int(age))
+                return response
+
+        conn = get_request_db()
         if not conn:
             return jsonify({"error": "Database connection failed"}), 500
 
         cursor = conn.cursor()
 
-        # Get feed details
+        # Read the feed and its recent history back to back in one read
+        # transaction, and release it before the network check starts
+        cursor.execute("BEGIN")
         cursor.execute(
             """
             SELECT id, name, url, feed_type, format_config, is_active
@@ -4862,17 +5113,8 @@ def get_single_feed_health(feed_id):
         """,
             (feed_id,),
         )
-
         feed = cursor.fetchone()
-        if not feed:
-            conn.close()
-            return jsonify({"error": "Feed not found"}), 404
-
-        if not feed["url"]:
-            conn.close()
-            return jsonify({"error": "Feed has no URL configured"}), 400
 
-        # Get recent health history
         cursor.execute(
             """
             SELECT * FROM feed_health_logs
@@ -4882,41 +5124,28 @@ def get_single_feed_health(feed_id):
         """,
             (feed_id,),
         )
-
         recent_checks = [dict(row) for row in cursor.fetchall()]
+        conn.commit()
+
+        if not feed:
+            return jsonify({"error": "Feed not found"}), 404
+
+        if not feed["url"]:
+            return jsonify({"error": "Feed has no URL configured"}), 400
 
         # Perform new health check
         feed_name = feed["name"]
         url = feed["url"]
-        feed_type = feed["feed_type"]
         format_config = feed.get("format_config")
 
         # Parse format_config if it's a JSON string
         if isinstance(format_config, str):
-            try:
-                format_config = json.loads(format_config)
-            except (json.JSONDecodeError, TypeError):
-                format_config = {}
+            format_config = _parse_format_config(format_config)
 
         start_time = time.time()
         last_checked = datetime.now(timezone.utc)
         current_user = g.current_user
 
-        # Setup HTTP session
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            method_whitelist=["HEAD", "GET"],
-            backoff_factor=0.3,
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        # Determine request method
-        use_head = feed_type in ["csv", "txt"] and "phishtank" not in feed_name.lower()
-
         # Initialize response variable
         response = None
 
@@ -4939,26 +5168,32 @@ def get_single_feed_health(feed_id):
                 elif auth_config.get("username") and auth_config.get("password"):
                     auth = (auth_config["username"], auth_config["password"])
 
-            # Make request
-            if use_head:
-                response = session.head(
-                    url, headers=headers, params=params, auth=auth, timeout=10
-                )
-            else:
-                response = session.get(
+            # Make request; servers that refuse HEAD get a one-byte ranged GET
+            response = HEALTH_SESSION.head(
+                url,
+                headers=headers,
+                params=params,
+                auth=auth,
+                timeout=10,
+                allow_redirects=True,
+            )
+            if response.status_code in (405, 501):
+                # Only the status line is needed; leaving the block returns
+                # the connection to the pool even if reading headers fails
+                with HEALTH_SESSION.get(
                     url,
-                    headers=headers,
+                    headers={**headers, "Range": "bytes=0-0"},
                     params=params,
                     auth=auth,
                     timeout=10,
                     stream=True,
-                )
-                response.close()
+                ) as response:
+                    pass
 
             response_time_ms = int((time.time() - start_time) * 1000)
 
             # Determine status
-            if response.status_code == 200:
+            if response.status_code in (200, 206):
                 status = "ok"
             elif response.status_code in [401, 403]:
                 status = "unauthorized"
@@ -5010,9 +5245,9 @@ def get_single_feed_health(feed_id):
         )
 
         conn.commit()
-        conn.close()
 
         # Create current health result
+        is_active = bool(feed["is_active"])
         current_health = {
             "feed_id": feed_id,
             "feed_name": feed_name,
@@ -5021,11 +5256,11 @@ def get_single_feed_health(feed_id):
             "http_code": getattr(response, "status_code", None),
             "response_time_ms": response_time_ms,
             "last_checked": last_checked.isoformat(),
-            "is_active": bool(feed["is_active"]),
+            "is_active": is_active,
             "error_message": error_message,
         }
 
-        return jsonify(
+        body = app.json.dumpb(
             {
                 "success": True,
                 "current_health": current_health,
@@ -5035,92 +5270,227 @@ def get_single_feed_health(feed_id):
                     "name": feed["name"],
                     "url": feed["url"],
                     "feed_type": feed["feed_type"],
-                    "is_active": bool(feed["is_active"]),
+                    "is_active": is_active,
                 },
             }
         )
+        _single_feed_health_cache[feed_id] = (time.monotonic(), version, body)
+        return app.response_class(body, mimetype="application/json")
 
     except Exception as e:
         return jsonify({"error": f"Health check failed: {str(e)}"}), 500
 
 
+def encode_page_cursor(timestamp, row_id):
+    """Encode a (timestamp, id) keyset position as an opaque URL-safe token."""
+    return base64.urlsafe_b64encode(f"{timestamp}|{row_id}".encode()).decode()
+
+
+def decode_page_cursor(token):
+    """Decode a token from encode_page_cursor; raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(token.encode()).decode()
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    timestamp, sep, row_id = raw.rpartition("|")
+    if not sep:
+        raise ValueError("Invalid cursor")
+    return timestamp, int(row_id)
+
+
+# Import logs only store feed and user ids; the display names come from these
+# small id -> name maps instead of joining both tables on every page. Feed
+# names reload after any feed write (the GET /api/feeds cache version), and
+# usernames, which never change once created, reload when a log references a
+# user the map has not seen yet.
+_import_log_names = {"feeds_version": None, "feeds": {}, "users": None}
+
+
+def _load_name_map(conn, query):
+    """Run a two-column id/name query and return it as a dict."""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(query)
+    names = dict(cursor.fetchall())
+    cursor.close()
+    return names
+
+
+def _import_log_feed_names(conn):
+    """Return {feed_id: name}, reloading it after a feed write."""
+    version = _FEEDS_VERSION
+    if _import_log_names["feeds_version"] != version:
+        _import_log_names["feeds"] = _load_name_map(
+            conn, "SELECT id, name FROM threat_feeds"
+        )
+        _import_log_names["feeds_version"] = version
+    return _import_log_names["feeds"]
+
+
+def _import_log_user_names(conn, reload=False):
+    """Return {user_id: username}, loading it on first use or when asked."""
+    if reload or _import_log_names["users"] is None:
+        _import_log_names["users"] = _load_name_map(
+            conn, "SELECT user_id, username FROM users"
+        )
+    return _import_log_names["users"]
+
+
+@lru_cache(maxsize=None)
+def _import_logs_sql(by_feed, by_status, keyset):
+    """Build the import logs page query for one filter/paging combination.
+
+    Offset pages read the filtered total from a window count in the same
+    statement; keyset pages skip counting entirely. Callers fetch one row
+    past the page to tell whether another page follows.
+
+    SQLite validates and minifies each stored errors blob into errors_json
+    so it can be written to the response as-is: NULL when the column is
+    empty, '[]' when it holds malformed JSON.
+    """
+    total_column = "" if keyset else ", COUNT(*) OVER () AS total_count"
+    query = f"""
+        SELECT l.*,
+            CASE WHEN json_valid(l.errors) THEN json(l.errors)
+                 WHEN l.errors != '' THEN '[]' END AS errors_json{total_column}
+        FROM feed_import_logs l
+        WHERE 1=1
+    """
+    if by_feed:
+        query += " AND l.feed_id = ?"
+    if by_status:
+        query += " AND l.import_status = ?"
+    if keyset:
+        query += " AND (l.timestamp, l.id) < (?, ?)"
+        query += " ORDER BY l.timestamp DESC, l.id DESC LIMIT ?"
+    else:
+        query += " ORDER BY l.timestamp DESC, l.id DESC LIMIT ? OFFSET ?"
+    return query
+
+
 @app.route("/api/feeds/import-logs", methods=["GET"])
 @require_authentication()
 @require_role([UserRole.ANALYST, UserRole.AUDITOR, UserRole.ADMIN])
 def get_import_logs():
     """Get feed import logs with filtering."""
     try:
-        # Parse query parameters
-        limit = request.args.get("limit", 50, type=int)
-        offset = request.args.get("offset", 0, type=int)
-        feed_id = request.args.get("feed_id", type=int)
-        import_status = request.args.get("import_status")
+        # Parse query parameters; malformed numbers are rejected rather than
+        # silently replaced by their defaults
+        args = request.args
+        try:
+            limit = int(args.get("limit", 50))
+            offset = int(args.get("offset", 0))
+            feed_id = args.get("feed_id")
+            feed_id = int(feed_id) if feed_id else None
+        except ValueError:
+            return jsonify({"error": "limit, offset and feed_id must be integers"}), 400
+        import_status = args.get("import_status")
+
+        # Keyset cursor from the previous page's next_cursor; when given it
+        # replaces the offset so deep pages don't rescan skipped rows
+        page_cursor = args.get("cursor")
+        if page_cursor:
+            try:
+                before_ts, before_id = decode_page_cursor(page_cursor)
+            except ValueError:
+                return jsonify({"error": "Invalid cursor"}), 400
 
-        conn = get_db_connection()
+        conn = get_request_db()
         if not conn:
             return jsonify({"error": "Database connection failed"}), 500
 
-        # Build query
-        query = """
-            SELECT l.*, f.name as feed_name, u.username as user_name
-            FROM feed_import_logs l
-            LEFT JOIN threat_feeds f ON l.feed_id = f.id
-            LEFT JOIN users u ON l.user_id = u.user_id
-            WHERE 1=1
-        """
+        # Build query; one cached statement per filter/paging shape
+        query = _import_logs_sql(bool(feed_id), bool(import_status), bool(page_cursor))
         params = []
-
         if feed_id:
-            query += " AND l.feed_id = ?"
             params.append(feed_id)
-
         if import_status:
-            query += " AND l.import_status = ?"
             params.append(import_status)
+        if page_cursor:
+            params.extend([before_ts, before_id, limit + 1])
+        else:
+            params.extend([limit + 1, offset])
 
-        query += " ORDER BY l.timestamp DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
-
+        # Plain tuples are zipped with the column names read once from the
+        # description; errors_json and total_count trail the row, and
+        # dropping their names makes zip leave them out of the log dict
         cursor = conn.cursor()
+        cursor.row_factory = None
         cursor.execute(query, params)
-
-        logs = []
-        for row in cursor.fetchall():
-            log = dict(row)
-            # Parse errors JSON
-            if log.get("errors"):
-                try:
-                    log["errors"] = json.loads(log["errors"])
-                except (json.JSONDecodeError, TypeError):
-                    log["errors"] = []
-            logs.append(log)
-
-        # Get total count
-        count_query = """
-            SELECT COUNT(*) as count FROM feed_import_logs l
-            WHERE 1=1
-        """
-        count_params = []
-
-        if feed_id:
-            count_query += " AND l.feed_id = ?"
-            count_params.append(feed_id)
-
-        if import_status:
-            count_query += " AND l.import_status = ?"
-            count_params.append(import_status)
-
-        cursor.execute(count_query, count_params)
-        total = cursor.fetchone()["count"]
-
-        conn.close()
-        return jsonify({"logs": logs, "total": total})
+        cols = [d[0] for d in cursor.description]
+        if not page_cursor:
+            cols.pop()
+        cols.pop()
+        errors_json_idx = len(cols)
+        first = cursor.fetchone()
+
+        total = None
+        if first is not None and not page_cursor:
+            total = first[-1]
+        elif not page_cursor and offset == 0:
+            total = 0
+
+        feed_names = _import_log_feed_names(conn)
+        user_names = _import_log_user_names(conn)
+
+        def generate_logs():
+            # Rows are serialized one at a time straight off the cursor, so
+            # large pages never hold every log dict in memory at once
+            nonlocal user_names
+            dumpb = app.json.dumpb
+            has_more = False
+            last = None
+            users_reloaded = False
+            try:
+                yield b'{"logs":['
+                rows = itertools.chain([first], cursor) if first else ()
+                for count, row in enumerate(rows):
+                    if count == limit:
+                        has_more = True
+                        break
+                    log = dict(zip(cols, row))
+                    # Manual uploads have no feed row; keep their stored name
+                    log["feed_name"] = feed_names.get(log["feed_id"], log["feed_name"])
+                    user_id = log["user_id"]
+                    if user_id not in user_names and user_id and not users_reloaded:
+                        user_names = _import_log_user_names(conn, reload=True)
+                        users_reloaded = True
+                    log["user_name"] = user_names.get(user_id)
+                    errors_json = row[errors_json_idx]
+                    if errors_json is None:
+                        body = dumpb(log)
+                    else:
+                        # Splice SQLite's validated JSON in as the last key
+                        del log["errors"]
+                        body = (
+                            dumpb(log)[:-1]
+                            + b',"errors":'
+                            + errors_json.encode()
+                            + b"}"
+                        )
+                    yield body if count == 0 else b"," + body
+                    last = log
+            finally:
+                # Release the statement; the connection stays in the pool
+                cursor.close()
+
+            next_cursor = None
+            if has_more:
+                next_cursor = encode_page_cursor(last["timestamp"], last["id"])
+            tail = {"total": total, "has_more": has_more, "next_cursor": next_cursor}
+            yield b"]," + dumpb(tail)[1:]
+
+        return app.response_class(generate_logs(), mimetype="application/json")
 
     except Exception as e:
         return jsonify({"error": f"Failed to get import logs: {str(e)}"}), 500
 
 
 if __name__ == "__main__":
+    # Development server with the reloader and debugger. Production runs
+    # through production_api_server.py, which initializes the same tables
+    # and serves this app with gunicorn gthread workers (API_WORKERS x
+    # API_THREADS).
     port = 5059
     print(f"Starting API server on port {port}")
 
@@ -5135,6 +5505,14 @@ if __name__ == "__main__":
     initialize_iocs()  # Initialize IOCS list before starting the server
     initialize_alerts()  # Initialize ALERTS list before starting the server
 
+    debug = True
+
+    # With the reloader on, this module runs in both the file watcher and the
+    # child that actually serves requests; only the child needs the health
+    # jobs. They stay in this process because the health endpoints read the
+    # shared FEED_HEALTH_MONITOR cache and progress sessions.
+    run_background_jobs = not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true"
+
     # Run startup health check in background (non-blocking)
     import threading
 
@@ -5146,16 +5524,10 @@ if __name__ == "__main__":
         except Exception as e:
             print(f"⚠️  Startup health check failed: {e}")
 
-    health_thread = threading.Thread(target=background_health_check, daemon=True)
-    health_thread.start()
-    print("🏥 Health check started in background")
-
     # Start health check scheduler in background (non-blocking)
     def background_scheduler():
         try:
-            from services.feed_health_monitor import FeedHealthMonitor
-
-            monitor = FeedHealthMonitor()
+            monitor = FEED_HEALTH_MONITOR
 
             # Start with 1-minute interval for testing
             if monitor.start_cron_scheduler(interval_minutes=1):
@@ -5165,9 +5537,14 @@ if __name__ == "__main__":
         except Exception as e:
             print(f"⚠️  Health scheduler startup failed: {e}")
 
-    scheduler_thread = threading.Thread(target=background_scheduler, daemon=True)
-    scheduler_thread.start()
-    print("⏰ Health scheduler started in background")
+    if run_background_jobs:
+        health_thread = threading.Thread(target=background_health_check, daemon=True)
+        health_thread.start()
+        print("🏥 Health check started in background")
+
+        scheduler_thread = threading.Thread(target=background_scheduler, daemon=True)
+        scheduler_thread.start()
+        print("⏰ Health scheduler started in background")
 
     print("🌐 API Server ready on http://0.0.0.0:5059")
-    app.run(host="0.0.0.0", port=port, debug=True)
+    app.run(host="0.0.0.0", port=port, debug=debug)
@@ -20,6 +20,7 @@ Usage:
         pass
 """
 
+import os
 import sqlite3
 import hashlib
 import secrets
@@ -28,7 +29,7 @@ import json
 import datetime
 from enum import Enum
 from functools import wraps
-from typing import List, Optional, Dict, Any
+from typing import Collection, List, Optional, Dict, Any
 from flask import request, jsonify, g
 
 
@@ -60,7 +61,7 @@ class User:
         self.is_active = is_active
         self.created_at = created_at
 
-    def has_permission(self, required_roles: List[UserRole]) -> bool:
+    def has_permission(self, required_roles: Collection[UserRole]) -> bool:
         """Check if user has any of the required roles."""
         return self.is_active and self.role in required_roles
 
@@ -105,10 +106,17 @@ class AuthorizationError(Exception):
     pass
 
 
+# Users live in the IOC database; see IOC_DB_PATH in api_server.py
+AUTH_DB_PATH = os.environ.get(
+    "SENTINELFORGE_DB_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "ioc_store.db"),
+)
+
+
 def get_db_connection():
     """Get database connection for auth operations."""
     try:
-        conn = sqlite3.connect("/Users/Collins/sentinelforge/ioc_store.db")
+        conn = sqlite3.connect(AUTH_DB_PATH)
         conn.row_factory = sqlite3.Row
         return conn
     except Exception as e:
@@ -717,6 +725,9 @@ def get_demo_user(user_id: int) -> Optional[User]:
 
 def require_role(required_roles: List[UserRole]):
     """Decorator to require specific roles for endpoint access."""
+    # Resolved once per decorated endpoint rather than on every request
+    allowed_roles = frozenset(required_roles)
+    denied_message = f"This action requires one of the following roles: {[r.value for r in required_roles]}"
 
     def decorator(f):
         @wraps(f)
@@ -731,11 +742,11 @@ def require_role(required_roles: List[UserRole]):
                     }
                 ), 401
 
-            if not user.has_permission(required_roles):
+            if not user.has_permission(allowed_roles):
                 return jsonify(
                     {
                         "error": "Insufficient permissions",
-                        "message": f"This action requires one of the following roles: {[r.value for r in required_roles]}",
+                        "message": denied_message,
                         "user_role": user.role.value,
                     }
                 ), 403
@@ -10,6 +10,7 @@ Features added:
 - IOC audit logging table
 - Soft delete functionality
 - User tracking for IOC operations
+- Trigram full-text index for IOC search
 
 Usage:
     python migrate_ioc_enhancements.py
@@ -150,9 +151,22 @@ def create_indexes(cursor):
         ("idx_iocs_active", "iocs", "is_active"),
         ("idx_iocs_created_at", "iocs", "created_at"),
         ("idx_iocs_severity", "iocs", "severity"),
+        ("idx_iocs_score", "iocs", "score DESC"),
+        ("idx_iocs_type_score", "iocs", "ioc_type, score DESC"),
+        ("idx_iocs_value_lower", "iocs", "LOWER(ioc_value)"),
         ("idx_ioc_audit_timestamp", "ioc_audit_logs", "timestamp"),
         ("idx_ioc_audit_action", "ioc_audit_logs", "action"),
         ("idx_ioc_audit_user", "ioc_audit_logs", "user_id"),
+        (
+            "idx_feed_import_logs_timestamp_id",
+            "feed_import_logs",
+            "timestamp DESC, id DESC",
+        ),
+        (
+            "idx_feed_import_logs_feed_status_ts",
+            "feed_import_logs",
+            "feed_id, import_status, timestamp DESC, id DESC",
+        ),
     ]
 
     for index_name, table_name, column_name in indexes:
@@ -165,6 +179,49 @@ def create_indexes(cursor):
             print(f"  ⚠️  Error creating index {index_name}: {e}")
 
 
+def create_search_index(cursor):
+    """Create the trigram full-text index behind IOC substring search."""
+    print("🔄 Creating IOC search index...")
+
+    statements = [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS iocs_fts USING fts5(
+            ioc_value, tags, content='iocs', tokenize='trigram'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS iocs_fts_insert AFTER INSERT ON iocs BEGIN
+            INSERT INTO iocs_fts (rowid, ioc_value, tags)
+            VALUES (new.rowid, new.ioc_value, new.tags);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS iocs_fts_delete AFTER DELETE ON iocs BEGIN
+            INSERT INTO iocs_fts (iocs_fts, rowid, ioc_value, tags)
+            VALUES ('delete', old.rowid, old.ioc_value, old.tags);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS iocs_fts_update
+        AFTER UPDATE OF ioc_value, tags ON iocs BEGIN
+            INSERT INTO iocs_fts (iocs_fts, rowid, ioc_value, tags)
+            VALUES ('delete', old.rowid, old.ioc_value, old.tags);
+            INSERT INTO iocs_fts (rowid, ioc_value, tags)
+            VALUES (new.rowid, new.ioc_value, new.tags);
+        END
+        """,
+        # Index the rows that predate the triggers
+        "INSERT INTO iocs_fts (iocs_fts) VALUES ('rebuild')",
+    ]
+
+    try:
+        for statement in statements:
+            cursor.execute(statement)
+        print("  ✅ IOC search index created")
+    except sqlite3.Error as e:
+        print(f"  ⚠️  Error creating IOC search index: {e}")
+
+
 def verify_migration(cursor):
     """Verify the migration was successful."""
     print("🔍 Verifying migration...")
@@ -241,6 +298,7 @@ def main():
         create_ioc_audit_table(cursor)
         populate_default_values(cursor)
         create_indexes(cursor)
+        create_search_index(cursor)
 
         # Commit changes
         conn.commit()
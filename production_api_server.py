@@ -16,7 +16,8 @@ from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import the Flask app from api_server
-from api_server import app, init_database, init_auth_tables
+from api_server import app, initialize_alerts, initialize_iocs
+from auth import init_auth_tables
 
 # Configure production logging
 logging.basicConfig(
@@ -36,7 +37,10 @@ class ProductionServer:
         self.app = app
         self.port = int(os.environ.get("API_PORT", 5059))
         self.host = os.environ.get("API_HOST", "0.0.0.0")
+        # Progress sessions and SSE streams live in process memory, so
+        # concurrency comes from threads within a worker by default
         self.workers = int(os.environ.get("API_WORKERS", 1))
+        self.threads = int(os.environ.get("API_THREADS", 8))
         self.is_running = False
 
         # Ensure logs directory exists
@@ -55,8 +59,10 @@ class ProductionServer:
         """Perform basic health checks"""
         try:
             # Check database connectivity
-            init_database()
-            init_auth_tables()
+            if not init_auth_tables():
+                raise RuntimeError("authentication tables could not be initialized")
+            initialize_iocs()
+            initialize_alerts()
             logger.info("✅ Database health check passed")
             return True
         except Exception as e:
@@ -73,6 +79,7 @@ class ProductionServer:
         logger.info(f"📍 Host: {self.host}")
         logger.info(f"🔌 Port: {self.port}")
         logger.info(f"👥 Workers: {self.workers}")
+        logger.info(f"🧵 Threads per worker: {self.threads}")
 
         # Configure Flask app for production
         self.app.config.update({"DEBUG": False, "TESTING": False, "ENV": "production"})
@@ -102,8 +109,8 @@ class ProductionServer:
             options = {
                 "bind": f"{self.host}:{self.port}",
                 "workers": self.workers,
-                "worker_class": "sync",
-                "worker_connections": 1000,
+                "worker_class": "gthread",
+                "threads": self.threads,
                 "timeout": 30,
                 "keepalive": 2,
                 "max_requests": 1000,
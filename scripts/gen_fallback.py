@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Generate the mock IOC set served when the IOC database is unavailable.
+
+The API server used to build this list with ``random`` on every start; it now
+loads the pre-generated file instead. Timestamps are stored as ages in days
+(``first_seen_days_ago`` / ``last_seen_days_ago``) and are anchored to the
+current time when the server loads them, so the data never goes stale.
+
+Usage:
+    # Regenerate data/fallback_iocs.json with the default seed
+    python scripts/gen_fallback.py
+
+    # Use a different seed or output path
+    python scripts/gen_fallback.py --seed 7 --output /tmp/fallback_iocs.json
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api_server import (  # noqa: E402
+    FALLBACK_IOCS_PATH,
+    get_feature_importance,
+    get_ml_threat_class,
+)
+
+DEFAULT_SEED = 1337
+
+# Common domains for examples
+DOMAINS = [
+    "example.com",
+    "phishing-attempt.com",
+    "malware-delivery.net",
+    "suspicious-domain.org",
+    "credential-harvester.com",
+    "fake-login.net",
+    "banking-update.com",
+    "secure-verification.net",
+    "account-alert.org",
+    "payment-confirm.com",
+]
+
+# Common IPs for examples
+IPS = [
+    "1.1.1.1",
+    "192.168.1.10",
+    "10.0.0.1",
+    "172.16.254.1",
+    "192.0.2.1",
+    "198.51.100.1",
+    "203.0.113.1",
+    "224.0.0.1",
+    "169.254.1.1",
+    "127.0.0.1",
+]
+
+# File hashes
+HASHES = [
+    "5241acbddc07ce49cca44076264344717b30a303acb825075471e83468c5585",
+    "840c40763110c1f6564bc2b61dcdf7ce77ce0016211385a5ac49cc5ea8b011d2",
+    "685b4307728abd92415c2d9c001761cfa0481b29689b35106f7a5ee1d1117c8a",
+    "13be0a2444ed05fa173dca62cea89c996e0fe93d82d33bb7795d1870eb1b0e2d",
+    "3247618d002476e731145da86ec977edf01bae14c9beb3bc3bf4b7fa1ee4a250",
+]
+
+# URLs for examples
+URLS = [
+    "https://malicious-site.com/download.exe",
+    "https://fake-login.com/portal/signin.php",
+    "http://compromised-cdn.net/jquery.min.js",
+    "https://phish.example.org/reset-password.html",
+    "http://tracking.malware-delivery.com/beacon.gif",
+]
+
+
+def generate_fallback_iocs(seed=DEFAULT_SEED):
+    """Build the fallback IOC list deterministically from ``seed``."""
+    rng = random.Random(seed)
+
+    def random_age(days_ago_max=14, days_ago_min=0):
+        return round(rng.uniform(days_ago_min, days_ago_max), 4)
+
+    def category_for(score):
+        return "high" if score > 7.5 else "medium" if score > 5 else "low"
+
+    def random_ioc(ioc_id, ioc_type, ioc_value, score, sources, classes, features):
+        return {
+            "id": ioc_id,
+            "ioc_type": ioc_type,
+            "ioc_value": ioc_value,
+            "value": ioc_value,
+            "score": round(score, 2),
+            "category": category_for(score),
+            "first_seen_days_ago": random_age(30, 15),
+            "last_seen_days_ago": random_age(10, 0),
+            "source_feed": rng.choice(sources),
+            "threat_class": rng.choice(classes),
+            "malicious_probability": round(min(1.0, score / 10 * 1.2), 4),
+            "feature_importance": [
+                {"feature": name, "weight": round(rng.uniform(low, high), 3)}
+                for name, low, high in features
+            ],
+        }
+
+    # Start with the original fallback data
+    fallback_iocs = [
+        {
+            "id": 1,
+            "ioc_type": "domain",
+            "ioc_value": "example.com",
+            "value": "example.com",
+            "score": 9,
+            "category": "low",
+            "first_seen_days_ago": random_age(30, 25),
+            "last_seen_days_ago": random_age(5, 1),
+            "source_feed": "dummy",
+            "threat_class": "malware",
+            "malicious_probability": 1.0,
+            "feature_importance": [
+                {"feature": "Domain Age", "weight": 0.42},
+                {"feature": "Entropy", "weight": 0.38},
+                {"feature": "TLD Rarity", "weight": 0.2},
+            ],
+            "similar_known_threats": [
+                {"name": "Emotet", "confidence": 0.85},
+                {"name": "Trickbot", "confidence": 0.72},
+            ],
+            "attack_techniques": [
+                {"id": "T1566", "name": "Phishing"},
+                {"id": "T1189", "name": "Drive-by Compromise"},
+            ],
+        },
+        {
+            "id": 2,
+            "ioc_type": "ip",
+            "ioc_value": "1.1.1.1",
+            "value": "1.1.1.1",
+            "score": 7.2,
+            "category": "medium",
+            "first_seen_days_ago": random_age(30, 25),
+            "last_seen_days_ago": random_age(5, 1),
+            "source_feed": "test_feed",
+            "threat_class": "c2_server",
+            "malicious_probability": 0.78,
+            "feature_importance": [
+                {"feature": "WHOIS Age", "weight": 0.35},
+                {"feature": "ASN Reputation", "weight": 0.45},
+                {"feature": "Port Scan Results", "weight": 0.2},
+            ],
+            "similar_known_threats": [
+                {"name": "APT29", "confidence": 0.65},
+                {"name": "Cobalt Strike", "confidence": 0.77},
+            ],
+            "attack_techniques": [
+                {"id": "T1071", "name": "Application Layer Protocol"},
+                {"id": "T1572", "name": "Protocol Tunneling"},
+            ],
+        },
+    ]
+
+    # Add domain IOCs
+    for domain in DOMAINS[2:]:
+        fallback_iocs.append(
+            random_ioc(
+                len(fallback_iocs) + 1,
+                "domain",
+                domain,
+                rng.uniform(3.0, 9.8),
+                ["AlienVault", "Mandiant", "Recorded Future", "IBM X-Force"],
+                ["malware", "phishing", "c2_server"],
+                [
+                    ("Domain Age", 0.3, 0.5),
+                    ("Entropy", 0.2, 0.4),
+                    ("TLD Rarity", 0.1, 0.3),
+                ],
+            )
+        )
+
+    # Add IP IOCs
+    for ip in IPS[2:]:
+        fallback_iocs.append(
+            random_ioc(
+                len(fallback_iocs) + 1,
+                "ip",
+                ip,
+                rng.uniform(4.0, 9.5),
+                ["FireEye", "Crowdstrike", "ThreatConnect", "Anomali"],
+                ["c2_server", "ransomware", "ddos"],
+                [
+                    ("ASN Reputation", 0.3, 0.5),
+                    ("Geolocation", 0.2, 0.4),
+                    ("Port Scan", 0.1, 0.3),
+                ],
+            )
+        )
+
+    # Add Hash IOCs
+    for hash_value in HASHES:
+        fallback_iocs.append(
+            random_ioc(
+                len(fallback_iocs) + 1,
+                "hash",
+                hash_value,
+                rng.uniform(5.0, 9.9),
+                ["VirusTotal", "Trellix", "Malwarebytes", "Kaspersky"],
+                ["ransomware", "malware", "infostealer"],
+                [
+                    ("File Structure", 0.4, 0.6),
+                    ("API Calls", 0.2, 0.3),
+                    ("Packer Detection", 0.1, 0.3),
+                ],
+            )
+        )
+
+    # Add URL IOCs
+    for url in URLS:
+        fallback_iocs.append(
+            random_ioc(
+                len(fallback_iocs) + 1,
+                "url",
+                url,
+                rng.uniform(4.5, 9.7),
+                ["PhishTank", "URLhaus", "Symantec", "Cisco Talos"],
+                ["phishing", "malware", "exploit"],
+                [
+                    ("URL Pattern", 0.3, 0.5),
+                    ("Domain Reputation", 0.2, 0.4),
+                    ("Content Analysis", 0.2, 0.3),
+                ],
+            )
+        )
+
+    # Generate 20 more random IOCs with varied timestamps for the last 14 days
+    ioc_types = ["domain", "ip", "url", "hash"]
+    ioc_sources = {"domain": DOMAINS, "ip": IPS, "url": URLS, "hash": HASHES}
+
+    for _ in range(20):
+        ioc_type = rng.choice(ioc_types)
+        ioc_value = rng.choice(ioc_sources[ioc_type])
+        score = rng.uniform(1.0, 9.9)
+        # Generate timestamps more heavily weighted to recent days
+        days_ago = rng.triangular(0, 14, 2)
+        fallback_iocs.append(
+            {
+                "id": len(fallback_iocs) + 1,
+                "ioc_type": ioc_type,
+                "ioc_value": ioc_value,
+                "value": ioc_value,
+                "score": round(score, 2),
+                "category": category_for(score),
+                "first_seen_days_ago": random_age(days_ago + 10, days_ago + 5),
+                "last_seen_days_ago": random_age(days_ago + 2, days_ago),
+                "source_feed": rng.choice(
+                    [
+                        "VirusTotal",
+                        "Trellix",
+                        "Malwarebytes",
+                        "Kaspersky",
+                        "AlienVault",
+                        "Mandiant",
+                        "Recorded Future",
+                        "IBM X-Force",
+                    ]
+                ),
+                "threat_class": get_ml_threat_class(ioc_value, ioc_type),
+                "malicious_probability": round(min(1.0, score / 10 * 1.2), 4),
+                "feature_importance": get_feature_importance(ioc_type),
+            }
+        )
+
+    # Add a few critical IOCs for dashboard impact
+    for i in range(5):
+        ioc_type = rng.choice(ioc_types)
+        ioc_value = (
+            f"critical-{ioc_type}-{i}.malicious.com"
+            if ioc_type == "domain"
+            else rng.choice(ioc_sources[ioc_type])
+        )
+        score = rng.uniform(8.5, 9.9)  # Critical range
+        days_ago = rng.triangular(0, 5, 1)  # Very recent threats
+        fallback_iocs.append(
+            {
+                "id": len(fallback_iocs) + 1,
+                "ioc_type": ioc_type,
+                "ioc_value": ioc_value,
+                "value": ioc_value,
+                "score": round(score, 2),
+                "category": "critical",
+                "first_seen_days_ago": random_age(days_ago + 3, days_ago + 1),
+                "last_seen_days_ago": random_age(days_ago + 0.5, 0),
+                "source_feed": "Critical Threat Intelligence",
+                "threat_class": "APT",
+                "malicious_probability": 0.99,
+                "feature_importance": get_feature_importance(ioc_type),
+            }
+        )
+
+    return fallback_iocs
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Generate fallback mock IOCs")
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help=f"Random seed (default: {DEFAULT_SEED})",
+    )
+    parser.add_argument(
+        "--output",
+        default=FALLBACK_IOCS_PATH,
+        help=f"Output path (default: {FALLBACK_IOCS_PATH})",
+    )
+    args = parser.parse_args()
+
+    fallback_iocs = generate_fallback_iocs(args.seed)
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(fallback_iocs, separators=(",", ":")) + "\n")
+    print(f"✅ Wrote {len(fallback_iocs)} fallback IOCs to {output}")
+
+
+if __name__ == "__main__":
+    main()
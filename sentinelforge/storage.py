@@ -10,6 +10,7 @@ from sqlalchemy import (
     Table,
     ForeignKey,
     Boolean,
+    Index,
 )
 from sqlalchemy.orm import declarative_base, sessionmaker, relationship
 
@@ -163,6 +164,19 @@ class FeedImportLog(Base):
     # Relationship to feed
     feed = relationship("ThreatFeed", backref="import_logs")
 
+    # Back keyset pagination of GET /api/feeds/import-logs, unfiltered and
+    # filtered by feed and status
+    __table_args__ = (
+        Index("idx_feed_import_logs_timestamp_id", timestamp.desc(), id.desc()),
+        Index(
+            "idx_feed_import_logs_feed_status_ts",
+            feed_id,
+            import_status,
+            timestamp.desc(),
+            id.desc(),
+        ),
+    )
+
 
 def init_db():
     # Pass engine explicitly if Base.metadata needs it
@@ -27,14 +27,18 @@ import requests
 import time
 import json
 import logging
+import queue
 import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Callable
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+import orjson
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -51,15 +55,25 @@ except ImportError:
 class FeedHealthMonitor:
     """Comprehensive feed health monitoring service with real-time progress tracking."""
 
-    def __init__(self, db_path: str = "ioc_store.db", log_level: str = "INFO"):
+    def __init__(
+        self,
+        db_path: str = "ioc_store.db",
+        log_level: str = "INFO",
+        max_workers: int = 16,
+    ):
         self.db_path = db_path
+        self.max_workers = max_workers
         self.logger = self._setup_logging(log_level)
         self.scheduler = None
+        self._scheduler_lock = threading.Lock()
         self._health_cache = {}
+        self._cached_response = None
         self._cache_lock = threading.Lock()
 
-        # Progress tracking for real-time updates
+        # Progress tracking for real-time updates; each session also has an
+        # event queue that SSE streams block on instead of polling
         self._progress_sessions = {}
+        self._session_queues = {}
         self._progress_lock = threading.Lock()
 
         # HTTP session with retry strategy
@@ -69,7 +83,8 @@ class FeedHealthMonitor:
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Size the pool for concurrent checks so connections are not discarded
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=max_workers)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -132,6 +147,10 @@ class FeedHealthMonitor:
                 CREATE INDEX IF NOT EXISTS idx_feed_health_logs_last_checked 
                 ON feed_health_logs(last_checked)
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_feed_health_logs_last_checked_id
+                ON feed_health_logs(last_checked DESC, id DESC)
+            """)
 
             conn.commit()
             return True
@@ -310,12 +329,61 @@ class FeedHealthMonitor:
                 result["feed_id"]: result for result in health_results
             }
             self._health_cache["_last_update"] = datetime.now(timezone.utc)
+            self._cached_response = None
 
     def get_cached_health(self) -> Dict:
         """Get cached health results."""
         with self._cache_lock:
             return self._health_cache.copy()
 
+    def get_cached_health_response(
+        self, max_age_seconds: int = 300
+    ) -> Optional[Tuple[bytes, float]]:
+        """Get cached health results as a serialized API response.
+
+        The JSON body is built once per cache update and reused until the
+        next one. Returns ``(body, age_seconds)``, or None when there are no
+        results younger than ``max_age_seconds``.
+        """
+        with self._cache_lock:
+            last_update = self._health_cache.get("_last_update")
+            if last_update is None:
+                return None
+
+            age = (datetime.now(timezone.utc) - last_update).total_seconds()
+            if age >= max_age_seconds:
+                return None
+
+            if self._cached_response is None:
+                feeds = [
+                    result
+                    for key, result in self._health_cache.items()
+                    if key != "_last_update"
+                ]
+                total_feeds = len(feeds)
+                healthy_feeds = sum(1 for f in feeds if f["status"] == "ok")
+                self._cached_response = orjson.dumps(
+                    {
+                        "success": True,
+                        "summary": {
+                            "total_feeds": total_feeds,
+                            "healthy_feeds": healthy_feeds,
+                            "unhealthy_feeds": total_feeds - healthy_feeds,
+                            "health_percentage": round(
+                                (healthy_feeds / total_feeds * 100)
+                                if total_feeds > 0
+                                else 0,
+                                1,
+                            ),
+                        },
+                        "feeds": feeds,
+                        "checked_at": last_update,
+                        "from_cache": True,
+                    }
+                )
+
+            return self._cached_response, age
+
     def create_progress_session(
         self, session_id: str, total_feeds: int, checked_by: int = 0
     ) -> Dict:
@@ -335,8 +403,24 @@ class FeedHealthMonitor:
                 "cancelled": False,
             }
             self._progress_sessions[session_id] = session_data
+            self._session_queues[session_id] = queue.Queue()
+            self._publish_progress(session_id)
             return session_data.copy()
 
+    def _publish_progress(self, session_id: str):
+        """Queue a progress event for a session. Caller must hold the lock."""
+        session = self._progress_sessions[session_id]
+        self._session_queues[session_id].put(
+            {
+                "type": "progress",
+                "status": session["status"],
+                "completed_feeds": session["completed_feeds"],
+                "total_feeds": session["total_feeds"],
+                "current_feed": session.get("current_feed"),
+                "estimated_completion": session.get("estimated_completion"),
+            }
+        )
+
     def update_progress(self, session_id: str, **updates) -> Dict:
         """Update progress for a specific session."""
         with self._progress_lock:
@@ -358,8 +442,30 @@ class FeedHealthMonitor:
                     datetime.now(timezone.utc).timestamp() + estimated_seconds
                 )
 
+            self._publish_progress(session_id)
             return session.copy()
 
+    def add_progress_result(self, session_id: str, result: Dict):
+        """Record a completed feed result and push it to the session's stream."""
+        with self._progress_lock:
+            if session_id in self._progress_sessions:
+                self._progress_sessions[session_id]["results"].append(result)
+                self._session_queues[session_id].put(
+                    {"type": "feed_result", "result": result}
+                )
+
+    def add_progress_error(self, session_id: str, error: Dict):
+        """Record a feed error and push it to the session's stream."""
+        with self._progress_lock:
+            if session_id in self._progress_sessions:
+                self._progress_sessions[session_id]["errors"].append(error)
+                self._session_queues[session_id].put({"type": "error", "error": error})
+
+    def get_progress_events(self, session_id: str) -> Optional[queue.Queue]:
+        """Get the event queue for a session, or None if it does not exist."""
+        with self._progress_lock:
+            return self._session_queues.get(session_id)
+
     def get_progress(self, session_id: str) -> Dict:
         """Get current progress for a session."""
         with self._progress_lock:
@@ -373,6 +479,7 @@ class FeedHealthMonitor:
             if session_id in self._progress_sessions:
                 self._progress_sessions[session_id]["cancelled"] = True
                 self._progress_sessions[session_id]["status"] = "cancelled"
+                self._publish_progress(session_id)
                 return True
             return False
 
@@ -380,6 +487,22 @@ class FeedHealthMonitor:
         """Clean up a completed progress session."""
         with self._progress_lock:
             self._progress_sessions.pop(session_id, None)
+            self._session_queues.pop(session_id, None)
+
+    def _check_feed_with_progress(
+        self, feed: Dict, index: int, progress_session_id: Optional[str]
+    ) -> Dict:
+        """Check a single feed, reporting it as the current feed first."""
+        if progress_session_id:
+            self.update_progress(
+                progress_session_id,
+                current_feed={
+                    "name": feed["name"],
+                    "url": feed["url"],
+                    "index": index + 1,
+                },
+            )
+        return self.check_feed_health(feed)
 
     def run_health_check(
         self,
@@ -430,65 +553,81 @@ class FeedHealthMonitor:
                 progress_session_id, status="running", total_feeds=len(feeds)
             )
 
-        # Check health for each feed
-        health_results = []
-        for i, feed in enumerate(feeds):
-            # Check if session was cancelled
-            if progress_session_id:
-                session = self.get_progress(progress_session_id)
-                if session.get("cancelled"):
-                    self.logger.info(
-                        f"Health check cancelled for session {progress_session_id}"
-                    )
-                    return {
-                        "error": "Health check cancelled",
-                        "partial_results": health_results,
-                    }
-
-                # Update current feed being checked
-                self.update_progress(
-                    progress_session_id,
-                    current_feed={
-                        "name": feed["name"],
-                        "url": feed["url"],
-                        "index": i + 1,
-                    },
-                )
-
-            try:
-                health_result = self.check_feed_health(feed)
-                health_results.append(health_result)
-
-                # Update progress with completed feed
-                if progress_session_id:
-                    self.update_progress(
-                        progress_session_id, completed_feeds=i + 1, current_feed=None
-                    )
-
-                    # Add result to progress session
-                    session = self.get_progress(progress_session_id)
-                    session["results"].append(health_result)
-
-                # Log to database
-                if not self.log_health_result(health_result, checked_by):
-                    self.logger.warning(
-                        f"Failed to log health result for feed {feed['name']}"
-                    )
+        # Check feeds concurrently; the checks are network-bound and release
+        # the GIL, so wall time is roughly the slowest feed rather than the sum.
+        # Results are recorded from this thread only, in completion order.
+        results_by_index = {}
+        completed_feeds = 0
+        workers = max(1, min(self.max_workers, len(feeds)))
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="feed-health"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._check_feed_with_progress, feed, i, progress_session_id
+                ): (i, feed)
+                for i, feed in enumerate(feeds)
+            }
 
-            except Exception as e:
-                error_msg = f"Health check failed for feed {feed['name']}: {e}"
-                self.logger.error(error_msg)
+            for future in as_completed(futures):
+                i, feed = futures[future]
 
-                # Add error to progress session
+                # Check if session was cancelled
                 if progress_session_id:
                     session = self.get_progress(progress_session_id)
-                    session["errors"].append(
-                        {
-                            "feed_name": feed["name"],
-                            "error": str(e),
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
+                    if session.get("cancelled"):
+                        self.logger.info(
+                            f"Health check cancelled for session {progress_session_id}"
+                        )
+                        for pending in futures:
+                            pending.cancel()
+                        return {
+                            "error": "Health check cancelled",
+                            "partial_results": [
+                                results_by_index[k] for k in sorted(results_by_index)
+                            ],
                         }
-                    )
+
+                try:
+                    health_result = future.result()
+                    results_by_index[i] = health_result
+                    completed_feeds += 1
+
+                    # Update progress with completed feed
+                    if progress_session_id:
+                        self.update_progress(
+                            progress_session_id,
+                            completed_feeds=completed_feeds,
+                            current_feed=None,
+                        )
+
+                        # Add result to progress session
+                        self.add_progress_result(progress_session_id, health_result)
+
+                    # Log to database
+                    if not self.log_health_result(health_result, checked_by):
+                        self.logger.warning(
+                            f"Failed to log health result for feed {feed['name']}"
+                        )
+
+                except Exception as e:
+                    error_msg = f"Health check failed for feed {feed['name']}: {e}"
+                    self.logger.error(error_msg)
+
+                    # Add error to progress session
+                    if progress_session_id:
+                        self.add_progress_error(
+                            progress_session_id,
+                            {
+                                "feed_name": feed["name"],
+                                "error": str(e),
+                                "timestamp": datetime.now(timezone.utc).isoformat(),
+                            },
+                        )
+
+        # Keep results in feed order
+        health_results = [results_by_index[k] for k in sorted(results_by_index)]
 
         # Mark progress as completed
         if progress_session_id:
@@ -532,19 +671,23 @@ class FeedHealthMonitor:
             return False
 
         try:
-            self.scheduler = BackgroundScheduler()
-
-            # Add job for regular health checks
-            self.scheduler.add_job(
-                func=self.run_health_check,
-                trigger="interval",
-                minutes=interval_minutes,
-                id="feed_health_check",
-                name="Feed Health Check",
-                replace_existing=True,
-            )
+            # The monitor is shared by every request, so a second start
+            # reschedules the running scheduler instead of leaking another
+            with self._scheduler_lock:
+                if not (self.scheduler and self.scheduler.running):
+                    self.scheduler = BackgroundScheduler()
+                    self.scheduler.start()
+
+                # Add job for regular health checks
+                self.scheduler.add_job(
+                    func=self.run_health_check,
+                    trigger="interval",
+                    minutes=interval_minutes,
+                    id="feed_health_check",
+                    name="Feed Health Check",
+                    replace_existing=True,
+                )
 
-            self.scheduler.start()
             self.logger.info(
                 f"Cron scheduler started with {interval_minutes}-minute interval"
             )
@@ -556,9 +699,10 @@ class FeedHealthMonitor:
 
     def stop_cron_scheduler(self):
         """Stop the cron scheduler."""
-        if self.scheduler and self.scheduler.running:
-            self.scheduler.shutdown()
-            self.logger.info("Cron scheduler stopped")
+        with self._scheduler_lock:
+            if self.scheduler and self.scheduler.running:
+                self.scheduler.shutdown()
+                self.logger.info("Cron scheduler stopped")
 
     def get_scheduler_status(self) -> Dict:
         """Get scheduler status information."""
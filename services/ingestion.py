@@ -19,13 +19,47 @@ Usage:
 import csv
 import json
 import re
+import sys
 import time
-from typing import Dict, List, Any, Tuple
+from typing import Dict, Iterable, Iterator, List, Any, Tuple, Union
 from datetime import datetime, timezone
 from io import StringIO
+from itertools import chain, islice
 import sqlite3
 from pathlib import Path
 
+import orjson
+
+IOC_INSERT_SQL = """
+    INSERT INTO iocs (
+        ioc_type, ioc_value, source_feed, first_seen, last_seen,
+        score, category, enrichment_data, severity, tags, confidence,
+        created_at, updated_at, is_active
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Records validated and inserted per executemany batch, and values per
+# IN (...) lookup (SQLite's default limit on bound parameters is 999)
+INGEST_BATCH_SIZE = 10_000
+LOOKUP_BATCH_SIZE = 900
+
+
+# IOC type patterns, compiled once for IOCValidator.infer_ioc_type. Hashes
+# share one pattern and are told apart by length (MD5, SHA1, SHA256, SHA512).
+URL_PATTERN = re.compile(r"^https?://", re.IGNORECASE)
+IP_PATTERN = re.compile(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
+HASH_PATTERN = re.compile(r"^[a-fA-F0-9]+$")
+HASH_LENGTHS = frozenset((32, 40, 64, 128))
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+DOMAIN_PATTERN = re.compile(
+    r"^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?"
+    r"(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)+$"
+)
+
+
+class FeedParseError(ValueError):
+    """Raised when a lazily parsed feed turns out to be malformed."""
+
 
 class IOCValidator:
     """Validates and normalizes IOC data."""
@@ -39,11 +73,11 @@ class IOCValidator:
         value = value.strip()
 
         # URL pattern (check first as it's most specific)
-        if re.match(r"^https?://", value, re.IGNORECASE):
+        if URL_PATTERN.match(value):
             return "url"
 
         # IP address pattern (check before domain to avoid false positives)
-        if re.match(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$", value):
+        if IP_PATTERN.match(value):
             # Validate IP ranges
             try:
                 parts = value.split(".")
@@ -53,24 +87,15 @@ class IOCValidator:
                 pass
 
         # Hash patterns (MD5, SHA1, SHA256, SHA512)
-        if re.match(r"^[a-fA-F0-9]{32}$", value):  # MD5
-            return "hash"
-        elif re.match(r"^[a-fA-F0-9]{40}$", value):  # SHA1
-            return "hash"
-        elif re.match(r"^[a-fA-F0-9]{64}$", value):  # SHA256
-            return "hash"
-        elif re.match(r"^[a-fA-F0-9]{128}$", value):  # SHA512
+        if len(value) in HASH_LENGTHS and HASH_PATTERN.match(value):
             return "hash"
 
         # Email pattern (check before domain as it's more specific)
-        elif re.match(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", value):
+        elif EMAIL_PATTERN.match(value):
             return "email"
 
         # Domain pattern (check last as it's most general)
-        elif re.match(
-            r"^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)+$",
-            value,
-        ):
+        elif DOMAIN_PATTERN.match(value):
             return "domain"
 
         return "unknown"
@@ -182,71 +207,88 @@ class FeedParser:
     @staticmethod
     def parse_csv(file_content: str) -> List[Dict[str, Any]]:
         """Parse CSV format feed."""
-        iocs = []
-        lines = file_content.strip().split("\n")
+        try:
+            return list(FeedParser.iter_csv(file_content))
+        except Exception:
+            # Fallback to simple CSV parsing
+            iocs = []
+            reader = csv.DictReader(StringIO(file_content))
+            for row_num, row in enumerate(reader, start=2):
+                if not any(row.values()):
+                    continue
+                row["_row_number"] = row_num
+                iocs.append(row)
+            return iocs
+
+    @staticmethod
+    def iter_csv(file_content: str) -> Iterator[Dict[str, Any]]:
+        """Parse CSV format feed one row at a time."""
+        lines = StringIO(file_content)
 
         # Skip comment lines at the beginning (for Abuse.ch format)
         data_start = 0
-        for i, line in enumerate(lines):
+        header = None
+        for line in lines:
             if line.strip().startswith("#") or not line.strip():
-                data_start = i + 1
+                data_start += 1
             else:
+                header = line
                 break
 
-        # Get the actual CSV data
-        csv_data = "\n".join(lines[data_start:])
-        if not csv_data.strip():
-            return iocs
+        if header is None:
+            return
 
-        try:
-            reader = csv.DictReader(StringIO(csv_data))
+        # csv.reader plus a zip against the header, as csv.DictReader does,
+        # but without its per-row Python method call; the URLhaus check only
+        # depends on the header so it is made once
+        reader = csv.reader(chain([header], lines))
+        fieldnames = next(reader)
+        width = len(fieldnames)
+        is_urlhaus = "url" in fieldnames and "url_status" in fieldnames
 
-            for row_num, row in enumerate(
-                reader, start=data_start + 2
-            ):  # Account for skipped lines
-                if not any(row.values()):  # Skip empty rows
-                    continue
+        row_num = data_start + 1  # Account for skipped lines
+        for values in reader:
+            if not values:  # Blank lines are not counted as rows
+                continue
+            row_num += 1
 
-                # Handle Abuse.ch URLhaus format specifically
-                if "url" in row and "url_status" in row:
-                    # Map Abuse.ch fields to standard IOC format
-                    ioc = {
-                        "ioc_value": row.get("url", "").strip('"'),
-                        "ioc_type": "url",
-                        "severity": "high"
-                        if row.get("threat") == "malware_download"
-                        else "medium",
-                        "confidence": 85,  # High confidence for URLhaus
-                        "tags": [
-                            tag.strip()
-                            for tag in row.get("tags", "").split(",")
-                            if tag.strip()
-                        ],
-                        "_row_number": row_num,
-                        "_original_row": row,
-                    }
-                    iocs.append(ioc)
-                else:
-                    # Standard CSV format
-                    row["_row_number"] = row_num
-                    iocs.append(row)
+            row = dict(zip(fieldnames, values))
+            if len(values) > width:
+                row[None] = values[width:]
+            elif len(values) < width:
+                row.update(dict.fromkeys(fieldnames[len(values) :]))
 
-        except Exception:
-            # Fallback to simple CSV parsing
-            reader = csv.DictReader(StringIO(file_content))
-            for row_num, row in enumerate(reader, start=2):
-                if not any(row.values()):
-                    continue
-                row["_row_number"] = row_num
-                iocs.append(row)
+            if not any(row.values()):  # Skip empty rows
+                continue
 
-        return iocs
+            # Handle Abuse.ch URLhaus format specifically
+            if is_urlhaus:
+                # Map Abuse.ch fields to standard IOC format
+                yield {
+                    "ioc_value": row.get("url", "").strip('"'),
+                    "ioc_type": "url",
+                    "severity": "high"
+                    if row.get("threat") == "malware_download"
+                    else "medium",
+                    "confidence": 85,  # High confidence for URLhaus
+                    "tags": [
+                        tag.strip()
+                        for tag in row.get("tags", "").split(",")
+                        if tag.strip()
+                    ],
+                    "_row_number": row_num,
+                    "_original_row": row,
+                }
+            else:
+                # Standard CSV format
+                row["_row_number"] = row_num
+                yield row
 
     @staticmethod
-    def parse_json(file_content: str) -> List[Dict[str, Any]]:
-        """Parse JSON format feed."""
+    def parse_json(file_content: Union[str, bytes]) -> List[Dict[str, Any]]:
+        """Parse JSON format feed (raw UTF-8 bytes are parsed without decoding)."""
         try:
-            data = json.loads(file_content)
+            data = orjson.loads(file_content)
 
             # Handle different JSON structures
             if isinstance(data, list):
@@ -261,16 +303,18 @@ class FeedParser:
             else:
                 raise ValueError("Invalid JSON structure")
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON format: {e}")
 
     @staticmethod
     def parse_txt(file_content: str) -> List[Dict[str, Any]]:
         """Parse plain text format (one IOC per line)."""
-        iocs = []
-        lines = file_content.strip().split("\n")
+        return list(FeedParser.iter_txt(file_content))
 
-        for line_num, line in enumerate(lines, start=1):
+    @staticmethod
+    def iter_txt(file_content: str) -> Iterator[Dict[str, Any]]:
+        """Parse plain text format one line at a time."""
+        for line_num, line in enumerate(StringIO(file_content), start=1):
             line = line.strip()
 
             # Skip empty lines and comments
@@ -289,7 +333,7 @@ class FeedParser:
                     # Validate IP address format
                     ip_pattern = r"^(\d{1,3}\.){3}\d{1,3}$"
                     if re.match(ip_pattern, ip_address):
-                        ioc = {
+                        yield {
                             "ioc_value": ip_address,
                             "ioc_type": "ip",
                             "severity": "medium" if score == "4" else "low",
@@ -299,21 +343,17 @@ class FeedParser:
                             "tags": [description] if description else [],
                             "_row_number": line_num,
                         }
-                        iocs.append(ioc)
                         continue
 
             # Standard TXT format - one IOC per line
-            ioc = {"ioc_value": line, "_row_number": line_num}
-            iocs.append(ioc)
-
-        return iocs
+            yield {"ioc_value": line, "_row_number": line_num}
 
     @staticmethod
-    def parse_stix(file_content: str) -> List[Dict[str, Any]]:
+    def parse_stix(file_content: Union[str, bytes]) -> List[Dict[str, Any]]:
         """Parse simple STIX format (basic implementation)."""
         # This is a simplified STIX parser for basic indicator objects
         try:
-            data = json.loads(file_content)
+            data = orjson.loads(file_content)
             iocs = []
 
             # Look for STIX objects
@@ -348,7 +388,7 @@ class FeedParser:
 
             return iocs
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid STIX JSON format: {e}")
 
 
@@ -364,9 +404,11 @@ class FeedIngestionService:
         """Get database connection."""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         return conn
 
-    def detect_file_format(self, filename: str, content: str) -> str:
+    def detect_file_format(self, filename: str, content: Union[str, bytes]) -> str:
         """Detect file format from filename and content."""
         filename_lower = filename.lower()
 
@@ -380,7 +422,10 @@ class FeedIngestionService:
             return "stix"
 
         # Try to detect from content
-        content_sample = content.strip()[:1000]
+        content_sample = content[:4096]
+        if not isinstance(content_sample, str):
+            content_sample = bytes(content_sample).decode("utf-8", errors="ignore")
+        content_sample = content_sample.strip()[:1000]
 
         if content_sample.startswith("{") or content_sample.startswith("["):
             return "json"
@@ -398,48 +443,86 @@ class FeedIngestionService:
         count = cursor.fetchone()[0]
         return count > 0
 
+    def find_existing(self, conn, keys) -> set:
+        """Return the (ioc_type, ioc_value) pairs from ``keys`` already stored."""
+        values = list({ioc_value for _, ioc_value in keys})
+        existing = set()
+
+        # Plain tuples regardless of the connection's row factory
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        for start in range(0, len(values), LOOKUP_BATCH_SIZE):
+            chunk = values[start : start + LOOKUP_BATCH_SIZE]
+            cursor.execute(
+                "SELECT ioc_type, ioc_value FROM iocs WHERE ioc_value IN "
+                f"({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            existing.update(row for row in cursor.fetchall() if row in keys)
+        return existing
+
+    @staticmethod
+    def ioc_row(ioc_data: Dict[str, Any]) -> tuple:
+        """Build the ``IOC_INSERT_SQL`` parameters for a normalized IOC."""
+        # Convert tags list to JSON string (most feed rows have none)
+        tags = ioc_data.get("tags", [])
+        tags_json = json.dumps(tags) if tags else "[]"
+
+        # Convert enrichment_data to JSON string if it's not already
+        enrichment_data = ioc_data.get("enrichment_data", {})
+        if isinstance(enrichment_data, dict):
+            enrichment_data = json.dumps(enrichment_data) if enrichment_data else "{}"
+
+        return (
+            ioc_data["ioc_type"],
+            ioc_data["ioc_value"],
+            ioc_data["source_feed"],
+            ioc_data["first_seen"],
+            ioc_data["last_seen"],
+            int(ioc_data["score"]),
+            ioc_data["severity"],  # category
+            enrichment_data,
+            ioc_data["severity"],
+            tags_json,
+            ioc_data["confidence"],
+            ioc_data["created_at"],
+            ioc_data["updated_at"],
+            ioc_data["is_active"],
+        )
+
     def insert_ioc(self, conn, ioc_data: Dict[str, Any]) -> bool:
         """Insert IOC into database."""
         try:
-            # Convert tags list to JSON string
-            tags_json = json.dumps(ioc_data.get("tags", []))
-
-            # Convert enrichment_data to JSON string if it's not already
-            enrichment_data = ioc_data.get("enrichment_data", {})
-            if isinstance(enrichment_data, dict):
-                enrichment_data = json.dumps(enrichment_data)
-
-            conn.execute(
-                """
-                INSERT INTO iocs (
-                    ioc_type, ioc_value, source_feed, first_seen, last_seen,
-                    score, category, enrichment_data, severity, tags, confidence,
-                    created_at, updated_at, is_active
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    ioc_data["ioc_type"],
-                    ioc_data["ioc_value"],
-                    ioc_data["source_feed"],
-                    ioc_data["first_seen"],
-                    ioc_data["last_seen"],
-                    int(ioc_data["score"]),
-                    ioc_data["severity"],  # category
-                    enrichment_data,
-                    ioc_data["severity"],
-                    tags_json,
-                    ioc_data["confidence"],
-                    ioc_data["created_at"],
-                    ioc_data["updated_at"],
-                    ioc_data["is_active"],
-                ),
-            )
+            conn.execute(IOC_INSERT_SQL, self.ioc_row(ioc_data))
             return True
         except Exception as e:
             print(f"Error inserting IOC: {e}")
             print(f"IOC data: {ioc_data}")
             return False
 
+    def insert_iocs(self, conn, rows: List[Tuple[Any, tuple]]) -> List[Any]:
+        """Insert ``(row_number, params)`` pairs in one batch.
+
+        If the batch fails it is rolled back and retried row by row so a
+        single bad record does not sink the rest. Returns the row numbers
+        that could not be inserted.
+        """
+        failed = []
+        conn.execute("SAVEPOINT ioc_batch")
+        try:
+            conn.executemany(IOC_INSERT_SQL, [params for _, params in rows])
+        except sqlite3.Error:
+            conn.execute("ROLLBACK TO ioc_batch")
+            for row_number, params in rows:
+                try:
+                    conn.execute(IOC_INSERT_SQL, params)
+                except sqlite3.Error as e:
+                    print(f"Error inserting IOC: {e}")
+                    failed.append(row_number)
+        finally:
+            conn.execute("RELEASE ioc_batch")
+        return failed
+
     def log_import(self, conn, log_data: Dict[str, Any]) -> int:
         """Log import operation and return log ID."""
         cursor = conn.execute(
@@ -505,27 +588,50 @@ class FeedIngestionService:
 
     def import_from_content(
         self,
-        content: str,
+        content: Union[str, bytes],
         filename: str,
         source_feed: str,
         user_id: int,
         justification: str = None,
         feed_id: int = None,
+        conn: sqlite3.Connection = None,
     ) -> Dict[str, Any]:
-        """Import IOCs from file content."""
+        """Import IOCs from file content.
+
+        ``content`` may be raw bytes or another buffer such as a memoryview
+        over a memory-mapped upload; JSON and STIX feeds are then parsed
+        straight from the buffer, and only text formats are decoded as UTF-8.
+
+        When ``conn`` is given the import runs inside the caller's open
+        transaction and is left for the caller to commit.
+        """
         start_time = time.time()
 
+        # Every record carries the same source feed; strip it once here so
+        # normalize_ioc's per-row strip() hands back this one interned string
+        source_feed = sys.intern(str(source_feed).strip())
+
+        if isinstance(content, str):
+            file_size = len(content.encode("utf-8"))
+        else:
+            file_size = len(content)
+
         # Detect format
         file_format = self.detect_file_format(filename, content)
 
         # Parse content
         try:
+            if file_format in ("csv", "txt") and not isinstance(content, str):
+                content = str(content, "utf-8", errors="replace")
+
+            # Text formats are parsed lazily as the records are imported;
+            # JSON documents have to be loaded in full
             if file_format == "csv":
-                raw_iocs = self.parser.parse_csv(content)
+                raw_iocs = self._parse_stream(self.parser.iter_csv(content), "csv")
             elif file_format == "json":
                 raw_iocs = self.parser.parse_json(content)
             elif file_format == "txt":
-                raw_iocs = self.parser.parse_txt(content)
+                raw_iocs = self._parse_stream(self.parser.iter_txt(content), "txt")
             elif file_format == "stix":
                 raw_iocs = self.parser.parse_stix(content)
             else:
@@ -541,6 +647,7 @@ class FeedIngestionService:
             return {
                 "success": False,
                 "error": f"Failed to parse {file_format} content: {e}",
+                "import_status": "failed",
                 "imported_count": 0,
                 "skipped_count": 0,
                 "error_count": 0,
@@ -555,13 +662,53 @@ class FeedIngestionService:
             justification=justification,
             feed_id=feed_id,
             filename=filename,
-            file_size=len(content.encode("utf-8")),
+            file_size=file_size,
             start_time=start_time,
+            conn=conn,
+        )
+
+    @staticmethod
+    def _parse_stream(records: Iterable[Dict[str, Any]], file_format: str):
+        """Re-raise errors from a lazy parser as parse errors."""
+        try:
+            yield from records
+        except Exception as e:
+            raise FeedParseError(f"Failed to parse {file_format} content: {e}") from e
+
+    def _import_batch(
+        self, conn, batch: List[Tuple[str, Dict[str, Any]]]
+    ) -> Tuple[int, int, List[str]]:
+        """Store a batch of validated ``(row_ref, ioc)`` pairs.
+
+        Returns the imported count, skipped count and per-row errors.
+        """
+        # Skip IOCs already stored (including earlier batches of this import)
+        # or repeated earlier in this batch
+        seen = self.find_existing(
+            conn, {(ioc["ioc_type"], ioc["ioc_value"]) for _, ioc in batch}
         )
+        pending = []
+        skipped_count = 0
+        errors = []
+        for row_ref, ioc in batch:
+            key = (ioc["ioc_type"], ioc["ioc_value"])
+            if key in seen:
+                skipped_count += 1
+                continue
+            seen.add(key)
+
+            try:
+                pending.append((row_ref, self.ioc_row(ioc)))
+            except Exception as e:
+                errors.append(f"{row_ref}: {str(e)}")
+
+        failed_rows = self.insert_iocs(conn, pending) if pending else []
+        errors.extend(f"{row_ref}: Failed to insert IOC" for row_ref in failed_rows)
+        return len(pending) - len(failed_rows), skipped_count, errors
 
     def _process_iocs(
         self,
-        raw_iocs: List[Dict[str, Any]],
+        raw_iocs: Iterable[Dict[str, Any]],
         source_feed: str,
         user_id: int,
         justification: str,
@@ -569,56 +716,69 @@ class FeedIngestionService:
         filename: str,
         file_size: int,
         start_time: float,
+        conn: sqlite3.Connection = None,
     ) -> Dict[str, Any]:
-        """Process and import IOCs into database."""
+        """Process and import IOCs into database.
+
+        ``raw_iocs`` may be a generator; records are validated and inserted
+        in batches of ``INGEST_BATCH_SIZE`` as they are produced.
+        """
         imported_count = 0
         skipped_count = 0
         error_count = 0
         errors = []
+        total_records = 0
 
-        conn = self.get_db_connection()
+        owns_conn = conn is None
+        if owns_conn:
+            conn = self.get_db_connection()
 
         try:
-            conn.execute("BEGIN TRANSACTION")
-
-            for i, raw_ioc in enumerate(raw_iocs):
-                try:
-                    # Set source feed
-                    raw_ioc["source_feed"] = source_feed
+            if owns_conn:
+                conn.execute("BEGIN IMMEDIATE")
+            else:
+                conn.execute("SAVEPOINT ioc_import")
+
+            records = enumerate(raw_iocs)
+            while True:
+                chunk = list(islice(records, INGEST_BATCH_SIZE))
+                if not chunk:
+                    break
+                total_records += len(chunk)
+
+                # Normalize and validate the chunk before touching the table
+                batch = []
+                for i, raw_ioc in chunk:
+                    row_ref = f"Row {raw_ioc.get('_row_number', i + 1)}"
+                    try:
+                        # Set source feed
+                        raw_ioc["source_feed"] = source_feed
 
-                    # Normalize IOC
-                    normalized_ioc = self.validator.normalize_ioc(raw_ioc)
+                        # Normalize IOC
+                        normalized_ioc = self.validator.normalize_ioc(raw_ioc)
 
-                    # Validate IOC
-                    is_valid, validation_errors = self.validator.validate_ioc(
-                        normalized_ioc
-                    )
+                        # Validate IOC
+                        is_valid, validation_errors = self.validator.validate_ioc(
+                            normalized_ioc
+                        )
 
-                    if not is_valid:
-                        error_count += 1
-                        row_ref = f"Row {raw_ioc.get('_row_number', i + 1)}"
-                        errors.append(f"{row_ref}: {'; '.join(validation_errors)}")
-                        continue
+                        if not is_valid:
+                            error_count += 1
+                            errors.append(f"{row_ref}: {'; '.join(validation_errors)}")
+                            continue
 
-                    # Check for duplicates
-                    if self.check_duplicate(
-                        conn, normalized_ioc["ioc_type"], normalized_ioc["ioc_value"]
-                    ):
-                        skipped_count += 1
-                        continue
+                        batch.append((row_ref, normalized_ioc))
 
-                    # Insert IOC
-                    if self.insert_ioc(conn, normalized_ioc):
-                        imported_count += 1
-                    else:
+                    except Exception as e:
                         error_count += 1
-                        row_ref = f"Row {raw_ioc.get('_row_number', i + 1)}"
-                        errors.append(f"{row_ref}: Failed to insert IOC")
+                        errors.append(f"{row_ref}: {str(e)}")
 
-                except Exception as e:
-                    error_count += 1
-                    row_ref = f"Row {raw_ioc.get('_row_number', i + 1)}"
-                    errors.append(f"{row_ref}: {str(e)}")
+                # Insert IOCs
+                imported, skipped, batch_errors = self._import_batch(conn, batch)
+                imported_count += imported
+                skipped_count += skipped
+                error_count += len(batch_errors)
+                errors.extend(batch_errors)
 
             # Determine import status
             if error_count == 0:
@@ -636,7 +796,7 @@ class FeedIngestionService:
                 "import_type": "manual" if feed_id is None else "automatic",
                 "file_name": filename,
                 "file_size": file_size,
-                "total_records": len(raw_iocs),
+                "total_records": total_records,
                 "imported_count": imported_count,
                 "skipped_count": skipped_count,
                 "error_count": error_count,
@@ -649,7 +809,10 @@ class FeedIngestionService:
 
             log_id = self.log_import(conn, log_data)
 
-            conn.execute("COMMIT")
+            if owns_conn:
+                conn.execute("COMMIT")
+            else:
+                conn.execute("RELEASE ioc_import")
 
             return {
                 "success": import_status in ["success", "partial"],
@@ -658,16 +821,23 @@ class FeedIngestionService:
                 "skipped_count": skipped_count,
                 "error_count": error_count,
                 "errors": errors[:50],  # Limit errors in response
-                "total_records": len(raw_iocs),
+                "total_records": total_records,
                 "duration_seconds": duration,
                 "log_id": log_id,
             }
 
         except Exception as e:
-            conn.execute("ROLLBACK")
+            if owns_conn:
+                conn.execute("ROLLBACK")
+            else:
+                conn.execute("ROLLBACK TO ioc_import")
+                conn.execute("RELEASE ioc_import")
             return {
                 "success": False,
-                "error": f"Database error: {e}",
+                "error": str(e)
+                if isinstance(e, FeedParseError)
+                else f"Database error: {e}",
+                "import_status": "failed",
                 "imported_count": 0,
                 "skipped_count": 0,
                 "error_count": 0,
@@ -675,4 +845,5 @@ class FeedIngestionService:
             }
 
         finally:
-            conn.close()
+            if owns_conn:
+                conn.close()
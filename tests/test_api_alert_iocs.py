@@ -35,6 +35,8 @@ class TestApiAlertIocsEndpoint(unittest.TestCase):
         # Mock the database connection to use our test database
         self.original_get_db_connection = api_server.get_db_connection
         api_server.get_db_connection = self.mock_get_db_connection
+        # Drop the thread's pooled connection so each test sees its own database
+        vars(api_server._thread_db).pop("conn", None)
 
     def tearDown(self):
         """Clean up test database."""
@@ -9,6 +9,7 @@ import sys
 import os
 import tempfile
 import sqlite3
+from unittest.mock import patch
 
 # Add the parent directory to sys.path to import api_server
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -35,6 +36,9 @@ class TestApiAlertsEndpoint(unittest.TestCase):
         # Mock the database connection to use our test database
         self.original_get_db_connection = api_server.get_db_connection
         api_server.get_db_connection = self.mock_get_db_connection
+        # Drop the thread's pooled connection so each test sees its own database
+        vars(api_server._thread_db).pop("conn", None)
+        api_server.invalidate_stats_cache()
 
     def tearDown(self):
         """Clean up test database."""
@@ -204,15 +208,193 @@ class TestApiAlertsEndpoint(unittest.TestCase):
         self.assertIn("avg_score", data)
         self.assertEqual(data["total_iocs"], 2)  # We have 2 test IOCs
 
+    def test_api_stats_cached(self):
+        """Repeat stats requests reuse the cached body until invalidated."""
+        first = self.app.get("/api/stats")
+
+        conn = sqlite3.connect(self.test_db_path)
+        conn.execute(
+            "INSERT INTO iocs (id, ioc_type, ioc_value, score) "
+            "VALUES (3, 'url', 'http://bad.example', 8.0)"
+        )
+        conn.commit()
+        conn.close()
+
+        cached = self.app.get("/api/stats")
+        api_server.invalidate_stats_cache()
+        refreshed = json.loads(self.app.get("/api/stats").data)
+
+        self.assertEqual(cached.data, first.data)
+        self.assertIn("Age", cached.headers)
+        self.assertEqual(refreshed["total_iocs"], 3)
+
+    def test_api_fallbacks_without_iocs_table(self):
+        """Stats and IOC lists fall back to prebuilt bodies when the table is gone."""
+        conn = sqlite3.connect(self.test_db_path)
+        conn.execute("DROP TABLE iocs")
+        conn.commit()
+        conn.close()
+        saved_iocs = list(api_server.IOCS)
+
+        try:
+            stats = json.loads(self.app.get("/api/stats").data)
+            first = self.app.get("/api/iocs")
+            second = self.app.get("/api/iocs")
+            in_memory = len(api_server.IOCS)
+            lookup = json.loads(self.app.get("/api/ioc?value=EXAMPLE.com").data)
+        finally:
+            api_server._set_iocs(saved_iocs)
+
+        iocs = json.loads(first.data)
+        self.assertEqual(stats["total_iocs"], 1968)
+        self.assertEqual(iocs["total"], len(iocs["iocs"]))
+        self.assertIn("threat_class", iocs["iocs"][0])
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(in_memory, iocs["total"])
+        self.assertEqual((lookup["id"], lookup["value"]), (1, "example.com"))
+
+    def test_api_explain_fallback_by_type(self):
+        """Without the ML modules, explanations come from the canned set per type."""
+        with patch.dict(sys.modules, {"sentinelforge.scoring": None}):
+            domain = json.loads(self.app.get("/api/explain/example.com").data)
+            ip = json.loads(self.app.get("/api/explain/1.1.1.1").data)
+
+        self.assertEqual(list(domain), ["value", "score", "explanation"])
+        self.assertEqual(domain["value"], "example.com")
+        self.assertEqual(domain["score"], api_server.get_ml_probability(9.0))
+        self.assertEqual(
+            domain["explanation"]["feature_breakdown"][0]["feature"], "Domain Age"
+        )
+        self.assertEqual(
+            ip["explanation"]["feature_breakdown"][0]["feature"], "ASN Reputation"
+        )
+
+    def test_api_explain_preflight(self):
+        """CORS preflight for explanations is answered without the handler."""
+        with patch.object(api_server, "get_ioc_by_value") as lookup:
+            response = self.app.options(
+                "/api/explain/example.com",
+                headers={
+                    "Origin": "http://localhost:3000",
+                    "Access-Control-Request-Method": "GET",
+                },
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Access-Control-Allow-Origin", response.headers)
+        self.assertIn("GET", response.headers["Access-Control-Allow-Methods"])
+        lookup.assert_not_called()
+
+    def test_api_iocs_search_index(self):
+        """Searches use the trigram index once it exists, matching substrings."""
+        from migrate_ioc_enhancements import create_search_index
+
+        conn = sqlite3.connect(self.test_db_path)
+        conn.execute("UPDATE iocs SET tags = '[\"resolver\"]' WHERE id = 2")
+        create_search_index(conn.cursor())
+        conn.commit()
+        conn.close()
+
+        by_value = json.loads(self.app.get("/api/iocs?search=AMPLE.c").data)
+        by_tag = json.loads(self.app.get("/api/iocs?search=solve").data)
+        short = json.loads(self.app.get("/api/iocs?search=1.").data)
+
+        self.assertTrue(api_server.has_ioc_search_index(api_server._thread_db.conn))
+        self.assertEqual(
+            [ioc["ioc_value"] for ioc in by_value["iocs"]], ["example.com"]
+        )
+        self.assertEqual([ioc["ioc_value"] for ioc in by_tag["iocs"]], ["1.1.1.1"])
+        self.assertEqual(by_tag["total"], 1)
+        self.assertEqual([ioc["ioc_value"] for ioc in short["iocs"]], ["1.1.1.1"])
+
+    def test_ioc_lookup_uses_value_index(self):
+        """Case-insensitive IOC lookups search the LOWER(ioc_value) index."""
+        from migrate_ioc_enhancements import create_indexes
+
+        conn = sqlite3.connect(self.test_db_path)
+        create_indexes(conn.cursor())
+        conn.commit()
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN " + api_server.SQL_IOC_BY_VALUE, ("example.com",)
+        ).fetchall()
+        conn.close()
+
+        ioc = json.loads(self.app.get("/api/ioc?value=EXAMPLE.com").data)
+
+        self.assertIn("idx_iocs_value_lower", " ".join(row[-1] for row in plan))
+        self.assertEqual(ioc["ioc_value"], "example.com")
+
+    def test_api_ioc_summary(self):
+        """The severity summary is read through the pooled request connection."""
+        first = json.loads(self.app.get("/api/ioc/summary").data)
+        pooled = api_server._thread_db.conn
+        second = json.loads(self.app.get("/api/ioc/summary").data)
+
+        self.assertEqual(first, {"critical": 1, "high": 0, "medium": 1, "low": 0})
+        self.assertEqual(second, first)
+        self.assertIs(api_server._thread_db.conn, pooled)
+
+    def test_api_ioc_summary_cached(self):
+        """The severity summary is cached alongside stats and dropped with it."""
+        self.app.get("/api/stats")
+        first = self.app.get("/api/ioc/summary")
+
+        conn = sqlite3.connect(self.test_db_path)
+        conn.execute(
+            "INSERT INTO iocs (id, ioc_type, ioc_value, score) "
+            "VALUES (3, 'url', 'http://bad.example', 8.0)"
+        )
+        conn.commit()
+        conn.close()
+
+        cached = self.app.get("/api/ioc/summary")
+        self.assertEqual(set(api_server._stats_cache), {"stats", "ioc_summary"})
+        api_server.invalidate_stats_cache()
+        refreshed = json.loads(self.app.get("/api/ioc/summary").data)
+
+        self.assertEqual(cached.data, first.data)
+        self.assertIn("Age", cached.headers)
+        self.assertEqual(refreshed["high"], 1)
+
+    def test_dict_factory_aliases_ioc_value(self):
+        """Rows come back as dicts, with "value" mirroring ioc_value."""
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = api_server.dict_factory
+        ioc = conn.execute("SELECT 'evil.example' AS ioc_value, 8 AS score").fetchone()
+        count = conn.execute("SELECT 3 AS count").fetchone()
+        conn.close()
+
+        self.assertEqual(
+            ioc, {"ioc_value": "evil.example", "score": 8, "value": "evil.example"}
+        )
+        self.assertEqual(count, {"count": 3})
+
     def test_api_iocs_endpoint(self):
         """Test that the IOCs endpoint works with database."""
         response = self.app.get("/api/iocs")
+        self.assertTrue(response.is_streamed)
         data = json.loads(response.data)
 
         self.assertEqual(response.status_code, 200)
         self.assertIn("iocs", data)
         self.assertIn("total", data)
         self.assertEqual(len(data["iocs"]), 2)  # We have 2 test IOCs
+        self.assertEqual(data["total"], 2)
+
+    def test_api_iocs_total_follows_filters(self):
+        """The IOC list total counts the filtered rows, even past the last page."""
+        by_type = json.loads(self.app.get("/api/iocs?ioc_type=ip").data)
+        past_end = json.loads(self.app.get("/api/iocs?offset=5").data)
+        by_search = json.loads(
+            self.app.get("/api/iocs?ioc_type=domain&search=example&offset=1").data
+        )
+
+        self.assertEqual([ioc["ioc_value"] for ioc in by_type["iocs"]], ["1.1.1.1"])
+        self.assertEqual(by_type["total"], 1)
+        self.assertNotIn("total_count", by_type["iocs"][0])
+        self.assertEqual(past_end["iocs"], [])
+        self.assertEqual(past_end["total"], 2)
+        self.assertEqual(by_search, {"iocs": [], "total": 1})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,793 @@
+#!/usr/bin/env python3
+"""
+Threat Feed API Tests
+
+Test suite for the threat feed management endpoints in SentinelForge.
+"""
+
+import io
+import json
+import sys
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch, MagicMock
+
+# Add the parent directory to sys.path to import api_server
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import api_server
+from api_server import app
+
+
+class TestFeedsAPI:
+    """Test class for threat feed API endpoints."""
+
+    def setup_method(self):
+        """Set up test environment before each test."""
+        self.client = app.test_client()
+        self.admin_headers = {"X-Demo-User-ID": "1"}  # Admin user
+        self.analyst_headers = {"X-Demo-User-ID": "2"}  # Analyst user
+        api_server.bump_feeds_version()
+        # Drop the thread's pooled connection so each test sees its own database
+        vars(api_server._thread_db).pop("conn", None)
+
+    def _mock_feeds_db(self, mock_db):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.description = [
+            (name, None, None, None, None, None, None)
+            for name in (
+                "id",
+                "name",
+                "feed_type",
+                "format_config",
+                "created_by_username",
+            )
+        ]
+        mock_cursor.fetchall.side_effect = lambda: [
+            (1, "Test Feed", "json", '{"ioc_field": "value"}', "admin")
+        ]
+        mock_cursor.rowcount = 1
+        return mock_conn
+
+    def test_get_feeds_cached_until_feed_changes(self):
+        """Repeated polls are served from cache until a feed is modified."""
+        with patch("api_server.get_db_connection") as mock_db:
+            self._mock_feeds_db(mock_db)
+
+            response = self.client.get("/api/feeds", headers=self.analyst_headers)
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            assert data["feeds"][0]["format_config"] == {"ioc_field": "value"}
+            assert response.headers["ETag"].startswith("W/")
+
+            response = self.client.get("/api/feeds", headers=self.analyst_headers)
+            assert response.status_code == 200
+            assert json.loads(response.data) == data
+            assert mock_db.call_count == 1
+
+            response = self.client.delete("/api/feeds/1", headers=self.admin_headers)
+            assert response.status_code == 200
+
+            response = self.client.get("/api/feeds", headers=self.analyst_headers)
+            assert response.status_code == 200
+            assert mock_db.call_count == 3
+
+    def test_get_feeds_not_modified(self):
+        """A matching If-None-Match returns 304 without touching the database."""
+        with patch("api_server.get_db_connection") as mock_db:
+            self._mock_feeds_db(mock_db)
+
+            response = self.client.get("/api/feeds", headers=self.analyst_headers)
+            etag = response.headers["ETag"]
+
+            response = self.client.get(
+                "/api/feeds", headers={**self.analyst_headers, "If-None-Match": etag}
+            )
+            assert response.status_code == 304
+            assert response.headers["ETag"] == etag
+            assert mock_db.call_count == 1
+
+            api_server.bump_feeds_version()
+            response = self.client.get(
+                "/api/feeds", headers={**self.analyst_headers, "If-None-Match": etag}
+            )
+            assert response.status_code == 200
+            assert response.headers["ETag"] != etag
+
+    def test_api_key_header_by_host(self):
+        """Feed API keys use the provider header for known hosts."""
+        assert api_server.API_KEY_STRATEGIES["otx.alienvault.com"]("k") == (
+            "X-OTX-API-KEY",
+            "k",
+        )
+        assert api_server.bearer_api_key_header("k") == ("Authorization", "Bearer k")
+
+        feed = {
+            "id": 1,
+            "name": "OTX",
+            "url": "https://otx.alienvault.com/api/v1/pulses/subscribed",
+            "feed_type": "json",
+            "is_active": 1,
+            "api_key": "secret",
+        }
+        with patch("api_server.get_db_connection") as mock_db:
+            with patch.object(api_server.FEED_SESSION, "get") as mock_get:
+                mock_db.return_value.cursor.return_value.fetchone.return_value = feed
+                mock_get.side_effect = api_server.requests.ConnectionError()
+
+                response = self.client.post(
+                    "/api/feeds/1/import", headers=self.analyst_headers, json={}
+                )
+
+                assert response.status_code == 503
+                headers = mock_get.call_args.kwargs["headers"]
+                assert headers["X-OTX-API-KEY"] == "secret"
+                assert "Authorization" not in headers
+
+    def _upload(self, filename, data):
+        return self.client.post(
+            "/api/feeds/upload",
+            headers=self.analyst_headers,
+            data={"file": (io.BytesIO(data), filename)},
+            content_type="multipart/form-data",
+        )
+
+    def test_upload_too_large(self):
+        """Uploads over the configured size cap are rejected with 413."""
+        with patch.object(api_server, "MAX_FEED_UPLOAD_BYTES", 16):
+            response = self._upload("feed.txt", b"1.2.3.4\n" * 10)
+
+        assert response.status_code == 413
+
+    def test_upload_large_file_memory_mapped(self):
+        """Large JSON uploads reach the ingestion service as a mapped buffer."""
+        received = {}
+
+        def import_from_content(content, **kwargs):
+            received["type"] = type(content)
+            received["data"] = json.loads(bytes(content))
+            return {
+                "success": True,
+                "imported_count": 1,
+                "skipped_count": 0,
+                "error_count": 0,
+                "total_records": 1,
+                "duration_seconds": 0,
+            }
+
+        payload = json.dumps([{"value": "evil.example.com"}]).encode()
+        with patch.object(api_server, "FEED_UPLOAD_MMAP_THRESHOLD", 0):
+            with patch("api_server.FeedIngestionService") as mock_service:
+                mock_service.return_value.import_from_content = import_from_content
+                response = self._upload("feed.json", payload)
+
+        assert response.status_code == 200
+        assert received["type"] is memoryview
+        assert received["data"] == [{"value": "evil.example.com"}]
+
+    def test_health_sessions_shared_across_requests(self):
+        """Health check sessions live on the shared monitor, not per request."""
+        monitor = api_server.FEED_HEALTH_MONITOR
+        monitor.create_progress_session("shared-session", total_feeds=1)
+
+        try:
+            response = self.client.post(
+                "/api/feeds/health/cancel/shared-session",
+                headers=self.analyst_headers,
+            )
+
+            assert response.status_code == 200
+            assert monitor.get_progress("shared-session")["status"] == "cancelled"
+        finally:
+            monitor.cleanup_progress_session("shared-session")
+
+    def test_health_progress_stream(self):
+        """The progress stream relays queued events and ends on completion."""
+        monitor = api_server.FEED_HEALTH_MONITOR
+        monitor.create_progress_session("stream-session", total_feeds=1)
+        monitor.update_progress("stream-session", status="completed", completed_feeds=1)
+
+        response = self.client.get(
+            "/api/feeds/health/progress/stream-session", headers=self.analyst_headers
+        )
+
+        assert response.headers["X-Accel-Buffering"] == "no"
+        assert "no-transform" in response.headers["Cache-Control"]
+        frames = [
+            json.loads(frame[len(b"data: ") :])
+            for frame in response.data.split(b"\n\n")
+            if frame
+        ]
+        assert [frame["type"] for frame in frames] == [
+            "connected",
+            "progress",
+            "progress",
+            "finished",
+        ]
+        assert frames[-1]["status"] == "completed"
+        assert monitor.get_progress_events("stream-session") is None
+
+    def test_update_feed_statement(self):
+        """PATCH builds one UPDATE in a fixed column order."""
+        with patch("api_server.get_db_connection") as mock_db:
+            mock_cursor = self._mock_feeds_db(mock_db).cursor.return_value
+            mock_cursor.fetchone.return_value = {"id": 1}
+
+            response = self.client.patch(
+                "/api/feeds/1",
+                headers=self.analyst_headers,
+                json={"format_config": {"delimiter": ","}, "name": "Renamed"},
+            )
+
+            assert response.status_code == 200
+            query, values = mock_cursor.execute.call_args.args
+            assert query == (
+                "UPDATE threat_feeds SET name = ?, format_config = ?, "
+                "updated_at = ? WHERE id = ?"
+            )
+            assert values[:2] == ["Renamed", '{"delimiter":","}']
+            assert values[-1] == 1
+
+    def _demo_session(self, session_id, **progress):
+        session = {
+            "condition": threading.Condition(),
+            "version": 1,
+            "data": {
+                "session_id": session_id,
+                "total_feeds": 1,
+                "completed_feeds": 0,
+                "current_feed": None,
+                "status": "running",
+                "results": [],
+                "errors": [],
+                **progress,
+            },
+        }
+        api_server.DEMO_HEALTH_SESSIONS[session_id] = session
+        return session
+
+    def _sse_frames(self, response):
+        return [
+            json.loads(frame[len(b"data: ") :])
+            for frame in response.data.split(b"\n\n")
+            if frame.startswith(b"data: ")
+        ]
+
+    def test_demo_progress_stream(self):
+        """Demo stream results arrive batched per wakeup, datetimes included."""
+        checked = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        self._demo_session(
+            "demo-session",
+            status="completed",
+            total_feeds=2,
+            completed_feeds=2,
+            results=[
+                {"feed_id": 1, "status": "ok", "last_checked": checked},
+                {"feed_id": 2, "status": "timeout", "last_checked": checked},
+            ],
+        )
+
+        try:
+            response = self.client.get(
+                "/api/feeds/health/demo/progress/demo-session",
+                headers=self.analyst_headers,
+            )
+            frames = self._sse_frames(response)
+        finally:
+            api_server.DEMO_HEALTH_SESSIONS.pop("demo-session", None)
+
+        assert response.mimetype == "text/event-stream"
+        assert [frame["type"] for frame in frames] == [
+            "connected",
+            "progress",
+            "feed_result_batch",
+            "finished",
+        ]
+        assert [result["feed_id"] for result in frames[2]["results"]] == [1, 2]
+        assert frames[2]["results"][0]["last_checked"] == checked.isoformat()
+
+    def test_demo_progress_stream_wakes_on_expiry(self):
+        """Removing a demo session ends waiting streams without a heartbeat wait."""
+        session = self._demo_session("expiring-session")
+
+        def expire():
+            time.sleep(0.1)
+            api_server.DEMO_HEALTH_SESSIONS.pop("expiring-session", None)
+            with session["condition"]:
+                session["version"] += 1
+                session["condition"].notify_all()
+
+        expirer = threading.Thread(target=expire)
+        start = time.time()
+        expirer.start()
+        response = self.client.get(
+            "/api/feeds/health/demo/progress/expiring-session",
+            headers=self.analyst_headers,
+        )
+        frames = self._sse_frames(response)
+        expirer.join()
+
+        assert time.time() - start < 5
+        assert [frame["type"] for frame in frames] == [
+            "connected",
+            "progress",
+            "error",
+        ]
+        assert frames[-1]["error"] == "Session expired"
+
+    def test_setup_demo_feeds_imports_samples(self):
+        """Demo feed setup inserts each feed's samples, skipping known IOCs."""
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "demo.db")
+            conn = sqlite3.connect(db_path)
+            conn.executescript("""
+                CREATE TABLE threat_feeds (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT, feed_type TEXT, description TEXT, url TEXT,
+                    format_config TEXT, is_active BOOLEAN, created_by INTEGER,
+                    created_at TEXT
+                );
+                CREATE TABLE feed_import_logs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    feed_id INTEGER, feed_name TEXT, import_type TEXT,
+                    import_status TEXT, imported_count INTEGER,
+                    total_records INTEGER, user_id INTEGER, timestamp TEXT
+                );
+                CREATE TABLE iocs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    ioc_type TEXT, ioc_value TEXT, source_feed TEXT,
+                    severity TEXT, confidence INTEGER, tags TEXT,
+                    first_seen TEXT, last_seen TEXT, is_active BOOLEAN,
+                    created_by INTEGER, score INTEGER, category TEXT,
+                    UNIQUE (ioc_type, ioc_value)
+                );
+                INSERT INTO iocs (ioc_type, ioc_value) VALUES ('domain', 'evil-site.net');
+            """)
+            conn.close()
+
+            with patch(
+                "api_server.get_db_connection",
+                side_effect=lambda: sqlite3.connect(db_path),
+            ):
+                response = self.client.post(
+                    "/api/admin/setup-demo-feeds",
+                    headers=self.admin_headers,
+                    json={"confirm": True, "import_data": True},
+                )
+
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            assert data["total_feeds"] == 5
+            assert data["iocs_imported"] == 20
+
+            conn = sqlite3.connect(db_path)
+            logged = dict(
+                conn.execute("SELECT feed_name, imported_count FROM feed_import_logs")
+            )
+            stix = conn.execute(
+                "SELECT ioc_type, ioc_value FROM iocs "
+                "WHERE source_feed = 'MITRE ATT&CK STIX Feed' ORDER BY ioc_type"
+            ).fetchall()
+            conn.close()
+
+            assert logged["MalwareDomainList - Domains"] == 4
+            assert logged["Abuse.ch URLhaus - Malware URLs"] == 4
+            assert stix == [
+                ("domain", "evil-command-control.com"),
+                ("hash", "d41d8cd98f00b204e9800998ecf8427e"),
+            ]
+
+    def _health_history_db(self, tmp, checked_hours_ago):
+        db_path = os.path.join(tmp, "health.db")
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE TABLE users (user_id INTEGER PRIMARY KEY, username TEXT);
+            CREATE TABLE feed_health_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                feed_id INTEGER, feed_name TEXT, url TEXT, status TEXT,
+                http_code INTEGER, response_time_ms INTEGER, error_message TEXT,
+                last_checked DATETIME, checked_by INTEGER DEFAULT 0
+            );
+        """)
+        conn.executemany(
+            "INSERT INTO feed_health_logs "
+            "(feed_id, feed_name, url, status, last_checked) "
+            "VALUES (1, 'Feed', 'https://feed.example.com', 'ok', "
+            "datetime('now', ?))",
+            [(f"-{hours} hours",) for hours in checked_hours_ago],
+        )
+        conn.commit()
+        conn.close()
+
+        def connect():
+            conn = sqlite3.connect(db_path)
+            conn.row_factory = lambda cursor, row: {
+                col[0]: value for col, value in zip(cursor.description, row)
+            }
+            return conn
+
+        return connect
+
+    def test_health_history_hours_window(self):
+        """The history window is bound as a parameter for any hours value."""
+        with tempfile.TemporaryDirectory() as tmp:
+            connect = self._health_history_db(tmp, [1, 30, 60])
+            with patch("api_server.get_db_connection", side_effect=connect):
+                counts = {}
+                for hours in (24, 48, 72):
+                    response = self.client.get(
+                        f"/api/feeds/health/history?hours={hours}",
+                        headers=self.analyst_headers,
+                    )
+                    assert response.status_code == 200
+                    counts[hours] = len(json.loads(response.data)["health_logs"])
+
+        assert counts == {24: 1, 48: 2, 72: 3}
+
+    def test_health_history_keyset_pagination(self):
+        """Following next_cursor walks every log once, newest first."""
+        with tempfile.TemporaryDirectory() as tmp:
+            connect = self._health_history_db(tmp, [1, 2, 2, 3, 4])
+            with patch("api_server.get_db_connection", side_effect=connect):
+                url = "/api/feeds/health/history?limit=2"
+                pages = []
+                while url:
+                    response = self.client.get(url, headers=self.analyst_headers)
+                    data = json.loads(response.data)
+                    pages.append([log["id"] for log in data["health_logs"]])
+                    cursor = data["pagination"]["next_cursor"]
+                    url = cursor and (
+                        "/api/feeds/health/history?limit=2"
+                        f"&before_ts={cursor['next_ts']}"
+                        f"&before_id={cursor['next_id']}"
+                    )
+
+        assert pages == [[1, 3], [2, 4], [5]]
+
+    def test_health_history_total_on_request(self):
+        """Totals are only counted with include_total and then briefly cached."""
+        api_server._health_count_cache.clear()
+        with tempfile.TemporaryDirectory() as tmp:
+            connect = self._health_history_db(tmp, [1, 2, 3])
+            with patch("api_server.get_db_connection", side_effect=connect):
+                response = self.client.get(
+                    "/api/feeds/health/history?limit=2",
+                    headers=self.analyst_headers,
+                )
+                pagination = json.loads(response.data)["pagination"]
+                assert "total" not in pagination
+                assert pagination["has_more"] is True
+
+                url = "/api/feeds/health/history?limit=5&include_total=1"
+                response = self.client.get(url, headers=self.analyst_headers)
+                pagination = json.loads(response.data)["pagination"]
+                assert pagination["total"] == 3
+                assert pagination["has_more"] is False
+
+                conn = connect()
+                conn.execute(
+                    "INSERT INTO feed_health_logs (feed_id, status, last_checked) "
+                    "VALUES (1, 'ok', datetime('now'))"
+                )
+                conn.commit()
+                conn.close()
+
+                response = self.client.get(url, headers=self.analyst_headers)
+                data = json.loads(response.data)
+                assert len(data["health_logs"]) == 4
+                assert data["pagination"]["total"] == 3
+        api_server._health_count_cache.clear()
+
+    def test_single_feed_health_uses_shared_session(self):
+        """Single feed checks go through the pooled health session."""
+        feed = {
+            "id": 1,
+            "name": "IPsum",
+            "url": "https://feed.example.com/ipsum.txt",
+            "feed_type": "txt",
+            "format_config": None,
+            "is_active": 1,
+        }
+        with patch("api_server.get_db_connection") as mock_db:
+            with patch.object(api_server.HEALTH_SESSION, "head") as mock_head:
+                mock_cursor = mock_db.return_value.cursor.return_value
+                mock_cursor.fetchone.return_value = feed
+                mock_cursor.fetchall.return_value = []
+                mock_head.return_value.status_code = 200
+
+                response = self.client.get(
+                    "/api/feeds/1/health", headers=self.analyst_headers
+                )
+
+        assert response.status_code == 200
+        assert json.loads(response.data)["current_health"]["status"] == "ok"
+        assert mock_head.call_args.args == (feed["url"],)
+
+        retry = api_server.HEALTH_SESSION.get_adapter(feed["url"]).max_retries
+        assert set(retry.allowed_methods) == {"HEAD", "GET"}
+
+    def test_single_feed_health_falls_back_to_ranged_get(self):
+        """Feeds that reject HEAD are probed with a one-byte ranged GET."""
+        feed = {
+            "id": 2,
+            "name": "PhishTank",
+            "url": "https://feed.example.com/online-valid.json",
+            "feed_type": "json",
+            "format_config": None,
+            "is_active": 1,
+        }
+        with patch("api_server.get_db_connection") as mock_db:
+            with patch.object(api_server.HEALTH_SESSION, "head") as mock_head:
+                with patch.object(api_server.HEALTH_SESSION, "get") as mock_get:
+                    mock_cursor = mock_db.return_value.cursor.return_value
+                    mock_cursor.fetchone.return_value = feed
+                    mock_cursor.fetchall.return_value = []
+                    mock_head.return_value.status_code = 405
+                    ranged = mock_get.return_value
+                    ranged.__enter__.return_value = ranged
+                    ranged.status_code = 206
+
+                    response = self.client.get(
+                        "/api/feeds/2/health", headers=self.analyst_headers
+                    )
+
+        assert json.loads(response.data)["current_health"]["status"] == "ok"
+        assert mock_get.call_args.kwargs["headers"]["Range"] == "bytes=0-0"
+        ranged.__exit__.assert_called_once()
+
+    def test_single_feed_health_reuses_recent_check(self):
+        """Repeat checks of a feed are served from cache until a feed edit."""
+        feed = {
+            "id": 3,
+            "name": "URLhaus",
+            "url": "https://feed.example.com/urlhaus.txt",
+            "feed_type": "txt",
+            "format_config": None,
+            "is_active": 1,
+        }
+        with patch("api_server.get_db_connection") as mock_db:
+            with patch.object(api_server.HEALTH_SESSION, "head") as mock_head:
+                mock_cursor = mock_db.return_value.cursor.return_value
+                mock_cursor.fetchone.return_value = feed
+                mock_cursor.fetchall.return_value = []
+                mock_head.return_value.status_code = 200
+
+                first = self.client.get(
+                    "/api/feeds/3/health", headers=self.analyst_headers
+                )
+                cached = self.client.get(
+                    "/api/feeds/3/health", headers=self.analyst_headers
+                )
+                api_server.bump_feeds_version()
+                rechecked = self.client.get(
+                    "/api/feeds/3/health", headers=self.analyst_headers
+                )
+
+        assert cached.data == first.data
+        assert "Age" in cached.headers
+        assert "Age" not in rechecked.headers
+        assert mock_head.call_count == 2
+
+    def test_parse_format_config(self):
+        """Stored format configs are parsed once per distinct JSON text."""
+        raw = '{"requires_auth": true, "auth_config": {"api_key": "k"}}'
+
+        parsed = api_server._parse_format_config(raw)
+        assert parsed["auth_config"] == {"api_key": "k"}
+        assert api_server._parse_format_config(raw) is parsed
+        assert api_server._parse_format_config("{not json") == {}
+        assert api_server._parse_format_config(None) == {}
+
+    def test_single_feed_health_recent_checks(self):
+        """The feed and its ten newest checks are read before the new check."""
+        with tempfile.TemporaryDirectory() as tmp:
+            connect = self._health_history_db(tmp, range(1, 13))
+            conn = connect()
+            conn.executescript("""
+                CREATE TABLE threat_feeds (
+                    id INTEGER PRIMARY KEY, name TEXT, url TEXT, feed_type TEXT,
+                    format_config TEXT, is_active BOOLEAN
+                );
+                INSERT INTO threat_feeds
+                VALUES (1, 'Feed', 'https://feed.example.com', 'txt', NULL, 1);
+            """)
+            conn.close()
+
+            with patch("api_server.get_db_connection", side_effect=connect):
+                with patch.object(api_server.HEALTH_SESSION, "head") as mock_head:
+                    mock_head.return_value.status_code = 200
+                    response = self.client.get(
+                        "/api/feeds/1/health", headers=self.analyst_headers
+                    )
+                    missing = self.client.get(
+                        "/api/feeds/2/health", headers=self.analyst_headers
+                    )
+
+            conn = connect()
+            logged = conn.execute("SELECT COUNT(*) AS n FROM feed_health_logs")
+            logged = logged.fetchone()["n"]
+            conn.close()
+
+        data = json.loads(response.data)
+        assert [check["id"] for check in data["recent_checks"]] == list(range(1, 11))
+        assert data["feed_details"]["name"] == "Feed"
+        assert missing.status_code == 404
+        assert logged == 13
+
+    def test_jsonify_builds_body_from_bytes(self):
+        """jsonify output is compact, unsorted and keeps HTTP-date datetimes."""
+        checked = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+        with app.app_context():
+            response = api_server.jsonify({"b": 1, "a": checked})
+
+        assert response.mimetype == "application/json"
+        assert response.data == b'{"b":1,"a":"Tue, 02 Jan 2024 03:04:05 GMT"}\n'
+
+    def test_health_requests_reuse_thread_connection(self):
+        """Health endpoints share the thread's connection, tuned once on open."""
+        with tempfile.TemporaryDirectory() as tmp:
+            connect = self._health_history_db(tmp, [1])
+            with patch("api_server.get_db_connection", side_effect=connect) as mock_db:
+                for _ in range(3):
+                    response = self.client.get(
+                        "/api/feeds/health/history", headers=self.analyst_headers
+                    )
+                    assert response.status_code == 200
+
+            conn = api_server._thread_db.conn
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()
+            vars(api_server._thread_db).pop("conn").close()
+
+        assert mock_db.call_count == 1
+        assert journal_mode == {"journal_mode": "wal"}
+
+    def _import_logs_db(self, tmp, logs):
+        db_path = os.path.join(tmp, "imports.db")
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE TABLE users (user_id INTEGER PRIMARY KEY, username TEXT);
+            CREATE TABLE threat_feeds (id INTEGER PRIMARY KEY, name TEXT);
+            CREATE TABLE feed_import_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                feed_id INTEGER, feed_name TEXT, import_type TEXT,
+                import_status TEXT, imported_count INTEGER, errors TEXT,
+                user_id INTEGER, timestamp TEXT
+            );
+            INSERT INTO users VALUES (1, 'admin');
+            INSERT INTO threat_feeds VALUES (1, 'Feed');
+        """)
+        conn.executemany(
+            "INSERT INTO feed_import_logs "
+            "(feed_id, import_status, errors, user_id, timestamp) "
+            "VALUES (1, ?, ?, 1, ?)",
+            logs,
+        )
+        conn.commit()
+        conn.close()
+
+        def connect():
+            conn = sqlite3.connect(db_path)
+            conn.row_factory = lambda cursor, row: {
+                col[0]: value for col, value in zip(cursor.description, row)
+            }
+            return conn
+
+        return connect
+
+    def test_import_logs_parse_errors(self):
+        """Import logs stream with errors decoded; bad blobs become empty lists."""
+        with tempfile.TemporaryDirectory() as tmp:
+            connect = self._import_logs_db(
+                tmp,
+                [
+                    ("partial", '["Row 2: bad"]', "2024-01-01T00:00:00"),
+                    ("failed", "{broken", "2024-01-02T00:00:00"),
+                ],
+            )
+            with patch("api_server.get_db_connection", side_effect=connect):
+                response = self.client.get(
+                    "/api/feeds/import-logs", headers=self.analyst_headers
+                )
+                empty = self.client.get(
+                    "/api/feeds/import-logs?import_status=running",
+                    headers=self.analyst_headers,
+                )
+
+        assert response.is_streamed
+        assert json.loads(empty.data) == {
+            "logs": [],
+            "total": 0,
+            "has_more": False,
+            "next_cursor": None,
+        }
+        data = json.loads(response.data)
+        assert [log["errors"] for log in data["logs"]] == [[], ["Row 2: bad"]]
+        assert b'"errors":["Row 2: bad"]}' in response.data
+        assert data["logs"][0]["feed_name"] == "Feed"
+        assert data["logs"][0]["user_name"] == "admin"
+        assert data["total"] == 2
+
+    def test_import_logs_keyset_pagination(self):
+        """Following next_cursor walks every import log once, newest first."""
+        with tempfile.TemporaryDirectory() as tmp:
+            connect = self._import_logs_db(
+                tmp,
+                [
+                    ("success", None, "2024-01-01T00:00:00"),
+                    ("success", None, "2024-01-03T00:00:00"),
+                    ("success", None, "2024-01-03T00:00:00"),
+                    ("success", None, "2024-01-02T00:00:00"),
+                    ("success", None, "2024-01-04T00:00:00"),
+                ],
+            )
+            with patch("api_server.get_db_connection", side_effect=connect) as mock_db:
+                url = "/api/feeds/import-logs?limit=2"
+                pages = []
+                while url:
+                    response = self.client.get(url, headers=self.analyst_headers)
+                    data = json.loads(response.data)
+                    pages.append([log["id"] for log in data["logs"]])
+                    cursor = data["next_cursor"]
+                    url = cursor and f"/api/feeds/import-logs?limit=2&cursor={cursor}"
+
+                invalid = self.client.get(
+                    "/api/feeds/import-logs?cursor=not-a-cursor",
+                    headers=self.analyst_headers,
+                )
+                bad_limit = self.client.get(
+                    "/api/feeds/import-logs?limit=ten",
+                    headers=self.analyst_headers,
+                )
+
+        assert pages == [[5, 3], [2, 4], [1]]
+        assert invalid.status_code == 400
+        assert bad_limit.status_code == 400
+        assert mock_db.call_count == 1
+
+    def test_import_logs_total_from_window_count(self):
+        """Offset pages report the filtered total; cursor pages omit it."""
+        with tempfile.TemporaryDirectory() as tmp:
+            connect = self._import_logs_db(
+                tmp,
+                [("success", None, f"2024-01-0{day}T00:00:00") for day in range(1, 5)]
+                + [("failed", None, "2024-01-05T00:00:00")],
+            )
+            with patch("api_server.get_db_connection", side_effect=connect):
+                first = self.client.get(
+                    "/api/feeds/import-logs?limit=3&import_status=success",
+                    headers=self.analyst_headers,
+                )
+                first = json.loads(first.data)
+                last = self.client.get(
+                    "/api/feeds/import-logs?limit=3&import_status=success"
+                    f"&cursor={first['next_cursor']}",
+                    headers=self.analyst_headers,
+                )
+                last = json.loads(last.data)
+
+        assert first["total"] == 4
+        assert first["has_more"] is True
+        assert "total_count" not in first["logs"][0]
+        assert last["total"] is None
+        assert last["has_more"] is False
+        assert last["next_cursor"] is None
+        assert [log["id"] for log in last["logs"]] == [1]
+
+    def test_import_logs_statement_per_shape(self):
+        """Each filter/paging combination maps to one cached statement."""
+        sql = api_server._import_logs_sql(True, False, True)
+
+        assert api_server._import_logs_sql(True, False, True) is sql
+        assert "l.feed_id = ?" in sql
+        assert "l.import_status" not in sql
+        assert "COUNT(*) OVER ()" not in sql
+        assert "JOIN" not in sql
+        assert "OFFSET" in api_server._import_logs_sql(False, True, False)
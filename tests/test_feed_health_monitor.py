@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Test suite for the SentinelForge FeedHealthMonitor service.
+
+Usage:
+    python -m pytest tests/test_feed_health_monitor.py -v
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services import feed_health_monitor
+from services.feed_health_monitor import FeedHealthMonitor
+
+
+class TestFeedHealthMonitor(unittest.TestCase):
+    """Test cases for FeedHealthMonitor health check runs."""
+
+    def setUp(self):
+        """Set up a temporary database with active feeds."""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_db.close()
+        self.db_path = self.temp_db.name
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE threat_feeds (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                url TEXT,
+                feed_type TEXT,
+                format_config TEXT,
+                is_active BOOLEAN DEFAULT 1,
+                api_key TEXT
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO threat_feeds (id, name, url, feed_type) VALUES (?, ?, ?, ?)",
+            [
+                (i, f"Feed {i}", f"https://feed{i}.example.com/data.txt", "txt")
+                for i in range(1, 6)
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        self.monitor = FeedHealthMonitor(db_path=self.db_path, log_level="ERROR")
+
+    def tearDown(self):
+        """Remove the temporary database."""
+        try:
+            os.unlink(self.db_path)
+        except OSError:
+            pass
+
+    def _fake_check(self, delay=0.2):
+        """Build a check_feed_health replacement that sleeps like a network call."""
+
+        def check(feed):
+            time.sleep(delay)
+            return {
+                "feed_id": feed["id"],
+                "feed_name": feed["name"],
+                "url": feed["url"],
+                "status": "ok",
+                "http_code": 200,
+                "response_time_ms": int(delay * 1000),
+                "error_message": None,
+                "last_checked": datetime.now(timezone.utc),
+                "is_active": True,
+            }
+
+        return check
+
+    def test_feeds_checked_concurrently(self):
+        """Wall time is close to one check, not the sum of all checks."""
+        self.monitor.check_feed_health = self._fake_check(delay=0.3)
+
+        start = time.time()
+        result = self.monitor.run_health_check()
+        elapsed = time.time() - start
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["summary"]["total_feeds"], 5)
+        self.assertLess(elapsed, 1.0)
+
+    def test_results_keep_feed_order(self):
+        """Results are reported in feed order regardless of completion order."""
+        check = self._fake_check(delay=0)
+
+        def staggered(feed):
+            time.sleep(0.05 * (6 - feed["id"]))
+            return check(feed)
+
+        self.monitor.check_feed_health = staggered
+
+        result = self.monitor.run_health_check()
+
+        self.assertEqual([r["feed_id"] for r in result["feeds"]], [1, 2, 3, 4, 5])
+
+    def test_progress_session_tracks_completion(self):
+        """Progress sessions see every completed feed and finish as completed."""
+        self.monitor.check_feed_health = self._fake_check(delay=0.05)
+        self.monitor.create_progress_session("session-1", total_feeds=5)
+
+        self.monitor.run_health_check(progress_session_id="session-1")
+
+        progress = self.monitor.get_progress("session-1")
+        self.assertEqual(progress["status"], "completed")
+        self.assertEqual(progress["completed_feeds"], 5)
+        self.assertEqual(len(progress["results"]), 5)
+
+        conn = sqlite3.connect(self.db_path)
+        logged = conn.execute("SELECT COUNT(*) FROM feed_health_logs").fetchone()[0]
+        conn.close()
+        self.assertEqual(logged, 5)
+
+    def test_progress_events_published(self):
+        """Progress sessions publish every update to their event queue."""
+        self.monitor.check_feed_health = self._fake_check(delay=0)
+        self.monitor.create_progress_session("session-3", total_feeds=5)
+        events = self.monitor.get_progress_events("session-3")
+
+        self.monitor.run_health_check(progress_session_id="session-3")
+
+        published = []
+        while not events.empty():
+            published.append(events.get_nowait())
+
+        feed_results = [e for e in published if e["type"] == "feed_result"]
+        self.assertEqual(len(feed_results), 5)
+        self.assertEqual(published[0]["status"], "starting")
+        self.assertEqual(published[-1]["type"], "progress")
+        self.assertEqual(published[-1]["status"], "completed")
+        self.assertEqual(published[-1]["completed_feeds"], 5)
+
+        self.monitor.cleanup_progress_session("session-3")
+        self.assertIsNone(self.monitor.get_progress_events("session-3"))
+
+    def test_cached_health_response(self):
+        """The cached API body is built once per health run."""
+        self.assertIsNone(self.monitor.get_cached_health_response())
+
+        self.monitor.check_feed_health = self._fake_check(delay=0)
+        self.monitor.run_health_check()
+
+        body, age = self.monitor.get_cached_health_response()
+        self.assertLess(age, 5)
+        self.assertIs(self.monitor.get_cached_health_response()[0], body)
+
+        data = json.loads(body)
+        self.assertTrue(data["from_cache"])
+        self.assertEqual(data["summary"]["healthy_feeds"], 5)
+        self.assertEqual(len(data["feeds"]), 5)
+
+        self.monitor.run_health_check()
+        self.assertIsNot(self.monitor.get_cached_health_response()[0], body)
+        self.assertIsNone(self.monitor.get_cached_health_response(max_age_seconds=0))
+
+    def test_scheduler_restart_reuses_scheduler(self):
+        """Starting the shared monitor's scheduler twice keeps one scheduler."""
+        with patch.object(feed_health_monitor, "SCHEDULER_AVAILABLE", True):
+            with patch.object(
+                feed_health_monitor, "BackgroundScheduler", create=True
+            ) as scheduler_cls:
+                self.assertTrue(self.monitor.start_cron_scheduler(5))
+                self.assertTrue(self.monitor.start_cron_scheduler(10))
+
+        scheduler_cls.assert_called_once_with()
+        scheduler = scheduler_cls.return_value
+        scheduler.start.assert_called_once_with()
+        self.assertEqual(scheduler.add_job.call_count, 2)
+        self.assertEqual(scheduler.add_job.call_args.kwargs["minutes"], 10)
+
+        self.monitor.stop_cron_scheduler()
+        scheduler.shutdown.assert_called_once_with()
+
+    def test_cancelled_session_stops_run(self):
+        """Cancelling a session returns partial results."""
+        started = threading.Event()
+        check = self._fake_check(delay=0.1)
+
+        def slow_check(feed):
+            started.set()
+            return check(feed)
+
+        self.monitor.max_workers = 1
+        self.monitor.check_feed_health = slow_check
+        self.monitor.create_progress_session("session-2", total_feeds=5)
+
+        def cancel_when_started():
+            started.wait(1)
+            self.monitor.cancel_progress_session("session-2")
+
+        canceller = threading.Thread(target=cancel_when_started)
+        canceller.start()
+        result = self.monitor.run_health_check(progress_session_id="session-2")
+        canceller.join()
+
+        self.assertEqual(result["error"], "Health check cancelled")
+        self.assertLess(len(result["partial_results"]), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
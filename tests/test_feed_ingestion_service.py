@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Test suite for the SentinelForge threat feed ingestion service.
+
+Usage:
+    python -m pytest tests/test_feed_ingestion_service.py -v
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services import ingestion
+from services.ingestion import FeedIngestionService, FeedParser, IOCValidator
+
+
+class TestFeedIngestionService(unittest.TestCase):
+    """Test cases for FeedIngestionService imports."""
+
+    def setUp(self):
+        """Set up a temporary IOC database."""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_db.close()
+        self.db_path = self.temp_db.name
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE iocs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ioc_type TEXT,
+                ioc_value TEXT,
+                source_feed TEXT,
+                first_seen TEXT,
+                last_seen TEXT,
+                score INTEGER,
+                category TEXT,
+                enrichment_data TEXT,
+                severity TEXT,
+                tags TEXT,
+                confidence INTEGER,
+                created_at TEXT,
+                updated_at TEXT,
+                is_active BOOLEAN,
+                UNIQUE (ioc_type, ioc_value)
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE feed_import_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                feed_id INTEGER,
+                feed_name TEXT,
+                import_type TEXT,
+                file_name TEXT,
+                file_size INTEGER,
+                total_records INTEGER,
+                imported_count INTEGER,
+                skipped_count INTEGER,
+                error_count INTEGER,
+                errors TEXT,
+                import_status TEXT,
+                duration_seconds INTEGER,
+                user_id INTEGER,
+                justification TEXT,
+                timestamp TEXT
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+        self.service = FeedIngestionService(db_path=self.db_path)
+
+    def tearDown(self):
+        """Remove the temporary database."""
+        try:
+            os.unlink(self.db_path)
+        except OSError:
+            pass
+
+    def _ioc_values(self):
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute("SELECT ioc_value FROM iocs ORDER BY id").fetchall()
+        conn.close()
+        return [row[0] for row in rows]
+
+    def test_import_json_bytes(self):
+        """JSON feeds can be imported from raw bytes."""
+        content = json.dumps(
+            {"indicators": [{"value": "evil.example.com"}, {"value": "1.2.3.4"}]}
+        ).encode("utf-8")
+
+        result = self.service.import_from_content(
+            content=content, filename="feed.json", source_feed="Test", user_id=1
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["imported_count"], 2)
+        self.assertEqual(self._ioc_values(), ["evil.example.com", "1.2.3.4"])
+
+        conn = sqlite3.connect(self.db_path)
+        file_size = conn.execute("SELECT file_size FROM feed_import_logs").fetchone()
+        conn.close()
+        self.assertEqual(file_size[0], len(content))
+
+    def test_import_txt_bytes_matches_str(self):
+        """Text feeds give the same result whether passed as bytes or str."""
+        content = "# comment\nevil.example.com\n5.6.7.8\n"
+
+        from_str = self.service.import_from_content(
+            content=content, filename="feed.txt", source_feed="Test", user_id=1
+        )
+        from_bytes = self.service.import_from_content(
+            content=content.encode("utf-8"),
+            filename="feed.txt",
+            source_feed="Test",
+            user_id=1,
+        )
+
+        self.assertEqual(from_str["imported_count"], 2)
+        self.assertEqual(from_bytes["imported_count"], 0)
+        self.assertEqual(from_bytes["skipped_count"], 2)
+
+    def test_import_duplicates_skipped(self):
+        """IOCs already in the database are skipped."""
+        content = "evil.example.com\nevil.example.com\n"
+
+        result = self.service.import_from_content(
+            content=content, filename="feed.txt", source_feed="Test", user_id=1
+        )
+
+        self.assertEqual(result["imported_count"], 1)
+        self.assertEqual(result["skipped_count"], 1)
+
+    def test_import_in_batches(self):
+        """Records are imported batch by batch with duplicates skipped across batches."""
+        content = (
+            "a.example.com\nb.example.com\na.example.com\nc.example.com\nnot valid\n"
+        )
+
+        with patch.object(ingestion, "INGEST_BATCH_SIZE", 2):
+            result = self.service.import_from_content(
+                content=content, filename="feed.txt", source_feed="Test", user_id=1
+            )
+
+        self.assertEqual(result["total_records"], 5)
+        self.assertEqual(result["imported_count"], 3)
+        self.assertEqual(result["skipped_count"], 1)
+        self.assertEqual(result["error_count"], 1)
+        self.assertEqual(
+            self._ioc_values(), ["a.example.com", "b.example.com", "c.example.com"]
+        )
+
+    def test_failed_insert_does_not_sink_batch(self):
+        """A row rejected by the database is reported; the rest are imported."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TRIGGER reject_ioc BEFORE INSERT ON iocs
+            WHEN NEW.ioc_value = 'reject.example.com'
+            BEGIN SELECT RAISE(ABORT, 'rejected'); END
+        """)
+        conn.commit()
+        conn.close()
+
+        content = "good.example.com\nreject.example.com\n9.9.9.9\n"
+        result = self.service.import_from_content(
+            content=content, filename="feed.txt", source_feed="Test", user_id=1
+        )
+
+        self.assertEqual(result["import_status"], "partial")
+        self.assertEqual(result["imported_count"], 2)
+        self.assertEqual(result["errors"], ["Row 2: Failed to insert IOC"])
+        self.assertEqual(self._ioc_values(), ["good.example.com", "9.9.9.9"])
+
+    def test_import_in_caller_transaction(self):
+        """With a caller connection the import is left uncommitted."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("BEGIN IMMEDIATE")
+
+        result = self.service.import_from_content(
+            content="evil.example.com\n",
+            filename="feed.txt",
+            source_feed="Test",
+            user_id=1,
+            conn=conn,
+        )
+
+        self.assertEqual(result["imported_count"], 1)
+        self.assertTrue(conn.in_transaction)
+        conn.rollback()
+        conn.close()
+        self.assertEqual(self._ioc_values(), [])
+
+    def test_invalid_json_reports_parse_error(self):
+        """Malformed JSON content fails with a parse error."""
+        result = self.service.import_from_content(
+            content=b"{not json", filename="feed.json", source_feed="Test", user_id=1
+        )
+
+        self.assertFalse(result["success"])
+        self.assertIn("Failed to parse json content", result["error"])
+
+    def test_detect_file_format_from_bytes(self):
+        """Content sniffing works on byte buffers."""
+        self.assertEqual(
+            self.service.detect_file_format("feed", b'  [{"a": 1}]'), "json"
+        )
+        self.assertEqual(
+            self.service.detect_file_format("feed", b"value,type\nx,y\n"), "csv"
+        )
+        self.assertEqual(self.service.detect_file_format("feed", b"1.2.3.4"), "txt")
+
+
+class TestIOCValidator(unittest.TestCase):
+    """Test cases for IOCValidator."""
+
+    def test_infer_ioc_type(self):
+        """Values are classified by the precompiled type patterns."""
+        cases = {
+            "HTTPS://evil.example.com/a": "url",
+            "10.0.0.1": "ip",
+            "a" * 32: "hash",
+            "B" * 40: "hash",
+            "0" * 64: "hash",
+            "f" * 128: "hash",
+            "f" * 33: "unknown",
+            "analyst@example.com": "email",
+            " evil.example.com ": "domain",
+            "not valid": "unknown",
+        }
+        for value, expected in cases.items():
+            self.assertEqual(IOCValidator.infer_ioc_type(value), expected, value)
+
+
+class TestFeedParser(unittest.TestCase):
+    """Test cases for FeedParser."""
+
+    def test_parse_stix_bytes(self):
+        """STIX bundles are parsed from bytes."""
+        bundle = {
+            "type": "bundle",
+            "objects": [
+                {
+                    "type": "indicator",
+                    "pattern": "[domain-name:value = 'bad.example.org']",
+                    "confidence": 80,
+                }
+            ],
+        }
+
+        iocs = FeedParser.parse_stix(json.dumps(bundle).encode("utf-8"))
+
+        self.assertEqual(len(iocs), 1)
+        self.assertEqual(iocs[0]["ioc_value"], "bad.example.org")
+        self.assertEqual(iocs[0]["ioc_type"], "domain")
+        self.assertEqual(iocs[0]["confidence"], 80)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -103,6 +103,24 @@ def test_mixed_iocs():
         ]
 
 
+def test_infer_ioc_type():
+    """Each IOC type in an alert description is recognised by its shape."""
+    expected = {
+        "https://malicious-site.com/script.php?param=value": "url",
+        "5f4dcc3b5aa765d61d8327deb882cf99": "hash",
+        "e5e9fa1ba31ecd1ae84f75caaa474f3a663f05f4": "hash",
+        "192.168.1.1": "ip",
+        "evil-domain.com": "domain",
+        "analyst@example.org": "email",
+        "not@an-email": "unknown",
+        "localhost": "unknown",
+        None: "unknown",
+    }
+
+    for value, ioc_type in expected.items():
+        assert api_server.infer_ioc_type(value) == ioc_type, value
+
+
 def run_manual_test():
     """Manual test runner for standalone execution."""
     test_mixed_iocs()
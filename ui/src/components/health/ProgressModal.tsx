@@ -178,6 +178,10 @@ export const ProgressModal: React.FC<ProgressModalProps> = ({
             setResults((prev) => [...prev, data.result]);
             break;
 
+          case "feed_result_batch":
+            setResults((prev) => [...prev, ...data.results]);
+            break;
+
           case "error":
             setErrors((prev) => [...prev, data.error]);
             break;
@@ -563,8 +563,14 @@ export async function getImportLogs(
     import_status?: string;
     limit?: number;
     offset?: number;
+    cursor?: string;
   } = {},
-): Promise<{ logs: FeedImportLog[]; total: number }> {
+): Promise<{
+  logs: FeedImportLog[];
+  total: number | null;
+  has_more: boolean;
+  next_cursor: string | null;
+}> {
   try {
     const params = new URLSearchParams();
     Object.entries(filters).forEach(([key, value]) => {